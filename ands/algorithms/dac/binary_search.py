@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 23/08/2015
 
-Updated: 18/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -53,6 +53,7 @@ index, if the target element is not found, we can return for example -1.
 """
 
 from ands.algorithms.recursion.is_sorted import pythonic_is_sorted
+from ands.validation import validate
 
 __all__ = ["linear_search",
            "binary_search_iteratively",
@@ -67,7 +68,7 @@ def linear_search(ls: list, item: object) -> bool:
     otherwise it returns -1.
 
     Time complexity: O(n), where n is the size of ls."""
-    assert pythonic_is_sorted(ls)
+    assert validate(pythonic_is_sorted, ls)
     for index, e in enumerate(ls):
         if e == item:
             return index
@@ -82,7 +83,7 @@ def binary_search_recursively_not_in_place(ls: list, item: object) -> bool:
 
     Note: this algorithm uses the slice operator, which creates a sub-lists.
     Slicing is an operation that runs in O(k) time."""
-    assert pythonic_is_sorted(ls)
+    assert validate(pythonic_is_sorted, ls)
     if len(ls) == 0:  # basis
         return False
     else:
@@ -119,7 +120,7 @@ def binary_search_recursively_in_place(ls: list, item: object) -> bool:
 
     This algorithm, as opposed to binary_search_recursively_not_in_place, does
     not create sub-lists during the recursion process."""
-    assert pythonic_is_sorted(ls)
+    assert validate(pythonic_is_sorted, ls)
     return _binary_search_recursively_in_place(ls, item, 0, len(ls) - 1)
 
 
@@ -131,7 +132,7 @@ def binary_search_iteratively(ls: list, item: object) -> bool:
     otherwise it returns -1.
 
     Time complexity: O(log(n))."""
-    assert pythonic_is_sorted(ls)
+    assert validate(pythonic_is_sorted, ls)
 
     if len(ls) == 0:
         return -1
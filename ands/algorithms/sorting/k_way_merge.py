@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+The merge procedure of merge-sort (see the module merge_sort.py) merges two
+sorted lists into a new list. k-way merge generalizes it to any number k of
+sorted sequences, which, moreover, do not need to be lists, but can be any
+iterables, e.g. generators or files, and which are consumed lazily: the merged
+sequence is produced one element at a time, so that it is never stored as a
+whole in memory. This is, for example, the last phase of external sorting,
+where several sorted runs, each stored in a file, are merged.
+
+The next element of the merged sequence is always one among the first elements
+not yet consumed (the heads) of the k iterables. The heads are kept in a
+MinHeap, so that the smallest one can be found and removed in O(log(k)) time;
+then the next element of the same iterable, if any, becomes its new head and is
+added to the heap.
+
+The merge is stable: equal elements are produced in the order of the iterables
+in which they occur, and, within the same iterable, in their original order.
+
+Elements can be read from each iterable in chunks of buffer_size elements, e.g.
+to read from files in batches, at the cost of keeping in memory up to k *
+buffer_size elements.
+
+# References
+
+- https://en.wikipedia.org/wiki/K-way_merge_algorithm
+- https://en.wikipedia.org/wiki/External_sorting
+- https://docs.python.org/3/library/heapq.html#heapq.merge
+"""
+
+from itertools import islice
+
+from ands.ds.MaxHeap import MaxHeap
+from ands.ds.MinHeap import MinHeap
+from ands.validation import OFF, set_validation_level
+
+__all__ = ["k_way_merge"]
+
+
+def _buffered(iterable, buffer_size: int):
+    """Returns a generator of the elements of iterable, which reads them in
+    chunks of (at most) buffer_size elements."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, buffer_size))
+        if not chunk:
+            return
+        yield from chunk
+
+
+def k_way_merge(*iterables, key=None, reverse: bool = False,
+                buffer_size: int = 1):
+    """Returns a generator of the elements of iterables merged into a single
+    sorted sequence.
+
+    Each of the iterables must already be sorted, according to key and
+    reverse, which have the same meaning as for the built-in function sorted.
+    The key of each element is computed only once.
+
+    Elements are read from each of the iterables in chunks of buffer_size
+    elements.
+
+    Time complexity: O(n * log(k)), where n is the total number of elements
+    and k is the number of iterables.
+
+    Space complexity: O(k * buffer_size)."""
+    if not isinstance(buffer_size, int):
+        raise TypeError("buffer_size must be an instance of int")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be greater than or equal to 1")
+
+    if buffer_size == 1:
+        sources = [iter(it) for it in iterables]
+    else:
+        sources = [_buffered(it, buffer_size) for it in iterables]
+
+    # Each element of the heap is a list [head, i], where head is the head of
+    # the iterable at index i. Ties are broken by i, so that the merge is
+    # stable.
+    if reverse:
+        heap = MaxHeap(key=(lambda e: (e[0], -e[1])) if key is None else
+                       (lambda e: (key(e[0]), -e[1])))
+        remove = heap.remove_max
+    else:
+        heap = MinHeap(key=(lambda e: (e[0], e[1])) if key is None else
+                       (lambda e: (key(e[0]), e[1])))
+        remove = heap.remove_min
+
+    # The heap has at most k elements, but it would be validated for each
+    # element of the merged sequence.
+    set_validation_level(OFF, heap)
+
+    end = object()  # Returned by next when an iterable is exhausted.
+
+    heads = []
+    for i, source in enumerate(sources):
+        head = next(source, end)
+        if head is not end:
+            heads.append([head, i])
+    heap.add_many(heads)
+
+    while heap.size > 1:
+        e = remove()
+        yield e[0]
+        head = next(sources[e[1]], end)
+        if head is not end:
+            e[0] = head
+            heap.add(e)
+
+    # Only one iterable is left, so its elements do not need to be compared.
+    if not heap.is_empty():
+        e = remove()
+        yield e[0]
+        yield from sources[e[1]]
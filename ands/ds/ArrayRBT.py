@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Red-black tree whose nodes are not represented by objects linked together by
+references, as in ands.ds.RBT, but by indices into a few parallel arrays (a
+"struct of arrays"):
+
+- keys, a list containing the key of each node;
+- left, right and parent, arrays of C integers containing the indices of the
+left child, right child and parent of each node;
+- colors, a bytearray containing the color of each node.
+
+So, for example, the left child of the node at index i is the node at index
+left[i], whose key is keys[left[i]].
+
+Similarly to the implementation described in the chapter 13 of Introduction to
+Algorithms (3rd ed.) by CLRS, the index 0 is reserved for a sentinel node, NIL,
+which is always BLACK and which represents all leaves (and the parent of the
+root), so that many boundary conditions can be handled without special cases.
+
+Indices of deleted nodes are put into a free list, so that they can be reused
+by subsequent insertions, instead of growing the arrays.
+
+Apart from the keys themselves, this representation only requires 3 C integers
+and 1 byte per node, plus the reference to the key, so it requires a lot less
+memory than a tree of node objects. Moreover, the whole tree consists of only a
+few flat buffers, which can be cheaply pickled or written to a file.
+
+See the doc-strings of the module ands.ds.RBT to know more about red-black
+trees.
+
+# References
+
+- Chapter 13 of Introduction to Algorithms (3rd ed.) by CLRS
+- https://en.wikipedia.org/wiki/Red%E2%80%93black_tree
+- https://en.wikipedia.org/wiki/AoS_and_SoA
+- https://docs.python.org/3/library/array.html
+"""
+
+from array import array
+
+from ands.validation import validate
+
+__all__ = ["ArrayRBT", "is_array_rbt"]
+
+# Index of the sentinel node.
+_NIL = 0
+
+_BLACK = 0
+_RED = 1
+
+# Type code of the arrays of indices: C ints, i.e. 4 bytes on all common
+# platforms, which allows more than 2 billion nodes.
+_INDEX_TYPE = "i"
+
+
+class ArrayRBT:
+    """Red-black tree stored in parallel arrays, which provides the same public
+    interface as ands.ds.RBT for inserting, deleting and searching keys.
+
+    This implementation does allow duplicate elements.
+
+    It's the responsibility of the client of this class to make sure that keys
+    provided to the methods of this class are comparable among them."""
+
+    def __init__(self):
+        self._keys = [None]
+        self._left = array(_INDEX_TYPE, [_NIL])
+        self._right = array(_INDEX_TYPE, [_NIL])
+        self._parent = array(_INDEX_TYPE, [_NIL])
+        self._colors = bytearray([_BLACK])
+        self._free = array(_INDEX_TYPE)
+        self._root = _NIL
+        self._n = 0
+        assert validate(is_array_rbt, self)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of keys in this tree.
+
+        Time complexity: O(1)."""
+        assert len(self._keys) - len(self._free) - 1 == self._n
+        return self._n
+
+    def is_empty(self) -> bool:
+        """Returns true if this tree contains no keys, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def clear(self) -> None:
+        """Removes all keys from this tree and releases the arrays.
+
+        Time complexity: O(1)."""
+        self.__init__()
+
+    def _new_node(self, key: object) -> int:
+        """Allocates a RED node with key, reusing a free slot, if any, and
+        returns its index.
+
+        Time complexity: O(1) amortized."""
+        if self._free:
+            i = self._free.pop()
+            self._keys[i] = key
+            self._left[i] = self._right[i] = self._parent[i] = _NIL
+            self._colors[i] = _RED
+        else:
+            i = len(self._keys)
+            self._keys.append(key)
+            self._left.append(_NIL)
+            self._right.append(_NIL)
+            self._parent.append(_NIL)
+            self._colors.append(_RED)
+        return i
+
+    def _free_node(self, i: int) -> None:
+        """Releases the slot at index i, so that it can be reused.
+
+        Time complexity: O(1) amortized."""
+        assert i != _NIL
+        self._keys[i] = None
+        self._left[i] = self._right[i] = self._parent[i] = _NIL
+        self._free.append(i)
+
+    def insert(self, key: object) -> None:
+        """Inserts key into this tree.
+
+        Time complexity: O(log₂(n))."""
+        assert validate(is_array_rbt, self)
+
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        keys = self._keys
+        left = self._left
+        right = self._right
+
+        y = _NIL
+        x = self._root
+        while x != _NIL:
+            y = x
+            x = left[x] if key < keys[x] else right[x]
+
+        z = self._new_node(key)
+        self._parent[z] = y
+
+        if y == _NIL:
+            self._root = z
+        elif key < keys[y]:
+            left[y] = z
+        else:
+            right[y] = z
+
+        self._n += 1
+        self._fix_insertion(z)
+
+        assert validate(is_array_rbt, self)
+
+    def _fix_insertion(self, z: int) -> None:
+        """Restores the red-black tree properties after the RED node z has been
+        inserted.
+
+        Time complexity: O(log₂(n))."""
+        left = self._left
+        right = self._right
+        parent = self._parent
+        colors = self._colors
+
+        while colors[parent[z]] == _RED:
+            p = parent[z]
+            g = parent[p]
+            if p == left[g]:
+                y = right[g]  # Uncle of z.
+                if colors[y] == _RED:
+                    colors[p] = colors[y] = _BLACK
+                    colors[g] = _RED
+                    z = g
+                else:
+                    if z == right[p]:
+                        z = p
+                        self._left_rotate(z)
+                        p = parent[z]
+                    colors[p] = _BLACK
+                    colors[g] = _RED
+                    self._right_rotate(g)
+            else:  # Symmetric to the previous case.
+                y = left[g]
+                if colors[y] == _RED:
+                    colors[p] = colors[y] = _BLACK
+                    colors[g] = _RED
+                    z = g
+                else:
+                    if z == left[p]:
+                        z = p
+                        self._right_rotate(z)
+                        p = parent[z]
+                    colors[p] = _BLACK
+                    colors[g] = _RED
+                    self._left_rotate(g)
+
+        colors[self._root] = _BLACK
+
+    def _left_rotate(self, x: int) -> None:
+        """Left rotates the subtree rooted at the node x.
+
+        Time complexity: O(1)."""
+        left = self._left
+        right = self._right
+        parent = self._parent
+
+        y = right[x]
+        assert y != _NIL
+
+        right[x] = left[y]
+        if left[y] != _NIL:
+            parent[left[y]] = x
+
+        parent[y] = parent[x]
+        if parent[x] == _NIL:
+            self._root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+
+        left[y] = x
+        parent[x] = y
+
+    def _right_rotate(self, x: int) -> None:
+        """Right rotates the subtree rooted at the node x.
+
+        Time complexity: O(1)."""
+        left = self._left
+        right = self._right
+        parent = self._parent
+
+        y = left[x]
+        assert y != _NIL
+
+        left[x] = right[y]
+        if right[y] != _NIL:
+            parent[right[y]] = x
+
+        parent[y] = parent[x]
+        if parent[x] == _NIL:
+            self._root = y
+        elif x == right[parent[x]]:
+            right[parent[x]] = y
+        else:
+            left[parent[x]] = y
+
+        right[y] = x
+        parent[x] = y
+
+    def _transplant(self, u: int, v: int) -> None:
+        """Replaces the subtree rooted at u with the subtree rooted at v.
+
+        Note: the parent of v is set even if v is NIL, as required by
+        self._fix_deletion.
+
+        Time complexity: O(1)."""
+        p = self._parent[u]
+        if p == _NIL:
+            self._root = v
+        elif u == self._left[p]:
+            self._left[p] = v
+        else:
+            self._right[p] = v
+        self._parent[v] = p
+
+    def delete(self, key: object) -> None:
+        """Deletes key from this tree.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        assert validate(is_array_rbt, self)
+
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        z = self._search(key)
+        if z == _NIL:
+            raise LookupError("key not in this ArrayRBT")
+
+        left = self._left
+        right = self._right
+        parent = self._parent
+        colors = self._colors
+
+        y = z
+        y_original_color = colors[y]
+
+        if left[z] == _NIL:
+            x = right[z]
+            self._transplant(z, x)
+        elif right[z] == _NIL:
+            x = left[z]
+            self._transplant(z, x)
+        else:
+            y = self._minimum(right[z])  # Successor of z.
+            y_original_color = colors[y]
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self._transplant(y, x)
+                right[y] = right[z]
+                parent[right[y]] = y
+            self._transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            colors[y] = colors[z]
+
+        if y_original_color == _BLACK:
+            self._fix_deletion(x)
+
+        self._free_node(z)
+        self._n -= 1
+
+        assert validate(is_array_rbt, self)
+
+    def _fix_deletion(self, x: int) -> None:
+        """Restores the red-black tree properties after a BLACK node has been
+        removed, where x is the node which took its place, which has an "extra
+        black".
+
+        Time complexity: O(log₂(n))."""
+        left = self._left
+        right = self._right
+        parent = self._parent
+        colors = self._colors
+
+        while x != self._root and colors[x] == _BLACK:
+            p = parent[x]
+            if x == left[p]:
+                w = right[p]  # Sibling of x.
+                if colors[w] == _RED:
+                    colors[w] = _BLACK
+                    colors[p] = _RED
+                    self._left_rotate(p)
+                    w = right[p]
+                if colors[left[w]] == _BLACK and colors[right[w]] == _BLACK:
+                    colors[w] = _RED
+                    x = p
+                else:
+                    if colors[right[w]] == _BLACK:
+                        colors[left[w]] = _BLACK
+                        colors[w] = _RED
+                        self._right_rotate(w)
+                        w = right[p]
+                    colors[w] = colors[p]
+                    colors[p] = _BLACK
+                    colors[right[w]] = _BLACK
+                    self._left_rotate(p)
+                    x = self._root
+            else:  # Symmetric to the previous case.
+                w = left[p]
+                if colors[w] == _RED:
+                    colors[w] = _BLACK
+                    colors[p] = _RED
+                    self._right_rotate(p)
+                    w = left[p]
+                if colors[left[w]] == _BLACK and colors[right[w]] == _BLACK:
+                    colors[w] = _RED
+                    x = p
+                else:
+                    if colors[left[w]] == _BLACK:
+                        colors[right[w]] = _BLACK
+                        colors[w] = _RED
+                        self._left_rotate(w)
+                        w = left[p]
+                    colors[w] = colors[p]
+                    colors[p] = _BLACK
+                    colors[left[w]] = _BLACK
+                    self._right_rotate(p)
+                    x = self._root
+
+        colors[x] = _BLACK
+
+    def contains(self, key: object) -> bool:
+        """Returns true if key is in this tree, false otherwise.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._search(key) != _NIL
+
+    def _search(self, key: object) -> int:
+        """Returns the index of a node whose key is equal to key, or NIL if
+        there's no such node.
+
+        Time complexity: O(log₂(n))."""
+        keys = self._keys
+        x = self._root
+        while x != _NIL:
+            k = keys[x]
+            if key == k:
+                return x
+            x = self._left[x] if key < k else self._right[x]
+        return _NIL
+
+    def _minimum(self, x: int) -> int:
+        """Returns the index of the node with the smallest key in the subtree
+        rooted at x, which must not be NIL.
+
+        Time complexity: O(log₂(n))."""
+        assert x != _NIL
+        while self._left[x] != _NIL:
+            x = self._left[x]
+        return x
+
+    def _maximum(self, x: int) -> int:
+        """Returns the index of the node with the greatest key in the subtree
+        rooted at x, which must not be NIL.
+
+        Time complexity: O(log₂(n))."""
+        assert x != _NIL
+        while self._right[x] != _NIL:
+            x = self._right[x]
+        return x
+
+    def minimum(self) -> object:
+        """Returns the smallest key in this tree, or None if it is empty.
+
+        Time complexity: O(log₂(n))."""
+        if self._root != _NIL:
+            return self._keys[self._minimum(self._root)]
+
+    def maximum(self) -> object:
+        """Returns the greatest key in this tree, or None if it is empty.
+
+        Time complexity: O(log₂(n))."""
+        if self._root != _NIL:
+            return self._keys[self._maximum(self._root)]
+
+    def successor(self, key: object) -> object:
+        """Returns the successor of key, i.e. the key which follows key in the
+        sorted order of the keys of this tree, or None if key does not have a
+        successor.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        x = self._search(key)
+        if x == _NIL:
+            raise LookupError("key not in this ArrayRBT")
+
+        if self._right[x] != _NIL:
+            return self._keys[self._minimum(self._right[x])]
+
+        p = self._parent[x]
+        while p != _NIL and x == self._right[p]:
+            x = p
+            p = self._parent[p]
+
+        return self._keys[p] if p != _NIL else None
+
+    def predecessor(self, key: object) -> object:
+        """Returns the predecessor of key, i.e. the key which precedes key in
+        the sorted order of the keys of this tree, or None if key does not have
+        a predecessor.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        x = self._search(key)
+        if x == _NIL:
+            raise LookupError("key not in this ArrayRBT")
+
+        if self._left[x] != _NIL:
+            return self._keys[self._maximum(self._left[x])]
+
+        p = self._parent[x]
+        while p != _NIL and x == self._left[p]:
+            x = p
+            p = self._parent[p]
+
+        return self._keys[p] if p != _NIL else None
+
+    def remove_min(self) -> None:
+        """Removes the smallest key from this tree, if it is not empty.
+
+        Time complexity: O(log₂(n))."""
+        if self._root != _NIL:
+            self.delete(self.minimum())
+
+    def remove_max(self) -> None:
+        """Removes the greatest key from this tree, if it is not empty.
+
+        Time complexity: O(log₂(n))."""
+        if self._root != _NIL:
+            self.delete(self.maximum())
+
+    def height(self) -> int:
+        """Returns the height of this tree, i.e. the number of nodes on the
+        longest path from the root to a leaf.
+
+        Time complexity: O(n)."""
+        h = 0
+        stack = [(self._root, 1)] if self._root != _NIL else []
+        while stack:
+            x, depth = stack.pop()
+            h = max(h, depth)
+            for c in (self._left[x], self._right[x]):
+                if c != _NIL:
+                    stack.append((c, depth + 1))
+        return h
+
+    def __iter__(self):
+        """Returns a generator which yields the keys of this tree in increasing
+        order.
+
+        Time complexity: O(n) to yield all keys."""
+        stack = []
+        x = self._root
+        while stack or x != _NIL:
+            while x != _NIL:
+                stack.append(x)
+                x = self._left[x]
+            x = stack.pop()
+            yield self._keys[x]
+            x = self._right[x]
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def is_array_rbt(t: ArrayRBT) -> bool:
+    """Returns true if t is a valid ArrayRBT object, false otherwise."""
+    if not isinstance(t, ArrayRBT):
+        return False
+
+    m = len(t._keys)
+    if not (len(t._left) == len(t._right) == len(t._parent) ==
+            len(t._colors) == m):
+        return False
+
+    if t._colors[_NIL] != _BLACK or t._colors[t._root] != _BLACK:
+        return False
+    if t._root != _NIL and t._parent[t._root] != _NIL:
+        return False
+
+    free = set(t._free)
+    if _NIL in free or any(t._keys[i] is not None for i in free):
+        return False
+
+    # Visit all nodes reachable from the root, computing the black-height of
+    # each of them.
+    count = 0
+    black_heights = {_NIL: 1}
+    stack = [(t._root, False)] if t._root != _NIL else []
+
+    while stack:
+        x, children_visited = stack.pop()
+        l, r = t._left[x], t._right[x]
+
+        if not children_visited:
+            count += 1
+            if x in free or t._keys[x] is None:
+                return False
+            if t._colors[x] == _RED and (t._colors[l] == _RED or
+                                         t._colors[r] == _RED):
+                return False
+            for c, ok in ((l, lambda k: k <= t._keys[x]),
+                          (r, lambda k: k >= t._keys[x])):
+                if c != _NIL and (t._parent[c] != x or not ok(t._keys[c])):
+                    return False
+            stack.append((x, True))
+            for c in (l, r):
+                if c != _NIL:
+                    stack.append((c, False))
+        else:
+            if black_heights[l] != black_heights[r]:
+                return False
+            black_heights[x] = (black_heights[l] +
+                                (1 if t._colors[x] == _BLACK else 0))
+
+    if count != t._n or count + len(free) + 1 != m:
+        return False
+
+    # The in-order sequence of the keys must be sorted.
+    keys = list(t)
+    return all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A min-heap which can be shared between asyncio tasks.
+
+AsyncMinHeap is a sub-class of asyncio.Queue, of the standard library, and thus
+provides the same interface (the coroutines put, get and join, and put_nowait,
+get_nowait, task_done, qsize, empty, full and maxsize), but its elements are
+stored in a MinHeap, so that get always returns the smallest element.
+
+Like ThreadSafeMinHeap, it only appends and pushes up an element, or removes the
+root and pushes down the element which replaces it, and it never validates the
+heap (see ands.validation).
+
+An AsyncMinHeap is not thread-safe: it must only be used by tasks of the same
+event loop.
+
+# References
+
+- https://docs.python.org/3/library/asyncio-queue.html
+- https://github.com/python/cpython/blob/main/Lib/asyncio/queues.py
+"""
+
+import asyncio
+
+from ands.ds.MinHeap import MinHeap
+
+__all__ = ["AsyncMinHeap"]
+
+
+class AsyncMinHeap(asyncio.Queue):
+    """Min-heap for asyncio with the interface of asyncio.Queue.
+
+    If maxsize is less than or equal to 0, the heap is unbounded, otherwise
+    put waits (or put_nowait raises asyncio.QueueFull) while it contains
+    maxsize elements. Similarly, get waits (or get_nowait raises
+    asyncio.QueueEmpty) while it is empty.
+
+    key is a key function, as in MinHeap, and elements with equal keys are
+    returned in the order in which they were put."""
+
+    def __init__(self, maxsize: int = 0, key=None):
+        self._heap_key = key
+        asyncio.Queue.__init__(self, maxsize)
+
+    async def put(self, x: object) -> None:
+        """Puts x into this heap, waiting until it is not full.
+
+        If x is None, ValueError is raised.
+
+        Time complexity: O(log(n)), plus the waiting time, if this heap is
+        full."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        await asyncio.Queue.put(self, x)
+
+    def put_nowait(self, x: object) -> None:
+        """Puts x into this heap, if it is not full, otherwise it raises
+        asyncio.QueueFull.
+
+        If x is None, ValueError is raised.
+
+        Time complexity: O(log(n))."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        asyncio.Queue.put_nowait(self, x)
+
+    def qsize(self) -> int:
+        """Returns the number of elements in this heap.
+
+        Time complexity: O(1)."""
+        return self._queue.size
+
+    def empty(self) -> bool:
+        """Returns true if this heap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._queue.is_empty()
+
+    def __repr__(self):
+        return "<%s maxsize=%r size=%d>" % (type(self).__name__, self.maxsize,
+                                            self.qsize())
+
+    def __str__(self):
+        return self.__repr__()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = MinHeap(key=self._heap_key)
+
+    def _put(self, x: object) -> None:
+        """Adds x to self._queue without validating it.
+
+        Time complexity: O(log(n))."""
+        h = self._queue
+        h._append(x)
+        h._push_up(h.size - 1)
+
+    def _get(self) -> object:
+        """Removes and returns the smallest element of self._queue without
+        validating it.
+
+        Time complexity: O(log(n))."""
+        return self._queue._remove_root()
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/07/2015
 
-Updated: 28/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -31,6 +31,29 @@ proportional to the logarithm of the number of items stored in the tree.
 This is much better than the linear time required to find items by key in an
 (unsorted) array, but slower than the corresponding operations on hash tables.
 
+## Order statistics
+
+Each node also keeps the number of nodes in the subtree rooted at itself (the
+node itself included). This augmentation allows operations such as rank, select
+and count_between to be performed in O(h) time, that is, by simply descending
+the tree, instead of visiting all of its nodes.
+
+## Sorted map
+
+Each node can also store a value associated with its key, so that a BST can be
+used as a sorted map (i.e. a dictionary whose keys are kept in sorted order):
+see the methods __getitem__, __setitem__, __delitem__, get, items, pop_min and
+pop_max. The methods floor and ceiling allow to search for the closest keys to
+an arbitrary key, which does not need to be in the tree.
+
+## Serialization
+
+A BST can be written to a binary file with dump and restored with load in O(n)
+time, without calling insert. Only the shape of the tree, one byte per node,
+and the sorted lists of keys and values are stored, so both operations do not
+depend on the height of the tree (see the doc-strings of dump). Pickling a BST
+also uses this format.
+
 # TODO
 
 - Add functions "intersection" and "union".
@@ -44,21 +67,50 @@ This is much better than the linear time required to find items by key in an
 - http://www.cs.princeton.edu/courses/archive/spr04/cos226/lectures/bst.4up.pdf
 - http://algs4.cs.princeton.edu/32bst/BST.java.html
 - http://ocw.mit.edu/courses/electrical-engineering-and-computer-science/6-006-introduction-to-algorithms-fall-2011/readings/binary-search-trees/bst.py
+- Introduction to Algorithms (3rd edition), chapter 14.1, by CLRS
 """
 
+import io
+import pickle
+import struct
+
+from ands.validation import set_validation_level, validate
+
 __all__ = ["BST", "is_bst"]
 
+# Format of the header of the files written by BST.dump: magic number, format
+# version, kind of tree (see BST._DUMP_KIND), flags and number of nodes.
+_DUMP_HEADER = struct.Struct("<4sBBBQ")
+_DUMP_MAGIC = b"ANDS"
+_DUMP_VERSION = 1
+
+# Header flags.
+_HAS_VALUES = 1
+
+# Bits of the bytes which describe the shape of the tree.
+_HAS_LEFT = 1
+_HAS_RIGHT = 2
+
 
 class _BSTNode:
-    """Node class to represent a node for the BST class."""
+    """Node class to represent a node for the BST class.
+
+    __slots__ is used so that nodes do not have a per-instance __dict__, which
+    considerably reduces the memory used by each node."""
+
+    __slots__ = ("key", "value", "parent", "left", "right", "size")
 
-    def __init__(self, key, parent=None, left=None, right=None):
+    def __init__(self, key, parent=None, left=None, right=None, value=None):
         if key is None:
             raise ValueError("key cannot be None")
         self.key = key
+        # Value associated with key, when the tree is used as a sorted map.
+        self.value = value
         self.parent = parent
         self.left = left
         self.right = right
+        # Number of nodes in the subtree rooted at self, including self.
+        self.size = 1
 
     @property
     def sibling(self) -> "_BSTNode":
@@ -163,19 +215,22 @@ class BST:
     means the maximum height the algorithm is going to reach. m in O(m) is the
     height of the subtree rooted at the node passed as parameter."""
 
+    # Identifies the type of tree in the files written by dump.
+    _DUMP_KIND = 0
+
     def __init__(self):
         self._n = 0
         self._root = None
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
     @property
     def size(self) -> int:
         """Returns the total number of nodes.
 
         Time complexity: O(1)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if self._root is not None:
-            assert self._root.count() == self._n
+            assert self._root.size == self._n
         else:
             assert self._n == 0
         return self._n
@@ -184,74 +239,93 @@ class BST:
         """Returns true if this tree has 0 nodes.
 
         Time complexity: O(1)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         return self.size == 0
 
     def clear(self) -> None:
         """Removes all nodes from this tree.
 
         Time complexity: O(1)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         self._root = None
         self._n = 0
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
     def _is_root(self, u: _BSTNode) -> bool:
         """Checks if u is the same object as self.root.
 
         Time complexity: O(1)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if u == self._root:
             if u is not None:
                 assert u.parent is None
         return u == self._root
 
-    def insert(self, key: object) -> None:
-        """Inserts key into this BST.
+    def insert(self, key: object, value: object = None) -> None:
+        """Inserts key, associated with value, into this BST.
+
+        Since duplicate keys are allowed, a new node is always created, even if
+        key is already in this BST. Use self[key] = value to replace the value
+        associated with an existing key.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         if key is None:
             raise ValueError("key cannot be None")
 
-        key_node = _BSTNode(key)
+        self._insert_node(self._new_node(key, value))
 
-        if self._root is None:
-            assert self._n == 0
-            self._root = key_node
-        else:
-            c = self._root  # c is the current node.
-            p = self._root.parent  # Parent of c.
+        assert validate(is_bst, self)
 
-            while c is not None:
-                p = c
-                if key_node.key < c.key:
-                    c = c.left
-                else:
-                    c = c.right
+    def _new_node(self, key: object, value: object) -> _BSTNode:
+        """Creates and returns a new node for this tree, which is not yet
+        linked to the tree.
+
+        Sub-classes which use sub-classes of _BSTNode should override this
+        method.
+
+        Time complexity: O(1)."""
+        return _BSTNode(key, value=value)
+
+    def _insert_node(self, key_node: _BSTNode) -> None:
+        """Inserts key_node as a leaf of this tree, without performing any
+        rebalancing, and updates the sizes of its ancestors.
+
+        Time complexity: O(h)."""
+        c = self._root  # c is the current node.
+        p = None  # Parent of c.
 
-            if key_node.key < p.key:
-                p.left = key_node
+        while c is not None:
+            p = c
+            if key_node.key < c.key:
+                c = c.left
             else:
-                p.right = key_node
+                c = c.right
 
-            key_node.parent = p
+        key_node.parent = p
 
-        self._n += 1
+        if p is None:
+            assert self._n == 0
+            self._root = key_node
+        elif key_node.key < p.key:
+            p.left = key_node
+        else:
+            p.right = key_node
 
-        assert is_bst(self)
+        self._n += 1
+        self._update_path(p)
 
     def contains(self, key: object) -> bool:
         """Returns true if key is in this BST, false otherwise.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if key is None:
             raise ValueError("key cannot be None")
         key_node = self._search_key_iteratively(key, self._root)
         assert self._search_key_recursively(key, self._root) == key_node
-        assert is_bst(self)
+        assert validate(is_bst, self)
         return key_node is not None
 
     @staticmethod
@@ -285,47 +359,127 @@ class BST:
         """Returns the number of keys strictly less than key.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if not self.contains(key):
             raise LookupError("key was not found")
-        return self._rank(self._root, key, 0)
+        return self._rank(key, False)
 
-    def _rank(self, u: _BSTNode, key, r: int) -> int:
-        if u is None:
-            return r
-        if u.key < key:
-            r += 1
-        r = self._rank(u.left, key, r)
-        r = self._rank(u.right, key, r)
+    def _rank(self, key: object, inclusive: bool) -> int:
+        """Returns the number of keys strictly less than key, if inclusive is
+        false, otherwise the number of keys less than or equal to key.
+
+        key does not need to be in this tree.
+
+        Time complexity: O(h)."""
+        r = 0
+        c = self._root
+        while c is not None:
+            if key < c.key or (not inclusive and key == c.key):
+                c = c.left
+            else:
+                r += BST._size(c.left) + 1
+                c = c.right
         return r
 
+    def select(self, k: int) -> object:
+        """Returns the key of rank k, i.e. the (k + 1)th smallest key, in this
+        BST, so that, if keys are distinct, select(rank(key)) == key.
+
+        If k is not in the range [0, size), ValueError is raised.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0 or k >= self._n:
+            raise ValueError("k must be in the range [0, size)")
+
+        c = self._root
+        while True:
+            left_size = BST._size(c.left)
+            if k < left_size:
+                c = c.left
+            elif k > left_size:
+                k -= left_size + 1
+                c = c.right
+            else:
+                return c.key
+
+    def count_between(self, lo: object, hi: object) -> int:
+        """Returns the number of keys k in this BST such that lo <= k <= hi.
+
+        Neither lo nor hi need to be in this BST.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if lo is None or hi is None:
+            raise ValueError("lo and hi cannot be None")
+        if hi < lo:
+            return 0
+        return self._rank(hi, True) - self._rank(lo, False)
+
+    @staticmethod
+    def _size(u: _BSTNode) -> int:
+        """Returns the number of nodes in the subtree rooted at u.
+
+        Time complexity: O(1)."""
+        return 0 if u is None else u.size
+
+    def _update_node(self, u: _BSTNode) -> None:
+        """Recomputes the fields of u which depend on its children, i.e. the
+        size of the subtree rooted at u, assuming that the fields of its
+        children are correct.
+
+        Sub-classes which augment the nodes with further fields should extend
+        this method.
+
+        Time complexity: O(1)."""
+        u.size = BST._size(u.left) + BST._size(u.right) + 1
+
+    def _update_path(self, u: _BSTNode) -> None:
+        """Calls self._update_node on u and on all its ancestors, bottom-up.
+
+        Time complexity: O(m), where m is the depth of u."""
+        while u is not None:
+            self._update_node(u)
+            u = u.parent
+
     def height(self) -> int:
         """Returns the maximum height of this BST.
 
         Since this is not a balanced BST, the maximum height may vary during the
         lifetime of this BST.
 
-        Time complexity: O(h)."""
-        assert is_bst(self)
+        Time complexity: O(n)."""
+        assert validate(is_bst, self)
         if self._root is None:
             return 0
         else:
             return self._height(self._root)
 
     def _height(self, u: _BSTNode) -> int:
-        if u is None:
-            return 0
-        return 1 + max(self._height(u.left), self._height(u.right))
+        """Returns the height of the subtree rooted at u, i.e. its number of
+        levels, which are visited one at a time, so that the height can be
+        computed regardless of its value.
+
+        Time complexity: O(m), where m is the size of the subtree rooted at
+        u."""
+        h = 0
+        level = [u] if u is not None else []
+        while level:
+            h += 1
+            level = [c for v in level for c in (v.left, v.right)
+                     if c is not None]
+        return h
 
     def minimum(self) -> object:
         """Returns the minimum key in this BST, or None if this BST is empty.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if self._root is not None:
             m = BST._minimum(self._root)
-            assert m == BST._minimum_recursively(self._root)
-            assert is_bst(self)
+            assert validate(is_bst, self)
             return m.key if m is not None else None
 
     @staticmethod
@@ -348,11 +502,10 @@ class BST:
         """Returns the maximum key in this BST, or None if this BST is empty.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if self._root is not None:
             m = BST._maximum(self._root)
-            assert m == BST._maximum_recursively(self._root)
-            assert is_bst(self)
+            assert validate(is_bst, self)
             return m.key if m is not None else None
 
     @staticmethod
@@ -382,7 +535,7 @@ class BST:
         falls in the left subtree of A.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         if key is None:
             raise ValueError("key cannot be None")
 
@@ -392,7 +545,7 @@ class BST:
 
         s = BST._successor(key_node)
 
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         return s.key if s is not None else None
 
@@ -416,7 +569,7 @@ class BST:
         smaller than key, or None if key does not have a predecessor.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         if key is None:
             raise ValueError("key cannot be None")
@@ -427,7 +580,7 @@ class BST:
 
         p = BST._predecessor(key_node)
 
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         return p.key if p is not None else None
 
@@ -446,11 +599,59 @@ class BST:
 
         return p
 
+    def floor(self, key: object) -> object:
+        """Returns the greatest key in this BST which is less than or equal to
+        key, or None if there's no such key.
+
+        Differently from predecessor, key does not need to be in this BST.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        floor = None
+        c = self._root
+        while c is not None:
+            if key < c.key:
+                c = c.left
+            elif key == c.key:
+                return c.key
+            else:
+                floor = c
+                c = c.right
+
+        return floor.key if floor is not None else None
+
+    def ceiling(self, key: object) -> object:
+        """Returns the smallest key in this BST which is greater than or equal
+        to key, or None if there's no such key.
+
+        Differently from successor, key does not need to be in this BST.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        ceil = None
+        c = self._root
+        while c is not None:
+            if key < c.key:
+                ceil = c
+                c = c.left
+            elif key == c.key:
+                return c.key
+            else:
+                c = c.right
+
+        return ceil.key if ceil is not None else None
+
     def remove_max(self) -> None:
         """Removes the greatest element from self.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         if self.is_empty():
             return
@@ -475,13 +676,14 @@ class BST:
                 m.parent.right = None
 
         self._n -= 1
-        assert is_bst(self)
+        self._update_path(m.parent)
+        assert validate(is_bst, self)
 
     def remove_min(self) -> None:
         """Removes the smallest element from self.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         if self.is_empty():
             return
@@ -503,7 +705,38 @@ class BST:
                 m.parent.left = None
 
         self._n -= 1
-        assert is_bst(self)
+        self._update_path(m.parent)
+        assert validate(is_bst, self)
+
+    def pop_min(self) -> tuple:
+        """Removes the smallest key from this BST and returns it together with
+        its associated value as a tuple (key, value), or returns None if this
+        BST is empty.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if self._root is None:
+            return None
+        m = BST._minimum(self._root)
+        item = m.key, m.value
+        self._delete_node(m)
+        assert validate(is_bst, self)
+        return item
+
+    def pop_max(self) -> tuple:
+        """Removes the greatest key from this BST and returns it together with
+        its associated value as a tuple (key, value), or returns None if this
+        BST is empty.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if self._root is None:
+            return None
+        m = BST._maximum(self._root)
+        item = m.key, m.value
+        self._delete_node(m)
+        assert validate(is_bst, self)
+        return item
 
     def delete(self, key: object) -> None:
         """Deletes key from self, if it exists.
@@ -515,7 +748,7 @@ class BST:
         3. key has the left and right subtrees (or children).
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
 
         if key is None:
             raise ValueError("key cannot be None")
@@ -524,9 +757,18 @@ class BST:
         if key_node is None:
             raise LookupError("key not in this BST")
 
+        self._delete_node(key_node)
+        assert validate(is_bst, self)
+
+    def _delete_node(self, u: _BSTNode) -> None:
+        """Removes the node u, which must be in this tree, from this tree.
+
+        Sub-classes which need to restore further invariants after a deletion
+        (e.g. balance) should override this method.
+
+        Time complexity: O(h)."""
         self._n -= 1
-        self._delete_aux(key_node)
-        assert is_bst(self)
+        self._delete_aux(u)
 
     def _delete_aux(self, u: _BSTNode) -> _BSTNode:
         """When deleting a node u from a BST, we have basically to consider 3
@@ -595,6 +837,104 @@ class BST:
         # child is None iff u.right and u.left are None.
         if child:
             child.parent = u.parent
+        self._update_path(u.parent)
+
+    def _left_rotate(self, u: _BSTNode) -> _BSTNode:
+        """Left rotates the subtree rooted at node u.
+
+        Returns the node which is at the previous position of u, that is it
+        returns the parent of u.
+
+        Time complexity: O(1)."""
+        assert u.has_right_child()
+
+        u.right.parent = u.parent
+
+        # Only the root has a None parent.
+        if not u.has_parent():
+            self._root = u.right
+
+        # Checking if u is a left or a right child, in order to set the new left
+        # or right child respectively of its parent.
+        elif u.is_left_child():
+            u.parent.left = u.right
+        else:
+            u.parent.right = u.right
+
+        u.parent = u.right
+
+        # The new right child of u becomes what is the left child of its
+        # previous right child.
+        u.right = u.parent.left
+
+        # Set u to be the parent of its new right child.
+        if u.has_right_child():
+            u.right.parent = u
+
+        # Set u to be the new left child of its new parent.
+        u.parent.left = u
+
+        # Only the sizes of u and of its new parent have changed.
+        self._update_node(u)
+        self._update_node(u.parent)
+
+        return u.parent
+
+    def _right_rotate(self, u: _BSTNode) -> _BSTNode:
+        """Right rotates the subtree rooted at node u.
+
+        Time complexity: O(1)."""
+        assert u.has_left_child()
+
+        u.left.parent = u.parent
+
+        if not u.has_parent():
+            self._root = u.left
+        elif u.is_left_child():
+            u.parent.left = u.left
+        else:
+            u.parent.right = u.left
+
+        u.parent = u.left
+        u.left = u.parent.right
+
+        if u.has_left_child():
+            u.left.parent = u
+
+        u.parent.right = u
+
+        self._update_node(u)
+        self._update_node(u.parent)
+
+        return u.parent
+
+    def _forget_nodes(self) -> None:
+        """Empties this BST, whose nodes have been moved to another tree,
+        without validating it, since it is no more consistent.
+
+        Time complexity: O(1)."""
+        self._root = None
+        self._n = 0
+
+    def _from_root(self, u: _BSTNode) -> "BST":
+        """Creates and returns a new BST, of the same type and with the same
+        validation level as this BST, whose root is the detached subtree u.
+
+        Time complexity: O(1)."""
+        t = type(self)()
+        set_validation_level(getattr(self, "_validation_level", None), t)
+        t._set_root(u)
+        return t
+
+    def _set_root(self, u: _BSTNode) -> None:
+        """Sets the detached subtree rooted at u as the whole tree.
+
+        Sub-classes which need to restore invariants of the root (e.g. its
+        color) should extend this method.
+
+        Time complexity: O(1)."""
+        self._root = u
+        self._n = BST._size(u)
 
     def _switch(self, x: _BSTNode, y: _BSTNode) -> None:
         """"Switches the roles of x and y in the tree by moving references."""
@@ -608,6 +948,10 @@ class BST:
         else:
             self._switch_nodes_when_not_parent_child(x, y)
 
+        # The size of a subtree depends on its position in the tree and not on
+        # its root, so x and y also need to exchange their sizes.
+        x.size, y.size = y.size, x.size
+
     def _switch_nodes_when_not_parent_child(self, x: _BSTNode,
                                             y: _BSTNode) -> None:
         """x and y are nodes in the tree that are not related by a parent-child.
@@ -693,11 +1037,340 @@ class BST:
         c.parent = p.parent
         p.parent = c
 
+    def iter_range(self, lo: object, hi: object, reverse: bool = False):
+        """Returns a generator which lazily yields, in increasing order (or in
+        decreasing order, if reverse is true), the keys k of this BST such that
+        lo <= k <= hi.
+
+        Neither lo nor hi need to be in this BST.
+
+        The tree is traversed iteratively using an explicit stack, so that no
+        recursion is involved. This BST should not be modified while the
+        returned generator is being used.
+
+        Time complexity: O(h + k), where k is the number of yielded keys."""
+        if lo is None or hi is None:
+            raise ValueError("lo and hi cannot be None")
+        return (u.key for u in self._iter_nodes(lo, hi, reverse))
+
+    def __iter__(self):
+        """Returns a generator which lazily yields the keys of this BST in
+        increasing order.
+
+        Time complexity: O(n) to yield all keys."""
+        return (u.key for u in self._iter_nodes(None, None, False))
+
+    def __reversed__(self):
+        """Returns a generator which lazily yields the keys of this BST in
+        decreasing order.
+
+        Time complexity: O(n) to yield all keys."""
+        return (u.key for u in self._iter_nodes(None, None, True))
+
+    def _iter_nodes(self, lo: object, hi: object, reverse: bool):
+        """Generator which yields the nodes whose keys are between lo and hi
+        (both included) in increasing order, or in decreasing order if reverse
+        is true.
+
+        If lo (or hi) is None, there's no lower (or upper) bound."""
+        assert validate(is_bst, self)
+
+        stack = []
+        u = self._root
+
+        while True:
+            # Push on the stack the path to the smallest (or greatest) key in
+            # the subtree rooted at u which is in the range. Subtrees which
+            # only contain keys out of the range are skipped.
+            while u is not None:
+                if reverse:
+                    if hi is not None and hi < u.key:
+                        u = u.left
+                    else:
+                        stack.append(u)
+                        u = u.right
+                else:
+                    if lo is not None and u.key < lo:
+                        u = u.right
+                    else:
+                        stack.append(u)
+                        u = u.left
+
+            if not stack:
+                return
+
+            u = stack.pop()
+
+            # Keys are popped in order, so, if u is out of the range, all keys
+            # which follow are also out of the range.
+            if reverse:
+                if lo is not None and u.key < lo:
+                    return
+            elif hi is not None and hi < u.key:
+                return
+
+            yield u
+
+            u = u.left if reverse else u.right
+
+    def items(self, lo: object = None, hi: object = None):
+        """Returns a generator which lazily yields, in increasing order of the
+        keys, the tuples (key, value) of this BST such that lo <= key <= hi.
+
+        If lo (or hi) is None, there's no lower (or upper) bound.
+
+        Time complexity: O(h + k), where k is the number of yielded tuples."""
+        return ((u.key, u.value) for u in self._iter_nodes(lo, hi, False))
+
+    def get(self, key: object, default: object = None) -> object:
+        """Returns the value associated with key, if key is in this BST,
+        otherwise default.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        u = self._search_key_iteratively(key, self._root)
+        return u.value if u is not None else default
+
+    def __getitem__(self, key: object) -> object:
+        """Returns the value associated with key.
+
+        If key is not in this BST, KeyError is raised. If there are several
+        nodes with key, the value of the first one found is returned.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        u = self._search_key_iteratively(key, self._root)
+        if u is None:
+            raise KeyError(key)
+        return u.value
+
+    def __setitem__(self, key: object, value: object) -> None:
+        """Associates value with key, replacing the value previously associated
+        with key, if key is already in this BST, otherwise inserting key.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        u = self._search_key_iteratively(key, self._root)
+        if u is None:
+            self.insert(key, value)
+        else:
+            u.value = value
+
+    def __delitem__(self, key: object) -> None:
+        """Deletes key, and its associated value, from this BST.
+
+        If key is not in this BST, KeyError is raised.
+
+        Time complexity: O(h)."""
+        assert validate(is_bst, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        u = self._search_key_iteratively(key, self._root)
+        if u is None:
+            raise KeyError(key)
+        self._delete_node(u)
+        assert validate(is_bst, self)
+
+    def __contains__(self, key: object) -> bool:
+        """Returns true if key is in this BST, false otherwise.
+
+        Time complexity: O(h)."""
+        return self.contains(key)
+
+    # Serialization.
+
+    def dump(self, fp) -> None:
+        """Writes this BST to the binary file-like object fp, from which it can
+        later be restored with load, in the following compact format:
+
+        1. a header with a magic number, the version of the format, the kind of
+        tree, flags and the number of nodes n;
+
+        2. n bytes, one for each node, in pre-order, which describe the shape
+        of the tree, i.e. whether each node has a left and a right child, and,
+        for sub-classes like RBT, further per-node information, like colors;
+
+        3. the list of the keys in sorted order and, if at least one value is
+        not None, the list of the associated values, serialized with pickle.
+
+        Only the lists of keys and values are pickled, and not the nodes, so
+        this BST can be dumped regardless of its height.
+
+        Time complexity: O(n)."""
+        assert validate(is_bst, self)
+
+        shape = bytearray()
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            u = stack.pop()
+            shape.append((_HAS_LEFT if u.left is not None else 0) |
+                         (_HAS_RIGHT if u.right is not None else 0) |
+                         self._dump_node_flags(u))
+            if u.right is not None:
+                stack.append(u.right)
+            if u.left is not None:
+                stack.append(u.left)
+
+        keys = []
+        values = []
+        for u in self._iter_nodes(None, None, False):
+            keys.append(u.key)
+            values.append(u.value)
+        has_values = any(v is not None for v in values)
+
+        fp.write(_DUMP_HEADER.pack(_DUMP_MAGIC, _DUMP_VERSION, self._DUMP_KIND,
+                                   _HAS_VALUES if has_values else 0,
+                                   len(shape)))
+        fp.write(shape)
+        pickle.dump(keys, fp, pickle.HIGHEST_PROTOCOL)
+        if has_values:
+            pickle.dump(values, fp, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, fp) -> "BST":
+        """Creates and returns a new tree from the binary file-like object fp,
+        which must contain a tree of the same type written by dump.
+
+        fp can also be an mmap.mmap object, so that the tree can be loaded from
+        a memory-mapped file.
+
+        The nodes are created directly at their final positions in the tree,
+        without calling insert and without any rebalancing.
+
+        If fp does not contain a valid dump, ValueError is raised.
+
+        Time complexity: O(n)."""
+        t = cls()
+        t._load(fp)
+        return t
+
+    def _load(self, fp) -> None:
+        """Replaces the nodes of this tree with the ones read from fp.
+
+        The shape bytes, in pre-order, allow to compute, for each node, the
+        indices of its children and the size of its subtree, from which the
+        position of its key in the sorted order of the keys, i.e. the in-order
+        rank of the node, can also be computed. So, nodes can be created with
+        their keys, and linked, in a few linear passes, all of which are
+        iterative.
+
+        Time complexity: O(n)."""
+        header = fp.read(_DUMP_HEADER.size)
+        if len(header) != _DUMP_HEADER.size:
+            raise ValueError("fp does not contain a valid dump")
+        magic, version, kind, flags, n = _DUMP_HEADER.unpack(header)
+        if magic != _DUMP_MAGIC or version != _DUMP_VERSION:
+            raise ValueError("fp does not contain a valid dump")
+        if kind != self._DUMP_KIND:
+            raise ValueError("fp does not contain a dump of a " +
+                             type(self).__name__)
+
+        shape = fp.read(n)
+        try:
+            keys = pickle.load(fp)
+            values = pickle.load(fp) if flags & _HAS_VALUES else [None] * n
+        except (pickle.UnpicklingError, EOFError):
+            raise ValueError("fp does not contain a valid dump")
+        if not isinstance(keys, list) or not isinstance(values, list) or (
+                len(shape) != n or len(keys) != n or len(values) != n):
+            raise ValueError("fp does not contain a valid dump")
+
+        # Indices of the children of each node, in pre-order.
+        left = [-1] * n
+        right = [-1] * n
+        stack = []
+        try:
+            for i in range(n):
+                if i > 0:
+                    if shape[i - 1] & _HAS_LEFT:
+                        left[i - 1] = i
+                    else:
+                        right[stack.pop()] = i
+                if shape[i] & _HAS_RIGHT:
+                    stack.append(i)
+        except IndexError:
+            raise ValueError("fp does not contain a valid dump")
+        if stack or (n > 0 and shape[n - 1] & _HAS_LEFT):
+            raise ValueError("fp does not contain a valid dump")
+
+        # Sizes of the subtrees. The last element, size[-1], is the size of an
+        # empty subtree. Children come after their parents in pre-order.
+        size = [1] * n + [0]
+        for i in range(n - 1, -1, -1):
+            size[i] += size[left[i]] + size[right[i]]
+
+        rank = [0] * n
+        if n > 0:
+            rank[0] = size[left[0]]
+        for i in range(n):
+            c = left[i]
+            if c != -1:
+                rank[c] = rank[i] - 1 - size[right[c]]
+            c = right[i]
+            if c != -1:
+                rank[c] = rank[i] + 1 + size[left[c]]
+
+        nodes = []
+        for i in range(n):
+            u = self._new_node(keys[rank[i]], values[rank[i]])
+            self._load_node_flags(u, shape[i])
+            nodes.append(u)
+
+        for i in range(n - 1, -1, -1):
+            u = nodes[i]
+            if left[i] != -1:
+                u.left = nodes[left[i]]
+                u.left.parent = u
+            if right[i] != -1:
+                u.right = nodes[right[i]]
+                u.right.parent = u
+            self._update_node(u)
+
+        self._root = nodes[0] if n > 0 else None
+        self._n = n
+        assert validate(is_bst, self)
+
+    def _dump_node_flags(self, u: _BSTNode) -> int:
+        """Returns the bits, other than the lowest two ones, of the shape byte
+        of u written by dump.
+
+        Sub-classes which need to store further per-node information should
+        override this method and self._load_node_flags."""
+        return 0
+
+    def _load_node_flags(self, u: _BSTNode, flags: int) -> None:
+        """Restores the per-node information of u from the shape byte flags,
+        written by dump."""
+        pass
+
+    def __getstate__(self):
+        """Pickles this tree using dump, instead of recursively pickling its
+        nodes, so that it can be pickled regardless of its height."""
+        state = self.__dict__.copy()
+        del state["_root"]
+        fp = io.BytesIO()
+        self.dump(fp)
+        state["_dump"] = fp.getvalue()
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        dump = state.pop("_dump")
+        self.__dict__.update(state)
+        self._root = None
+        self._load(io.BytesIO(dump))
+
     def in_order_traversal(self) -> None:
         """Prints the elements of the tree in increasing order.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         self._in_order_traversal(self._root)
         print("\n")
 
@@ -714,7 +1387,7 @@ class BST:
         left child node and then its right child node.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         self._pre_order_traversal(self._root)
         print("\n")
 
@@ -729,7 +1402,7 @@ class BST:
         pre_order_traversal.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         self._post_order_traversal(self._root)
         print("\n")
 
@@ -744,7 +1417,7 @@ class BST:
         opposite of self.in_order_traversal.
 
         Time complexity: O(h)."""
-        assert is_bst(self)
+        assert validate(is_bst, self)
         self._reverse_in_order_traversal(self._root)
         print("\n")
 
@@ -822,35 +1495,63 @@ def has_bst_property(n: _BSTNode) -> bool:
     each node u, all nodes in its left sub-tree are smaller than u, and all
     nodes in its right sub-tree are greater than u.
 
-    It also checks that parent pointers are correctly set up."""
-    if n is not None:
-        if n.left and n.key < n.left.key:
-            return False
-        if n.right and n.key > n.right.key:
-            return False
+    It also checks that parent pointers are correctly set up.
 
-        # Asserting n.left and n.right have n as parent.
-        if n.left:
-            if n.left.parent != n:
+    The tree is visited iteratively, so that it can be checked regardless of
+    its height."""
+    stack = [n] if n is not None else []
+    while stack:
+        u = stack.pop()
+        if u.left:
+            if u.key < u.left.key:
+                return False
+            # Asserting u.left has u as parent.
+            if u.left.parent != u:
+                return False
+            stack.append(u.left)
+        if u.right:
+            if u.key > u.right.key:
                 return False
-        if n.right:
-            if n.right.parent != n:
+            # Asserting u.right has u as parent.
+            if u.right.parent != u:
                 return False
+            stack.append(u.right)
+    return True
+
 
-        return has_bst_property(n.left) and has_bst_property(n.right)
+def has_consistent_sizes(n: _BSTNode) -> bool:
+    """Returns true if, for each node u under n (including n), u.size is equal
+    to the number of nodes in the subtree rooted at u, false otherwise.
 
+    It suffices to check that the size of each node is the sum of the sizes of
+    its children plus one: by induction, from the leaves up, all sizes are then
+    correct. So, the nodes can be visited iteratively, in any order."""
+    stack = [n] if n is not None else []
+    while stack:
+        u = stack.pop()
+        if u.size != BST._size(u.left) + BST._size(u.right) + 1:
+            return False
+        if u.left is not None:
+            stack.append(u.left)
+        if u.right is not None:
+            stack.append(u.right)
     return True
 
 
 def all_bst_nodes(n: _BSTNode) -> bool:
     """Returns true if all nodes under n (including n) are instances of _BSTNode,
     false otherwise."""
-    if n is not None:
-        # If either n or its parent are not instances of _BSTNode.
-        if (not isinstance(n, _BSTNode) or
-                (n.parent is not None and not isinstance(n.parent, _BSTNode))):
+    stack = [n] if n is not None else []
+    while stack:
+        u = stack.pop()
+        # If either u or its parent are not instances of _BSTNode.
+        if (not isinstance(u, _BSTNode) or
+                (u.parent is not None and not isinstance(u.parent, _BSTNode))):
             return False
-        return all_bst_nodes(n.left) and all_bst_nodes(n.right)
+        if u.left is not None:
+            stack.append(u.left)
+        if u.right is not None:
+            stack.append(u.right)
     return True
 
 
@@ -863,4 +1564,5 @@ def is_bst(t: BST) -> bool:
         return False
     if t._root and t._root.parent is not None:
         return False
-    return all_bst_nodes(t._root) and has_bst_property(t._root)
+    return (all_bst_nodes(t._root) and has_bst_property(t._root) and
+            has_consistent_sizes(t._root))
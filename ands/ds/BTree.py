@@ -0,0 +1,793 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A B-tree is a self-balancing search tree in which each node can contain more
+than one key and have more than two children. It is usually described in terms
+of its minimum degree t >= 2:
+
+1. Every node other than the root contains at least t - 1 keys, and so at least
+t children, if it is an internal node, and the root contains at least one key,
+if the tree is not empty.
+
+2. Every node contains at most 2t - 1 keys, and so at most 2t children, if it
+is an internal node.
+
+3. The keys of each node are sorted, and the keys of the i-th child of a node
+are between the (i - 1)-th and the i-th keys of the node.
+
+4. All leaves have the same depth, which is the height of the tree.
+
+Hence, the height of a B-tree with n keys is at most log_t((n + 1) / 2), so
+all operations only visit O(log_t(n)) nodes, instead of the O(log₂(n)) nodes
+visited by a binary-search tree, like ands.ds.RBT. Within each node, keys are
+searched using binary search (see the bisect module), whose loop is executed in
+C, and keys are inserted into and removed from Python lists, which move
+pointers using memmove. So, although O(t) work is done in each node, following
+a node pointer and executing Python code is a lot more expensive than these
+operations, and, for large enough t (e.g. 32 or 64), a B-tree is considerably
+faster than a binary-search tree in CPython.
+
+B-trees are usually used to store data on disk, where each node is a disk
+block, but the same reasoning applies to the CPU caches.
+
+Similarly to ands.ds.BST, each node also keeps the number of keys in the
+subtree rooted at it, so that rank, select and count_between also only visit
+O(log_t(n)) nodes.
+
+This implementation is a sorted map (see the doc-strings of the class BTree):
+differently from ands.ds.BST, duplicate keys are not allowed.
+
+# References
+
+- Chapter 18 of Introduction to Algorithms (3rd ed.) by CLRS
+- https://en.wikipedia.org/wiki/B-tree
+- https://docs.python.org/3/library/bisect.html
+"""
+
+from bisect import bisect_left, bisect_right
+
+from ands.validation import validate
+
+__all__ = ["BTree", "is_btree"]
+
+
+class _BTreeNode:
+    """Node of a BTree.
+
+    children is None if the node is a leaf, otherwise it is a list containing
+    len(keys) + 1 nodes."""
+
+    __slots__ = ("keys", "values", "children", "size")
+
+    def __init__(self, keys=None, values=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.children = children
+        # Number of keys in the subtree rooted at self.
+        self.size = len(self.keys)
+        if children is not None:
+            self.size += sum(c.size for c in children)
+
+    def is_leaf(self) -> bool:
+        return self.children is None
+
+    def __str__(self):
+        return str(self.keys)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def _is_strictly_increasing(keys: list) -> bool:
+    return all(keys[i] < keys[i + 1] for i in range(len(keys) - 1))
+
+
+class BTree:
+    """B-tree which maps keys to values, where t is the minimum degree of the
+    tree, so that each node has at most 2t children.
+
+    It provides the same public interface as ands.ds.BST and ands.ds.RBT, but
+    it does not allow duplicate keys: inserting a key which is already in the
+    tree replaces the value associated with it.
+
+    It's the responsibility of the client of this class to make sure that keys
+    provided to the methods of this class are comparable among them."""
+
+    def __init__(self, t: int = 32):
+        if not isinstance(t, int):
+            raise TypeError("t must be an instance of int")
+        if t < 2:
+            raise ValueError("t must be greater than or equal to 2")
+        self._t = t
+        self._root = _BTreeNode()
+        assert validate(is_btree, self)
+
+    @property
+    def t(self) -> int:
+        """Returns the minimum degree of this tree."""
+        return self._t
+
+    @property
+    def size(self) -> int:
+        """Returns the number of keys in this tree.
+
+        Time complexity: O(1)."""
+        return self._root.size
+
+    def is_empty(self) -> bool:
+        """Returns true if this tree contains no keys, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._root.size == 0
+
+    def clear(self) -> None:
+        """Removes all keys from this tree.
+
+        Time complexity: O(1)."""
+        self._root = _BTreeNode()
+
+    def height(self) -> int:
+        """Returns the number of levels of this tree, i.e. the number of nodes
+        on any path from the root to a leaf, or 0 if it is empty.
+
+        Time complexity: O(log_t(n))."""
+        if self.is_empty():
+            return 0
+        h = 1
+        x = self._root
+        while not x.is_leaf():
+            h += 1
+            x = x.children[0]
+        return h
+
+    # Bulk loading.
+
+    @classmethod
+    def from_sorted(cls, iterable, t: int = 32) -> "BTree":
+        """Creates and returns a new BTree with minimum degree t containing the
+        keys in iterable, which must be in strictly increasing order, without
+        calling insert. All keys are associated with None.
+
+        The tree is built bottom-up with the smallest possible height, and the
+        keys are evenly distributed among the children of each node.
+
+        Time complexity: O(n)."""
+        keys = list(iterable)
+        if any(key is None for key in keys):
+            raise ValueError("keys cannot be None")
+        assert validate(_is_strictly_increasing, keys)
+
+        tree = cls(t)
+        if keys:
+            h = 1
+            while (2 * t) ** h - 1 < len(keys):
+                h += 1
+            tree._root = tree._build(keys, 0, len(keys), h, True)
+
+        assert validate(is_btree, tree)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, t: int = 32) -> "BTree":
+        """Creates and returns a new BTree with minimum degree t containing the
+        keys in iterable, which do not need to be sorted, by first sorting
+        them, removing the duplicates, and then calling from_sorted.
+
+        Time complexity: O(n * log₂(n))."""
+        keys = list(iterable)
+        if any(key is None for key in keys):
+            raise ValueError("keys cannot be None")
+        keys.sort()
+        unique = [k for i, k in enumerate(keys) if i == 0 or keys[i - 1] < k]
+        return cls.from_sorted(unique, t)
+
+    def _build(self, keys: list, lo: int, hi: int, h: int,
+               is_root: bool) -> _BTreeNode:
+        """Builds a subtree of height h containing the keys in keys[lo:hi], and
+        returns its root.
+
+        Let M = (2t)^(h - 1) - 1 be the maximum number of keys of a subtree of
+        height h - 1. The root of the subtree has c = ceil((m + 1) / (M + 1))
+        children, where m = hi - lo, but at least t (or 2, if it's the root of
+        the whole tree), and each child gets either floor((m - c + 1) / c) or
+        ceil((m - c + 1) / c) keys, which can be shown to be between the minimum
+        and the maximum number of keys of a subtree of height h - 1.
+
+        Time complexity: O(hi - lo)."""
+        m = hi - lo
+        if h == 1:
+            return _BTreeNode(keys[lo:hi], [None] * m)
+
+        t = self._t
+        max_child_keys = (2 * t) ** (h - 1) - 1
+        c = max(-(-(m + 1) // (max_child_keys + 1)), 2 if is_root else t)
+        q, r = divmod(m - c + 1, c)
+
+        node_keys = []
+        children = []
+        start = lo
+        for j in range(c):
+            end = start + q + (1 if j < r else 0)
+            children.append(self._build(keys, start, end, h - 1, False))
+            if j < c - 1:
+                node_keys.append(keys[end])
+            start = end + 1
+
+        assert start == hi + 1
+        return _BTreeNode(node_keys, [None] * len(node_keys), children)
+
+    # Search.
+
+    def _search(self, key: object) -> tuple:
+        """Returns the tuple (x, i) such that x.keys[i] == key, or (None, -1) if
+        key is not in this tree.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        x = self._root
+        while True:
+            i = bisect_left(x.keys, key)
+            if i < len(x.keys) and not key < x.keys[i]:
+                return x, i
+            if x.is_leaf():
+                return None, -1
+            x = x.children[i]
+
+    def contains(self, key: object) -> bool:
+        """Returns true if key is in this tree, false otherwise.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._search(key)[0] is not None
+
+    def __contains__(self, key: object) -> bool:
+        return self.contains(key)
+
+    def get(self, key: object, default: object = None) -> object:
+        """Returns the value associated with key, if key is in this tree,
+        otherwise default.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        x, i = self._search(key)
+        return x.values[i] if x is not None else default
+
+    def __getitem__(self, key: object) -> object:
+        """Returns the value associated with key.
+
+        If key is not in this tree, KeyError is raised.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        x, i = self._search(key)
+        if x is None:
+            raise KeyError(key)
+        return x.values[i]
+
+    def __setitem__(self, key: object, value: object) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: object) -> None:
+        """Deletes key, and its associated value, from this tree.
+
+        If key is not in this tree, KeyError is raised.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        if key is not None and self._search(key)[0] is None:
+            raise KeyError(key)
+        self.delete(key)
+
+    def minimum(self) -> object:
+        """Returns the smallest key in this tree, or None if it is empty.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if not self.is_empty():
+            x, i = self._minimum(self._root)
+            return x.keys[i]
+
+    def maximum(self) -> object:
+        """Returns the greatest key in this tree, or None if it is empty.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if not self.is_empty():
+            x, i = self._maximum(self._root)
+            return x.keys[i]
+
+    @staticmethod
+    def _minimum(x: _BTreeNode) -> tuple:
+        while not x.is_leaf():
+            x = x.children[0]
+        return x, 0
+
+    @staticmethod
+    def _maximum(x: _BTreeNode) -> tuple:
+        while not x.is_leaf():
+            x = x.children[-1]
+        return x, len(x.keys) - 1
+
+    def successor(self, key: object) -> object:
+        """Returns the smallest key greater than key, or None if key does not
+        have a successor.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        if not self.contains(key):
+            raise LookupError("key not in this BTree")
+        return self._closest(key, bisect_right, False)
+
+    def predecessor(self, key: object) -> object:
+        """Returns the greatest key smaller than key, or None if key does not
+        have a predecessor.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        if not self.contains(key):
+            raise LookupError("key not in this BTree")
+        return self._closest(key, bisect_left, True)
+
+    def floor(self, key: object) -> object:
+        """Returns the greatest key in this tree which is less than or equal to
+        key, or None if there's no such key.
+
+        key does not need to be in this tree.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._closest(key, bisect_right, True)
+
+    def ceiling(self, key: object) -> object:
+        """Returns the smallest key in this tree which is greater than or equal
+        to key, or None if there's no such key.
+
+        key does not need to be in this tree.
+
+        Time complexity: O(log_t(n)) nodes are visited."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._closest(key, bisect_left, False)
+
+    def _closest(self, key: object, bisect, below: bool) -> object:
+        """If below is true, returns the greatest key before the position where
+        bisect would insert key, otherwise the smallest key after it.
+
+        floor, ceiling, predecessor and successor respectively correspond to
+        (bisect_right, True), (bisect_left, False), (bisect_left, True) and
+        (bisect_right, False)."""
+        best = None
+        x = self._root
+        while True:
+            i = bisect(x.keys, key)
+            if below:
+                if i > 0:
+                    best = x.keys[i - 1]
+            elif i < len(x.keys):
+                best = x.keys[i]
+            if x.is_leaf():
+                return best
+            x = x.children[i]
+
+    # Order statistics.
+
+    def rank(self, key: object) -> int:
+        """Returns the number of keys strictly less than key.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(t * log_t(n))."""
+        if not self.contains(key):
+            raise LookupError("key was not found")
+        return self._rank(key, False)
+
+    def _rank(self, key: object, inclusive: bool) -> int:
+        """Returns the number of keys strictly less than key, if inclusive is
+        false, otherwise the number of keys less than or equal to key.
+
+        Time complexity: O(t * log_t(n))."""
+        bisect = bisect_right if inclusive else bisect_left
+        r = 0
+        x = self._root
+        while True:
+            i = bisect(x.keys, key)
+            r += i
+            if x.is_leaf():
+                return r
+            for j in range(i):
+                r += x.children[j].size
+            x = x.children[i]
+
+    def select(self, k: int) -> object:
+        """Returns the key of rank k, i.e. the (k + 1)th smallest key, in this
+        tree.
+
+        If k is not in the range [0, size), ValueError is raised.
+
+        Time complexity: O(t * log_t(n))."""
+        assert validate(is_btree, self)
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0 or k >= self.size:
+            raise ValueError("k must be in the range [0, size)")
+
+        x = self._root
+        while not x.is_leaf():
+            for j, c in enumerate(x.children):
+                if k < c.size:
+                    x = c
+                    break
+                elif k == c.size:
+                    return x.keys[j]
+                k -= c.size + 1
+        return x.keys[k]
+
+    def count_between(self, lo: object, hi: object) -> int:
+        """Returns the number of keys k in this tree such that lo <= k <= hi.
+
+        Neither lo nor hi need to be in this tree.
+
+        Time complexity: O(t * log_t(n))."""
+        assert validate(is_btree, self)
+        if lo is None or hi is None:
+            raise ValueError("lo and hi cannot be None")
+        if hi < lo:
+            return 0
+        return self._rank(hi, True) - self._rank(lo, False)
+
+    # Insertion.
+
+    def insert(self, key: object, value: object = None) -> None:
+        """Inserts key, associated with value, into this tree. If key is
+        already in this tree, the value associated with it is replaced.
+
+        Full nodes are split on the way down from the root, so that the leaf
+        where key is inserted is never full, as described in CLRS.
+
+        Time complexity: O(t * log_t(n))."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        x, i = self._search(key)
+        if x is not None:
+            x.values[i] = value
+            return
+
+        t = self._t
+        r = self._root
+        if len(r.keys) == 2 * t - 1:
+            self._root = _BTreeNode(children=[r])
+            self._split_child(self._root, 0)
+
+        x = self._root
+        while True:
+            x.size += 1
+            i = bisect_right(x.keys, key)
+            if x.is_leaf():
+                x.keys.insert(i, key)
+                x.values.insert(i, value)
+                break
+            if len(x.children[i].keys) == 2 * t - 1:
+                self._split_child(x, i)
+                if x.keys[i] < key:
+                    i += 1
+            x = x.children[i]
+
+        assert validate(is_btree, self)
+
+    def _split_child(self, x: _BTreeNode, i: int) -> None:
+        """Splits the full child y = x.children[i] into two nodes with t - 1
+        keys each, and moves the median key of y up to x.
+
+        Time complexity: O(t)."""
+        t = self._t
+        y = x.children[i]
+        assert len(y.keys) == 2 * t - 1
+
+        z = _BTreeNode(y.keys[t:], y.values[t:],
+                       None if y.is_leaf() else y.children[t:])
+        x.keys.insert(i, y.keys[t - 1])
+        x.values.insert(i, y.values[t - 1])
+        x.children.insert(i + 1, z)
+
+        del y.keys[t - 1:]
+        del y.values[t - 1:]
+        if not y.is_leaf():
+            del y.children[t:]
+        y.size -= z.size + 1
+
+    # Deletion.
+
+    def delete(self, key: object) -> None:
+        """Deletes key from this tree.
+
+        If key is not in this tree, LookupError is raised.
+
+        Before descending into a child, it is made sure that the child contains
+        at least t keys, by moving a key from a sibling or by merging it with a
+        sibling, so that a key can be removed from a leaf without further
+        restructuring, as described in CLRS.
+
+        Time complexity: O(t * log_t(n))."""
+        assert validate(is_btree, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+        if self._search(key)[0] is None:
+            raise LookupError("key not in this BTree")
+
+        self._delete(self._root, key)
+
+        # The root can become empty after a merge of its only two children.
+        if not self._root.keys and not self._root.is_leaf():
+            self._root = self._root.children[0]
+
+        assert validate(is_btree, self)
+
+    def _delete(self, x: _BTreeNode, key: object) -> None:
+        """Deletes key from the subtree rooted at x, which must contain key.
+
+        x must contain at least t keys, unless it's the root."""
+        t = self._t
+        x.size -= 1
+        i = bisect_left(x.keys, key)
+
+        if i < len(x.keys) and not key < x.keys[i]:  # key is in x.
+            if x.is_leaf():
+                del x.keys[i]
+                del x.values[i]
+            elif len(x.children[i].keys) >= t:
+                # Replace key with its predecessor.
+                y = x.children[i]
+                p, j = BTree._maximum(y)
+                x.keys[i], x.values[i] = p.keys[j], p.values[j]
+                self._delete(y, p.keys[j])
+            elif len(x.children[i + 1].keys) >= t:
+                # Replace key with its successor.
+                z = x.children[i + 1]
+                s, j = BTree._minimum(z)
+                x.keys[i], x.values[i] = s.keys[j], s.values[j]
+                self._delete(z, s.keys[j])
+            else:
+                self._merge_children(x, i)
+                self._delete(x.children[i], key)
+            return
+
+        assert not x.is_leaf()
+
+        if len(x.children[i].keys) == t - 1:
+            if i > 0 and len(x.children[i - 1].keys) >= t:
+                self._move_from_left_sibling(x, i)
+            elif (i < len(x.children) - 1 and
+                  len(x.children[i + 1].keys) >= t):
+                self._move_from_right_sibling(x, i)
+            elif i < len(x.children) - 1:
+                self._merge_children(x, i)
+            else:
+                self._merge_children(x, i - 1)
+                i -= 1
+
+        self._delete(x.children[i], key)
+
+    @staticmethod
+    def _merge_children(x: _BTreeNode, i: int) -> None:
+        """Merges x.children[i + 1] and the key x.keys[i] into x.children[i].
+
+        Time complexity: O(t)."""
+        y, z = x.children[i], x.children[i + 1]
+        y.keys.append(x.keys.pop(i))
+        y.values.append(x.values.pop(i))
+        y.keys.extend(z.keys)
+        y.values.extend(z.values)
+        if not y.is_leaf():
+            y.children.extend(z.children)
+        y.size += z.size + 1
+        del x.children[i + 1]
+
+    @staticmethod
+    def _move_from_left_sibling(x: _BTreeNode, i: int) -> None:
+        """Moves the key x.keys[i - 1] down to x.children[i], and the greatest
+        key of x.children[i - 1] up to x, together with its right child.
+
+        Time complexity: O(t)."""
+        c, left = x.children[i], x.children[i - 1]
+        c.keys.insert(0, x.keys[i - 1])
+        c.values.insert(0, x.values[i - 1])
+        x.keys[i - 1] = left.keys.pop()
+        x.values[i - 1] = left.values.pop()
+        moved = 1
+        if not left.is_leaf():
+            child = left.children.pop()
+            c.children.insert(0, child)
+            moved += child.size
+        c.size += moved
+        left.size -= moved
+
+    @staticmethod
+    def _move_from_right_sibling(x: _BTreeNode, i: int) -> None:
+        """Moves the key x.keys[i] down to x.children[i], and the smallest key
+        of x.children[i + 1] up to x, together with its left child.
+
+        Time complexity: O(t)."""
+        c, right = x.children[i], x.children[i + 1]
+        c.keys.append(x.keys[i])
+        c.values.append(x.values[i])
+        x.keys[i] = right.keys.pop(0)
+        x.values[i] = right.values.pop(0)
+        moved = 1
+        if not right.is_leaf():
+            child = right.children.pop(0)
+            c.children.append(child)
+            moved += child.size
+        c.size += moved
+        right.size -= moved
+
+    def remove_min(self) -> None:
+        """Removes the smallest key from this tree, if it is not empty.
+
+        Time complexity: O(t * log_t(n))."""
+        self.pop_min()
+
+    def remove_max(self) -> None:
+        """Removes the greatest key from this tree, if it is not empty.
+
+        Time complexity: O(t * log_t(n))."""
+        self.pop_max()
+
+    def pop_min(self) -> tuple:
+        """Removes the smallest key from this tree and returns it together with
+        its associated value as a tuple (key, value), or returns None if this
+        tree is empty.
+
+        Time complexity: O(t * log_t(n))."""
+        if self.is_empty():
+            return None
+        x, i = BTree._minimum(self._root)
+        item = x.keys[i], x.values[i]
+        self.delete(item[0])
+        return item
+
+    def pop_max(self) -> tuple:
+        """Removes the greatest key from this tree and returns it together with
+        its associated value as a tuple (key, value), or returns None if this
+        tree is empty.
+
+        Time complexity: O(t * log_t(n))."""
+        if self.is_empty():
+            return None
+        x, i = BTree._maximum(self._root)
+        item = x.keys[i], x.values[i]
+        self.delete(item[0])
+        return item
+
+    # Iteration.
+
+    def _iter_items(self, x: _BTreeNode, lo: object, hi: object,
+                    reverse: bool):
+        """Generator which yields the tuples (key, value) of the subtree rooted
+        at x whose keys are between lo and hi (both included) in increasing
+        order, or in decreasing order if reverse is true.
+
+        If lo (or hi) is None, there's no lower (or upper) bound. Only the
+        children of x which can contain keys in the range are visited."""
+        i = 0 if lo is None else bisect_left(x.keys, lo)
+        j = len(x.keys) if hi is None else bisect_right(x.keys, hi)
+        leaf = x.is_leaf()
+
+        if not reverse:
+            for k in range(i, j):
+                if not leaf:
+                    yield from self._iter_items(x.children[k], lo, hi, False)
+                yield x.keys[k], x.values[k]
+            if not leaf:
+                yield from self._iter_items(x.children[j], lo, hi, False)
+        else:
+            if not leaf:
+                yield from self._iter_items(x.children[j], lo, hi, True)
+            for k in range(j - 1, i - 1, -1):
+                yield x.keys[k], x.values[k]
+                if not leaf:
+                    yield from self._iter_items(x.children[k], lo, hi, True)
+
+    def iter_range(self, lo: object, hi: object, reverse: bool = False):
+        """Returns a generator which lazily yields, in increasing order (or in
+        decreasing order, if reverse is true), the keys k of this tree such that
+        lo <= k <= hi.
+
+        Neither lo nor hi need to be in this tree. This tree should not be
+        modified while the returned generator is being used.
+
+        Time complexity: O(log_t(n) + k / t) nodes are visited, where k is the
+        number of yielded keys."""
+        if lo is None or hi is None:
+            raise ValueError("lo and hi cannot be None")
+        return (k for k, _ in self._iter_items(self._root, lo, hi, reverse))
+
+    def items(self, lo: object = None, hi: object = None):
+        """Returns a generator which lazily yields, in increasing order of the
+        keys, the tuples (key, value) of this tree such that lo <= key <= hi.
+
+        If lo (or hi) is None, there's no lower (or upper) bound."""
+        return self._iter_items(self._root, lo, hi, False)
+
+    def __iter__(self):
+        """Returns a generator which lazily yields the keys of this tree in
+        increasing order.
+
+        Time complexity: O(n) to yield all keys."""
+        return (k for k, _ in self._iter_items(self._root, None, None, False))
+
+    def __reversed__(self):
+        """Returns a generator which lazily yields the keys of this tree in
+        decreasing order.
+
+        Time complexity: O(n) to yield all keys."""
+        return (k for k, _ in self._iter_items(self._root, None, None, True))
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def is_btree(t: BTree) -> bool:
+    """Returns true if t is a valid BTree object, false otherwise."""
+    if not isinstance(t, BTree):
+        return False
+
+    leaf_depths = set()
+
+    def h(x: _BTreeNode, depth: int, lo: object, hi: object) -> int:
+        # Returns the number of keys under x, or -1 if an invariant is violated.
+        if not isinstance(x, _BTreeNode) or len(x.keys) != len(x.values):
+            return -1
+        if len(x.keys) > 2 * t.t - 1:
+            return -1
+        if x is not t._root and len(x.keys) < t.t - 1:
+            return -1
+        if not _is_strictly_increasing(x.keys):
+            return -1
+        if x.keys and ((lo is not None and not lo < x.keys[0]) or
+                       (hi is not None and not x.keys[-1] < hi)):
+            return -1
+
+        size = len(x.keys)
+        if x.is_leaf():
+            leaf_depths.add(depth)
+        else:
+            if len(x.children) != len(x.keys) + 1:
+                return -1
+            bounds = [lo] + x.keys + [hi]
+            for i, c in enumerate(x.children):
+                s = h(c, depth + 1, bounds[i], bounds[i + 1])
+                if s == -1:
+                    return -1
+                size += s
+
+        return size if size == x.size else -1
+
+    if not t._root.is_leaf() and not t._root.keys:
+        return False
+
+    return h(t._root, 0, None, None) != -1 and len(leaf_depths) == 1
@@ -8,12 +8,38 @@ Author: Nelson Brochado
 
 Created: 01/07/2015
 
-Updated: 06/04/2018
+Updated: 16/10/2026
 
 # Description
 
 Contains the abstract class BinaryHeap.
 
+## Key functions
+
+A heap can be given a key function, like the built-in function sorted, so that
+elements are ordered by the keys computed by it, instead of being compared
+directly. Keys are computed only once per element, when the element is added,
+and are stored in a list parallel to the list of the elements, self.heap,
+rather than in a tuple or in another wrapper object per element.
+
+Elements with equal keys are ordered by insertion order (FIFO), so that the
+heap is stable. For this purpose, the heap also keeps a list, parallel to
+self.heap, with the value of an insertion counter for each element. So, when a
+key function is given, no comparisons between elements are ever performed.
+
+## Batch operations
+
+add_many adds k elements to a heap of n elements either by pushing up each of
+them, which takes O(k * log(n + k)) time in the worst case, or by appending all
+of them and rebuilding the heap with Floyd's algorithm, which takes Θ(n + k)
+time, depending on which of the two bounds is smaller.
+
+The k elements of highest priority of a heap can be inspected without
+modifying it, in O(k * log(k)) time, by a best-first visit of the heap, which
+starts from the root and keeps the indices of the candidate elements in an
+auxiliary heap (the frontier), since the next element, in order of priority,
+is always a child of an element already visited.
+
 # References
 
 - Slides by prof. A. Carzaniga
@@ -31,6 +57,8 @@ import io
 import math
 from abc import ABC, abstractmethod
 
+from ands.validation import OFF, set_validation_level
+
 __all__ = ["BinaryHeap", "build_pretty_binary_heap"]
 
 
@@ -39,8 +67,8 @@ class BinaryHeap(ABC):
 
     This binary heap allows duplicates.
 
-    It's the responsibility of the client to ensure that inserted elements are
-    comparable among them.
+    It's the responsibility of the client to ensure that inserted elements (or
+    their keys, if a key function is given) are comparable among them.
 
     Their order also defines their priority.
 
@@ -51,13 +79,25 @@ class BinaryHeap(ABC):
     - clear
     - add
     - contains
+    - add_many
     - delete
     - merge
 
-    MinHeap, MaxHeap and MinMaxHeap all derive from this class."""
+    MinHeap, MaxHeap and MinMaxHeap all derive from this class. Only MinHeap and
+    MaxHeap accept a key function (see the doc-string of this module)."""
 
-    def __init__(self, ls=None):
+    def __init__(self, ls=None, key=None):
+        if key is not None and not callable(key):
+            raise TypeError("key must be callable")
         self.heap = [] if not isinstance(ls, list) else ls
+        self._key = key
+        if key is None:
+            # Elements are compared directly.
+            self._keys = self._order = None
+        else:
+            self._keys = [key(x) for x in self.heap]
+            self._order = list(range(len(self.heap)))
+        self._counter = len(self.heap)
         self._build_heap()
 
     @property
@@ -78,6 +118,9 @@ class BinaryHeap(ABC):
 
         Time complexity: O(1)."""
         self.heap.clear()
+        if self._keys is not None:
+            self._keys.clear()
+            self._order.clear()
 
     def add(self, x: object) -> None:
         """Adds object x to this heap.
@@ -88,10 +131,25 @@ class BinaryHeap(ABC):
         Time complexity: O(log n)."""
         if x is None:
             raise ValueError("x cannot be None")
-        self.heap.append(x)
+        self._append(x)
         if self.size > 1:
             self._push_up(self.size - 1)
 
+    def add_many(self, xs) -> None:
+        """Adds all objects of the iterable xs to this heap.
+
+        If xs contains None, ValueError is raised, and this heap is not
+        modified.
+
+        Time complexity: O(min(k * log(n + k), n + k)), where k is the number of
+        objects in xs."""
+        xs = list(xs)
+        if any(x is None for x in xs):
+            raise ValueError("xs cannot contain None")
+        for x in xs:
+            self._append(x)
+        self._restore_after_append(len(xs))
+
     def contains(self, x: object) -> bool:
         """Returns true if x is in this heap, false otherwise.
 
@@ -115,20 +173,108 @@ class BinaryHeap(ABC):
 
         # self has at least one element.
         if i == self.size - 1:
-            self.heap.pop()
+            self._pop_last()
         else:
             self._swap(i, self.size - 1)
-            self.heap.pop()
+            self._pop_last()
             self._push_down(i)
             self._push_up(i)
 
     def merge(self, o: "Heap") -> None:
         """Merges this heap with the o heap.
 
+        If this heap has a key function, it is also used for the elements of
+        o, which are considered to be added after the elements of this heap.
+
         Time complexity: O(n + m)."""
-        self.heap += o.heap
+        if self._keys is None:
+            self.heap += o.heap
+        else:
+            for x in o.heap:
+                self._append(x)
         self._build_heap()
 
+    def _append(self, x: object) -> None:
+        """Appends x to self.heap, together with its key and insertion counter,
+        if this heap has a key function, without restoring the heap property.
+
+        Time complexity: O(1), plus the time to compute the key of x."""
+        self.heap.append(x)
+        if self._keys is not None:
+            self._keys.append(self._key(x))
+            self._order.append(self._counter)
+        self._counter += 1
+
+    def _restore_after_append(self, k: int) -> None:
+        """Restores the heap property after the last k elements of self.heap
+        have been appended to it, either by pushing up each of them or by
+        rebuilding the whole heap, depending on which is cheaper.
+
+        Pushing up k elements costs O(k * log(n)) in the worst case, whereas
+        rebuilding the heap always costs Θ(n), where n is the size of this heap
+        after the k elements have been appended.
+
+        Time complexity: O(min(k * log(n), n))."""
+        n = self.size
+        if k <= 0:
+            return
+        if k * math.log2(n + 1) > n:
+            self._build_heap()
+        else:
+            for i in range(n - k, n):
+                self._push_up(i)
+
+    def _remove_root(self) -> object:
+        """Removes and returns the element at the root of this heap, which must
+        not be empty, without validating it.
+
+        Time complexity: O(log(n))."""
+        assert not self.is_empty()
+        self._swap(0, self.size - 1)
+        m = self._pop_last()
+        if not self.is_empty():
+            self._push_down(0)
+        return m
+
+    def _peek_many(self, k: int, frontier: "BinaryHeap") -> list:
+        """Returns a list with the min(k, n) elements of highest priority of
+        this heap, in order of priority, without modifying this heap.
+
+        frontier must be an empty heap of the same kind of this heap, whose key
+        function maps an index of self.heap to the key with which the element
+        at that index is ordered in this heap (including the insertion counter
+        of the element, if this heap has a key function).
+
+        Time complexity: O(k * log(k))."""
+        _check_k(k)
+        # The frontier never has more than O(k) elements, so it is not
+        # validated, otherwise this method would take O(k²) time.
+        set_validation_level(OFF, frontier)
+        result = []
+        if k > 0 and not self.is_empty():
+            frontier.add(0)
+        while len(result) < k and not frontier.is_empty():
+            i = frontier._remove_root()
+            result.append(self.heap[i])
+            frontier.add_many(self._children_indices(i))
+        return result
+
+    def _children_indices(self, i: int) -> range:
+        """Returns the indices of the children of the node at index i.
+
+        Time complexity: O(1)."""
+        return range(2 * i + 1, min(2 * i + 3, self.size))
+
+    def _pop_last(self) -> object:
+        """Removes and returns the last element of self.heap, together with its
+        key and insertion counter, if this heap has a key function.
+
+        Time complexity: O(1)."""
+        if self._keys is not None:
+            self._keys.pop()
+            self._order.pop()
+        return self.heap.pop()
+
     @abstractmethod
     def _push_down(self, i: int) -> None:
         """Classical "heapify" operation for heaps."""
@@ -173,6 +319,11 @@ class BinaryHeap(ABC):
         Time complexity: O(1)."""
         assert self._is_good_index(i) and self._is_good_index(j)
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        if self._keys is not None:
+            keys = self._keys
+            keys[i], keys[j] = keys[j], keys[i]
+            order = self._order
+            order[i], order[j] = order[j], order[i]
 
     def _left_index(self, i: int) -> int:
         """Returns the left child's index of the node at index i, if it exists,
@@ -214,6 +365,13 @@ class BinaryHeap(ABC):
         return build_pretty_binary_heap(self.heap)
 
 
+def _check_k(k: int) -> None:
+    if not isinstance(k, int):
+        raise TypeError("k must be an instance of int")
+    if k < 0:
+        raise ValueError("k must be greater than or equal to 0")
+
+
 def build_pretty_binary_heap(heap: list, total_width=36, fill=" ") -> str:
     """Returns a string (which can be printed) representing heap as a tree.
 
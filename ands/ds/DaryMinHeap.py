@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A d-ary min-heap is a generalization of a binary min-heap (see the module
+MinHeap.py) in which each node has (at most) d children, instead of 2.
+
+If we have a node at index i, then
+
+- its children can be found at the indices d*i + 1, ..., d*i + d,
+
+- its parent can be found at index floor((i - 1) / d).
+
+A d-ary heap of n elements has height about log_d(n), instead of log₂(n), so
+pushing an element up, e.g. after an insertion, visits fewer levels, whereas
+pushing an element down, e.g. after removing the minimum, visits fewer levels,
+but needs d - 1 comparisons per level, in order to find the smallest child.
+Hence, heaps with a greater d are better for workloads where insertions (and
+decreases of keys) are more frequent than removals.
+
+Pushing an element up or down is implemented by moving the elements it passes
+into the "hole" left by it, and by storing it only once at its final index,
+instead of swapping it at each level. If the heap has a key function (see the
+module BinaryHeap.py), the key and the insertion counter of the element are
+moved together with it.
+
+# References
+
+- https://en.wikipedia.org/wiki/D-ary_heap
+- Introduction to Algorithms (3rd edition), problem 6-2, by CLRS
+"""
+
+from ands.ds.MinHeap import MinHeap
+
+__all__ = ["DaryMinHeap"]
+
+
+def _check_d(d: int) -> None:
+    if not isinstance(d, int):
+        raise TypeError("d must be an instance of int")
+    if d < 2:
+        raise ValueError("d must be greater than or equal to 2")
+
+
+class DaryMinHeap(MinHeap):
+    """Min-heap whose nodes have (at most) d children, with d >= 2.
+
+    Sub-class of MinHeap, and thus provides the same public interface."""
+
+    def __init__(self, ls=None, d: int = 4, key=None):
+        _check_d(d)
+        self.d = d
+        MinHeap.__init__(self, ls, key)
+
+    def _push_down(self, i: int) -> None:
+        """Pushes down the element at index i, until it is smaller than or
+        equal to all its children.
+
+        Time complexity: O(d * log_d(n))."""
+        if self._keys is not None:
+            self._push_down_with_keys(i)
+            return
+
+        heap = self.heap
+        n = len(heap)
+        d = self.d
+        x = heap[i]
+
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+
+            # Index of the smallest child.
+            m = first
+            for c in range(first + 1, min(first + d, n)):
+                if heap[c] < heap[m]:
+                    m = c
+
+            if not heap[m] < x:
+                break
+            heap[i] = heap[m]
+            i = m
+
+        heap[i] = x
+
+    def _push_up(self, i: int) -> None:
+        """Pushes up the element at index i, until it is greater than or equal
+        to its parent.
+
+        Time complexity: O(log_d(n))."""
+        if self._keys is not None:
+            self._push_up_with_keys(i)
+            return
+
+        heap = self.heap
+        d = self.d
+        x = heap[i]
+
+        while i > 0:
+            p = (i - 1) // d
+            if not x < heap[p]:
+                break
+            heap[i] = heap[p]
+            i = p
+
+        heap[i] = x
+
+    def _push_down_with_keys(self, i: int) -> None:
+        """Version of self._push_down for heaps with a key function, which
+        moves the keys and the insertion counters of the elements together with
+        the elements.
+
+        Time complexity: O(d * log_d(n))."""
+        heap = self.heap
+        keys = self._keys
+        order = self._order
+        n = len(heap)
+        d = self.d
+        x, k, o = heap[i], keys[i], order[i]
+
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+
+            # Index of the child which must be closest to the root.
+            m = first
+            for c in range(first + 1, min(first + d, n)):
+                if self._precedes(c, m):
+                    m = c
+
+            # Ties between equal keys are broken by insertion order.
+            km = keys[m]
+            if not (km < k or (not k < km and order[m] < o)):
+                break
+            heap[i], keys[i], order[i] = heap[m], km, order[m]
+            i = m
+
+        heap[i], keys[i], order[i] = x, k, o
+
+    def _push_up_with_keys(self, i: int) -> None:
+        """Version of self._push_up for heaps with a key function, which moves
+        the keys and the insertion counters of the elements together with the
+        elements.
+
+        Time complexity: O(log_d(n))."""
+        heap = self.heap
+        keys = self._keys
+        order = self._order
+        d = self.d
+        x, k, o = heap[i], keys[i], order[i]
+
+        while i > 0:
+            p = (i - 1) // d
+            kp = keys[p]
+            if not (k < kp or (not kp < k and o < order[p])):
+                break
+            heap[i], keys[i], order[i] = heap[p], kp, order[p]
+            i = p
+
+        heap[i], keys[i], order[i] = x, k, o
+
+    def _parent_index(self, i: int) -> int:
+        """Returns the parent's index of the node at index i.
+
+        If i = 0, then -1 is returned, because the root has no parent.
+
+        Time complexity: O(1)."""
+        assert self._is_good_index(i)
+        return -1 if i == 0 else (i - 1) // self.d
+
+    def _children_indices(self, i: int) -> range:
+        """Returns the indices of the (at most d) children of the node at index
+        i.
+
+        Time complexity: O(1)."""
+        first = self.d * i + 1
+        return range(first, min(first + self.d, self.size))
+
+    def _build_heap(self) -> None:
+        """Builds the heap with Floyd's algorithm, i.e. by pushing down all
+        elements which have children, from the last one to the root.
+
+        Time complexity: Θ(n)."""
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._push_down(i)
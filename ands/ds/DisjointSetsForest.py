@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 21/02/2016
 
-Updated: 20/08/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -66,7 +66,12 @@ __all__ = ["DisjointSetsForest"]
 
 class _DSFNode:
     """_DSFNode is the node used internally by DisjointSetsForest to represent
-    nodes in the disjoint trees (or sets)."""
+    nodes in the disjoint trees (or sets).
+
+    Its fields are declared in __slots__, so that nodes do not have a
+    per-instance __dict__."""
+
+    __slots__ = ("value", "rank", "parent", "next")
 
     def __init__(self, x, rank=0):
         # This attribute can contain any hashable value.
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+An indexed min-heap (or indexed priority queue) is a min-heap of distinct
+items, each associated with a priority, which also keeps a map from each item
+to its current index in the underlying list (its "position").
+
+Every time two elements of the heap are swapped, the positions of the
+corresponding items are updated, so that the position of any item can be found
+in O(1) time. This allows to check whether an item is in the heap in O(1) time,
+and to delete an item or to change its priority in O(log(n)) time, by pushing
+it up or down from its position, instead of first searching for it in O(n)
+time, as in MinHeap.
+
+Indexed min-heaps are typically used in algorithms like Dijkstra's or Prim's,
+where the priority of an item, e.g. the tentative distance of a vertex, can
+decrease after it has been added to the heap.
+
+Items must be hashable, and priorities comparable among them. Differently from
+MinHeap, items do not need to be comparable, since the heap is ordered by
+priority only.
+
+# References
+
+- http://algs4.cs.princeton.edu/24pq/IndexMinPQ.java.html
+- https://en.wikipedia.org/wiki/Priority_queue
+- Introduction to Algorithms (3rd edition), chapter 6.5, by CLRS
+"""
+
+from ands.ds.MinHeap import MinHeap, is_min_heap
+from ands.validation import validate
+
+__all__ = ["IndexedMinHeap", "is_indexed_min_heap"]
+
+
+class _Entry:
+    """An item together with its priority, i.e. an element of the list of an
+    IndexedMinHeap.
+
+    Entries are compared by priority only."""
+
+    __slots__ = ("item", "priority")
+
+    def __init__(self, item: object, priority: object):
+        self.item = item
+        self.priority = priority
+
+    def __lt__(self, other: "_Entry") -> bool:
+        return self.priority < other.priority
+
+    def __gt__(self, other: "_Entry") -> bool:
+        return other.priority < self.priority
+
+    def __str__(self):
+        return "(%s, %s)" % (self.item, self.priority)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class IndexedMinHeap(MinHeap):
+    """Min-heap of distinct hashable items, ordered by their priorities, which
+    supports contains in O(1) time, and delete, update_priority and
+    decrease_key in O(log(n)) time.
+
+    Public interface:
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - add_many
+    - contains
+    - priority
+    - update_priority
+    - decrease_key
+    - delete
+    - find_min
+    - remove_min
+    - pop_many
+    - peek_many
+    - merge"""
+
+    def __init__(self, items=None):
+        """Creates an indexed min-heap from items, an iterable of tuples (item,
+        priority), e.g. the items of a dict, if items is not None.
+
+        If an item occurs more than once, ValueError is raised.
+
+        Time complexity: O(n)."""
+        self._positions = {}
+        entries = []
+        if items is not None:
+            for item, priority in items:
+                self._check_item_and_priority(item, priority)
+                if item in self._positions:
+                    raise ValueError("items must be distinct")
+                self._positions[item] = len(entries)
+                entries.append(_Entry(item, priority))
+        MinHeap.__init__(self, entries)
+        assert validate(is_indexed_min_heap, self)
+
+    @staticmethod
+    def _check_item_and_priority(item: object, priority: object) -> None:
+        if item is None:
+            raise ValueError("item cannot be None")
+        if priority is None:
+            raise ValueError("priority cannot be None")
+
+    def clear(self) -> None:
+        """Removes all items from this heap.
+
+        Time complexity: O(1)."""
+        MinHeap.clear(self)
+        self._positions.clear()
+
+    def add(self, item: object, priority: object) -> None:
+        """Adds item, with the given priority, to this heap.
+
+        If item is already in this heap, ValueError is raised: use
+        update_priority to change its priority.
+
+        Time complexity: O(log(n))."""
+        self._check_item_and_priority(item, priority)
+        if item in self._positions:
+            raise ValueError("item is already in this heap")
+        self._positions[item] = self.size
+        self.heap.append(_Entry(item, priority))
+        self._push_up(self.size - 1)
+        assert validate(is_indexed_min_heap, self)
+
+    def add_many(self, items) -> None:
+        """Adds all items of items, an iterable of tuples (item, priority), to
+        this heap.
+
+        If an item occurs more than once, or it is already in this heap,
+        ValueError is raised, and this heap is not modified.
+
+        Time complexity: O(min(k * log(n + k), n + k)), where k is the number of
+        tuples in items."""
+        entries = []
+        new_items = set()
+        for item, priority in items:
+            self._check_item_and_priority(item, priority)
+            if item in self._positions or item in new_items:
+                raise ValueError("items must be distinct and not in this heap")
+            new_items.add(item)
+            entries.append(_Entry(item, priority))
+        for e in entries:
+            self._positions[e.item] = self.size
+            self.heap.append(e)
+        self._restore_after_append(len(entries))
+        assert validate(is_indexed_min_heap, self)
+
+    def contains(self, item: object) -> bool:
+        """Returns true if item is in this heap, false otherwise.
+
+        Time complexity: O(1)."""
+        if item is None:
+            raise ValueError("item cannot be None")
+        return item in self._positions
+
+    def __contains__(self, item: object) -> bool:
+        return self.contains(item)
+
+    def _position(self, item: object) -> int:
+        """Returns the index of item in self.heap.
+
+        If item is not in this heap, LookupError is raised.
+
+        Time complexity: O(1)."""
+        if item is None:
+            raise ValueError("item cannot be None")
+        i = self._positions.get(item)
+        if i is None:
+            raise LookupError("item not found")
+        return i
+
+    def priority(self, item: object) -> object:
+        """Returns the priority of item.
+
+        If item is not in this heap, LookupError is raised.
+
+        Time complexity: O(1)."""
+        return self.heap[self._position(item)].priority
+
+    def update_priority(self, item: object, priority: object) -> None:
+        """Changes the priority of item to priority, which can be either
+        smaller or greater than its current priority.
+
+        If item is not in this heap, LookupError is raised.
+
+        Time complexity: O(log(n))."""
+        if priority is None:
+            raise ValueError("priority cannot be None")
+        i = self._position(item)
+        self.heap[i].priority = priority
+        self._push_up(i)
+        self._push_down(self._positions[item])
+        assert validate(is_indexed_min_heap, self)
+
+    def decrease_key(self, item: object, priority: object) -> None:
+        """Decreases the priority of item to priority.
+
+        If item is not in this heap, LookupError is raised, and, if priority is
+        greater than the current priority of item, ValueError is raised.
+
+        Time complexity: O(log(n))."""
+        if priority is None:
+            raise ValueError("priority cannot be None")
+        i = self._position(item)
+        if self.heap[i].priority < priority:
+            raise ValueError("priority is greater than the current priority")
+        self.heap[i].priority = priority
+        self._push_up(i)
+        assert validate(is_indexed_min_heap, self)
+
+    def delete(self, item: object) -> None:
+        """Removes item from this heap.
+
+        If item is not in this heap, LookupError is raised.
+
+        Time complexity: O(log(n))."""
+        i = self._position(item)
+        last = self.size - 1
+        if i != last:
+            self._swap(i, last)
+        self.heap.pop()
+        del self._positions[item]
+        if i != last:
+            self._push_down(i)
+            self._push_up(i)
+        assert validate(is_indexed_min_heap, self)
+
+    def find_min(self) -> tuple:
+        """Returns the tuple (item, priority) of the item with the smallest
+        priority in this heap, or None if this heap is empty.
+
+        Time complexity: O(1)."""
+        if not self.is_empty():
+            e = self.heap[0]
+            return e.item, e.priority
+
+    def remove_min(self) -> tuple:
+        """Removes the item with the smallest priority from this heap, and
+        returns the tuple (item, priority), or returns None if this heap is
+        empty.
+
+        Time complexity: O(log(n))."""
+        if not self.is_empty():
+            e = self.heap[0]
+            self.delete(e.item)
+            return e.item, e.priority
+
+    def pop_many(self, k: int) -> list:
+        """Removes the min(k, n) items with the smallest priorities from this
+        heap, and returns a list with their tuples (item, priority), in the
+        order in which remove_min would return them.
+
+        Time complexity: O(k * log(n))."""
+        entries = MinHeap.pop_many(self, k)
+        assert validate(is_indexed_min_heap, self)
+        return [(e.item, e.priority) for e in entries]
+
+    def peek_many(self, k: int) -> list:
+        """Returns a list with the tuples (item, priority) of the min(k, n)
+        items with the smallest priorities in this heap, in the order in which
+        remove_min would return them, without removing them.
+
+        Time complexity: O(k * log(k))."""
+        return [(e.item, e.priority) for e in MinHeap.peek_many(self, k)]
+
+    def merge(self, o: "IndexedMinHeap") -> None:
+        """Adds all items of o to this heap.
+
+        If o and this heap have items in common, ValueError is raised, and
+        this heap is not modified.
+
+        Time complexity: O(n + m)."""
+        if not isinstance(o, IndexedMinHeap):
+            raise TypeError("o must be an instance of IndexedMinHeap")
+        if o is self or any(item in self._positions for item in o._positions):
+            raise ValueError("the heaps must not have items in common")
+        for e in o.heap:
+            self._positions[e.item] = self.size
+            self.heap.append(_Entry(e.item, e.priority))
+        self._build_heap()
+        assert validate(is_indexed_min_heap, self)
+
+    def _pop_last(self) -> _Entry:
+        """Removes and returns the last entry of self.heap, and forgets the
+        position of its item.
+
+        Time complexity: O(1)."""
+        e = self.heap.pop()
+        del self._positions[e.item]
+        return e
+
+    def _swap(self, i: int, j: int) -> None:
+        """Swaps the entries at indices i and j, and updates the positions of
+        their items.
+
+        Time complexity: O(1)."""
+        MinHeap._swap(self, i, j)
+        self._positions[self.heap[i].item] = i
+        self._positions[self.heap[j].item] = j
+
+    def __iter__(self):
+        """Returns an iterator over the tuples (item, priority) of this heap,
+        in no particular order.
+
+        Time complexity: O(n) to iterate over all tuples."""
+        return ((e.item, e.priority) for e in self.heap)
+
+
+def is_indexed_min_heap(h: IndexedMinHeap) -> bool:
+    """Returns true if h is a valid IndexedMinHeap, false otherwise, i.e. if h
+    is a valid MinHeap, whose positions map each item to its index."""
+    if not isinstance(h, IndexedMinHeap) or not is_min_heap(h):
+        return False
+    if len(h._positions) != h.size:
+        return False
+    return all(h._positions.get(e.item) == i for i, e in enumerate(h.heap))
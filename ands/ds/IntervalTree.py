@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+An interval tree is a data structure which stores (closed) intervals [low,
+high] and allows to efficiently find all intervals which overlap with a given
+interval or point.
+
+This implementation is an augmented red-black tree (see chapter 14.3 of CLRS):
+the keys of the nodes are the intervals themselves, as tuples (low, high),
+which are ordered lexicographically, that is, primarily by their low endpoints,
+and each node also keeps the maximum high endpoint of all intervals in the
+subtree rooted at itself, max_high.
+
+max_high only depends on the interval of a node and on the max_high fields of
+its children, so it can be maintained, like the sizes of the subtrees, by
+RBT._update_node, which is called bottom-up on all nodes whose subtrees change
+during insertions, deletions (including all rotations performed to restore the
+red-black tree property) and all other operations of RBT.
+
+Two intervals [a, b] and [c, d] overlap if and only if a <= d and c <= b.
+When searching for the intervals which overlap with [a, b], the left subtree of
+a node can be skipped if its max_high is smaller than a, since none of its
+intervals end after a, and the right subtree, together with all following nodes
+in-order, can be skipped if the low endpoint of the node is greater than b,
+since all of them start after b.
+
+# References
+
+- https://en.wikipedia.org/wiki/Interval_tree#Augmented_tree
+- Introduction to Algorithms (3rd edition), chapter 14.3, by CLRS
+"""
+
+from ands.ds.RBT import BLACK, RBT, _RBTNode, is_rbt
+from ands.validation import validate
+
+__all__ = ["IntervalTree", "is_interval_tree"]
+
+
+class _IntervalNode(_RBTNode):
+    """Class to represent a node of an IntervalTree, whose key is an interval
+    (low, high)."""
+
+    __slots__ = ("max_high",)
+
+    def __init__(self, key, color=BLACK, parent=None, left=None, right=None,
+                 value=None):
+        _RBTNode.__init__(self, key, color, parent, left, right, value)
+        self.max_high = key[1]
+
+
+def _check_interval(low: object, high: object) -> None:
+    if low is None or high is None:
+        raise ValueError("low and high cannot be None")
+    if high < low:
+        raise ValueError("low must be smaller than or equal to high")
+
+
+class IntervalTree(RBT):
+    """Interval tree, i.e. a red-black tree whose keys are closed intervals,
+    represented as tuples (low, high), which can be searched for the intervals
+    overlapping with a given interval in O(log₂(n)) time per interval found.
+
+    As in RBT, duplicate intervals are allowed, and each interval can be
+    associated with a value, so that this tree can also be used as a map from
+    intervals to values."""
+
+    _DUMP_KIND = 4
+
+    def __init__(self):
+        RBT.__init__(self)
+        assert validate(is_interval_tree, self)
+
+    def _new_node(self, key: tuple, value: object) -> _IntervalNode:
+        return _IntervalNode(key, value=value)
+
+    def _update_node(self, u: _IntervalNode) -> None:
+        """Recomputes the size of the subtree rooted at u and u.max_high.
+
+        Time complexity: O(1)."""
+        RBT._update_node(self, u)
+        m = u.key[1]
+        if u.left is not None and m < u.left.max_high:
+            m = u.left.max_high
+        if u.right is not None and m < u.right.max_high:
+            m = u.right.max_high
+        u.max_high = m
+
+    def insert(self, key: tuple, value: object = None) -> None:
+        """Inserts the interval key, a tuple (low, high), associated with
+        value, into this tree.
+
+        Time complexity: O(log₂(n))."""
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("key must be a tuple (low, high)")
+        _check_interval(*key)
+        RBT.insert(self, key, value)
+        assert validate(is_interval_tree, self)
+
+    def insert_interval(self, low: object, high: object,
+                        value: object = None) -> None:
+        """Inserts the interval [low, high], associated with value, into this
+        tree.
+
+        If high < low, ValueError is raised.
+
+        Time complexity: O(log₂(n))."""
+        self.insert((low, high), value)
+
+    def delete(self, key: tuple) -> None:
+        """Deletes the interval key, a tuple (low, high), from this tree.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        RBT.delete(self, key)
+        assert validate(is_interval_tree, self)
+
+    def delete_interval(self, low: object, high: object) -> None:
+        """Deletes the interval [low, high] from this tree. If there are
+        several copies of the interval, only one of them is deleted.
+
+        If the interval is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        self.delete((low, high))
+
+    def overlapping(self, a: object, b: object):
+        """Returns a generator which lazily yields, in increasing order, the
+        intervals of this tree, as tuples (low, high), which overlap with [a,
+        b], i.e. such that low <= b and a <= high.
+
+        To search for the intervals which contain a point x, use a = b = x.
+
+        If b < a, ValueError is raised. This tree should not be modified while
+        the returned generator is being used.
+
+        Time complexity: O(min(n, (k + 1) * log₂(n))), where k is the number
+        of yielded intervals."""
+        _check_interval(a, b)
+        return (u.key for u in self._overlapping_nodes(a, b))
+
+    def overlapping_items(self, a: object, b: object):
+        """Returns a generator which lazily yields the tuples (interval, value)
+        of the intervals of this tree which overlap with [a, b].
+
+        See overlapping for more details.
+
+        Time complexity: O(min(n, (k + 1) * log₂(n))), where k is the number
+        of yielded tuples."""
+        _check_interval(a, b)
+        return ((u.key, u.value) for u in self._overlapping_nodes(a, b))
+
+    def _overlapping_nodes(self, a: object, b: object):
+        """Generator which yields, in-order, the nodes whose intervals overlap
+        with [a, b].
+
+        The tree is traversed in-order, iteratively, skipping all subtrees
+        whose max_high is smaller than a, and stopping at the first node whose
+        low endpoint is greater than b."""
+        assert validate(is_interval_tree, self)
+
+        stack = []
+        u = self._root
+
+        while True:
+            while u is not None and not u.max_high < a:
+                stack.append(u)
+                u = u.left
+
+            if not stack:
+                return
+
+            u = stack.pop()
+            low, high = u.key
+
+            # All intervals which follow u in-order start after b.
+            if b < low:
+                return
+
+            if not high < a:
+                yield u
+
+            u = u.right
+
+
+def is_interval_tree(t: IntervalTree) -> bool:
+    """Returns true if t is a valid IntervalTree object, false otherwise, i.e.
+    if t is a valid RBT whose nodes are _IntervalNode objects, whose keys are
+    valid intervals, and whose max_high fields are consistent."""
+    if not isinstance(t, IntervalTree) or not is_rbt(t):
+        return False
+
+    # Pre-order, so that children are checked before their parents, when the
+    # nodes are visited in reverse order.
+    nodes = []
+    stack = [t._root] if t._root is not None else []
+    while stack:
+        u = stack.pop()
+        if not isinstance(u, _IntervalNode):
+            return False
+        if not isinstance(u.key, tuple) or len(u.key) != 2:
+            return False
+        if u.key[1] < u.key[0]:
+            return False
+        nodes.append(u)
+        stack.extend(c for c in (u.left, u.right) if c is not None)
+
+    for u in reversed(nodes):
+        m = max([u.key[1]] + [c.max_high for c in (u.left, u.right)
+                              if c is not None])
+        if u.max_high != m:
+            return False
+
+    return True
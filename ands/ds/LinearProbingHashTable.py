@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/06/2015
 
-Updated: 02/04/2018
+Updated: 16/10/2026
 
 # Description
 
@@ -36,6 +36,32 @@ collisions must be resolved or accommodated in some way.
 There are different ways to resolve collisions, where the most famous techniques
 are "separate chaining" and "open addressing".
 
+## Load factor and resizing
+
+The load factor of a hash table is the ratio between the number of keys it
+contains and the number of its slots (its capacity). With linear probing, the
+expected number of slots inspected by a search grows very quickly as the load
+factor approaches 1: it is about (1 + 1 / (1 - α)) / 2 for a successful search
+and about (1 + 1 / (1 - α)²) / 2 for an unsuccessful one, where α is the load
+factor. So, LinearProbingHashTable grows, roughly doubling its capacity, as
+soon as its load factor exceeds a configurable maximum load factor, and it
+shrinks, roughly halving its capacity, when its load factor drops below a
+quarter of the maximum load factor, so that it is never too full nor too empty.
+
+When the table is resized, all keys are moved to the new slots in a single
+pass: since the keys are known to be distinct, each key is simply stored at the
+first free slot found by probing from its hash code.
+
+## Deletion
+
+With open addressing, a key cannot simply be removed from its slot, because
+that would break the probe sequences of the keys which were placed after that
+slot because of collisions: a search for one of these keys would stop at the
+emptied slot and miss them. LinearProbingHashTable uses backward-shift
+deletion (see _delete_slot), which moves these keys back, so that, differently
+from deletion with tombstones (i.e. special markers of deleted keys), deleted
+slots never need to be skipped by searches nor compacted later.
+
 # TODO
 
 - Add complexity analysis to operations
@@ -43,13 +69,8 @@ are "separate chaining" and "open addressing".
 - No difference between non-existence of a key in the table and existence of a
 key with None as associated value: maybe we want to differentiate the two cases?
 
-- Resizing the hash table only whenever we reach a full table may not be the
-best option in terms of performance...
-
 - Should a client of this class be able to specify its custom hash function?
 
-- Size could be implemented as a counter.
-
 - Improve is_hash_table function
 
 # References
@@ -63,13 +84,16 @@ best option in terms of performance...
 - https://en.wikipedia.org/wiki/Hash_function
 - https://en.wikipedia.org/wiki/Linear_probing
 - https://en.wikipedia.org/wiki/Open_addressing
+- The Art of Computer Programming, vol. 3, section 6.4 (algorithm R), by D. E.
+Knuth
 """
 
-from collections import Hashable
+from collections.abc import Hashable
 
 from tabulate import tabulate
 
 from ands.ds.HashTable import HashTable
+from ands.validation import validate
 
 __all__ = ["LinearProbingHashTable", "has_duplicates_ignore_nones",
            "is_hash_table"]
@@ -79,8 +103,10 @@ class LinearProbingHashTable(HashTable):
     """Resizable hash table which uses linear probing, which is a specific
     "open addressing" technique, to resolve collisions.
 
-    The process of resizing consists in doubling the current capacity of the
-    hash table each time.
+    The hash table grows, by doubling its capacity (plus one), whenever its
+    load factor exceeds max_load_factor, and it shrinks, by halving its
+    capacity, whenever its load factor drops below max_load_factor / 4, but
+    never below its initial capacity.
 
     The hash function uses both the Python's built-in hash function and the %
     operator.
@@ -92,27 +118,50 @@ class LinearProbingHashTable(HashTable):
         h[12] = 3
         print(h[12])"""
 
-    def __init__(self, capacity: int = 11):
+    def __init__(self, capacity: int = 11, max_load_factor: float = 0.5):
         if not isinstance(capacity, int):
             raise TypeError("capacity must be an instance of int")
         if capacity < 1:
             raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be an instance of float")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1 "
+                             "(excluded)")
         self._n = capacity  # self._n holds the size of the buffers.
+        self._min_capacity = capacity
+        self._max_load_factor = max_load_factor
+        self._size = 0  # Number of keys in this map.
         self._keys = [None] * self._n
         self._values = [None] * self._n
 
     @property
     def size(self) -> int:
-        """Returns the number of pairs key-value in this map."""
-        assert is_hash_table(self)
-        return sum(k is not None for k in self._keys)
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        assert validate(is_hash_table, self)
+        return self._size
 
     @property
     def capacity(self) -> int:
         """Returns the number of allocated cells in memory."""
-        assert is_hash_table(self)
+        assert validate(is_hash_table, self)
         return len(self._keys)
 
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the maximum load factor of this map."""
+        return self._max_load_factor
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the number of pairs key-value in this map
+        and its capacity.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
     @staticmethod
     def _hash_code(key, size: int) -> int:
         """Returns a hash code (an int) between 0 and size (excluded).
@@ -132,144 +181,168 @@ class LinearProbingHashTable(HashTable):
     def put(self, key: object, value: object) -> None:
         """Inserts the pair (key: value) in this map.
 
-        If key is None, a TypeError is raised, because keys cannot be None."""
-        assert is_hash_table(self)
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1), expected and amortized."""
+        assert validate(is_hash_table, self)
 
         if key is None:
             raise TypeError("key cannot be None.")
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        self._put(key, value, self._n)
+        self._put(key, value)
 
-        assert is_hash_table(self)
+        assert validate(is_hash_table, self)
 
-    def _put(self, key: object, value: object, size: int) -> None:
+    def _put(self, key: object, value: object) -> None:
         """Helper method of self.put."""
-        hash_value = LinearProbingHashTable._hash_code(key, size)
-
-        # No need to allocate new space.
-        if self._keys[hash_value] is None:
-            self._keys[hash_value] = key
-            self._values[hash_value] = value
-
-        # If self already contains_key key, then its value is overridden.
-        elif self._keys[hash_value] == key:
-            self._values[hash_value] = value
-
-        # Collision: there's already a (key: value) pair at the slot dedicated
-        # to this (key: value) pair, according to the self._hash_code function.
-        # We need to _rehash, i.e. find another slot for this (key: value) pair.
-        else:
-            next_slot = LinearProbingHashTable._rehash(hash_value, size)
-            rehashed = False
-
-            while (self._keys[next_slot] is not None and
-                   self._keys[next_slot] != key):
-
-                next_slot = LinearProbingHashTable._rehash(next_slot, size)
-
-                # Allocate new buffer of length len(self.keys) * 2 + 1.
-                if next_slot == hash_value:
-                    rehashed = True
-
-                    keys = self._keys
-                    values = self._values
-
-                    new_size = len(self._keys) * 2 + 1
-                    self._keys = [None] * new_size
-                    self._values = [None] * new_size
-
-                    # Rehashing and putting all elements in the new bigger
-                    # buffer.
-                    #
-                    # Note: the calls to self._put in the following loop will
-                    # never reach these statements, because there will be slots
-                    # available, and because the way hashing and rehashing is
-                    # currently implemented.
-                    for k in keys:
-                        v = LinearProbingHashTable._get(k, keys, values,
-                                                        self._n)
-                        self._put(k, v, new_size)
-
-                    # After resizing the buffers, we insert the original
-                    # (key: value) pair.
-                    self._put(key, value, new_size)
-                    self._n = new_size
-
-            # We exited the loop either because we have found a free slot or a
-            # slot containing our key, and not after having re-sized the table.
-            if not rehashed:
-                if self._keys[next_slot] is None:
-                    self._keys[next_slot] = key
-                    self._values[next_slot] = value
-                else:
-                    assert self._keys[next_slot] == key
-                    self._values[next_slot] = value
+        i = self._find_slot(key)
+
+        # If self already contains key, then its value is overridden.
+        if self._keys[i] is not None:
+            self._values[i] = value
+            return
+
+        self._keys[i] = key
+        self._values[i] = value
+        self._size += 1
+
+        if self._size > self._max_load_factor * self._n:
+            new_size = self._n * 2 + 1
+            # With a small capacity and a small maximum load factor, doubling
+            # the capacity once may not be enough.
+            while self._size > self._max_load_factor * new_size:
+                new_size = new_size * 2 + 1
+            self._resize(new_size)
+
+    def _find_slot(self, key: object) -> int:
+        """Returns the index of the slot containing key, if key is in this map,
+        otherwise the index of the first free slot found by probing from the
+        hash code of key.
+
+        Since the load factor is always smaller than 1, there's always at least
+        one free slot, so probing always terminates.
+
+        Time complexity: O(1), expected."""
+        keys = self._keys
+        size = self._n
+        i = LinearProbingHashTable._hash_code(key, size)
+        while keys[i] is not None and keys[i] != key:
+            i = LinearProbingHashTable._rehash(i, size)
+        return i
+
+    def _resize(self, new_size: int) -> None:
+        """Moves all pairs key-value of this map to new buffers of length
+        new_size, in a single pass over the old buffers.
+
+        Time complexity: O(n + new_size)."""
+        assert self._size < new_size
+        old_keys = self._keys
+        old_values = self._values
+        keys = self._keys = [None] * new_size
+        self._values = values = [None] * new_size
+        self._n = new_size
+
+        for k, v in zip(old_keys, old_values):
+            if k is not None:
+                # The keys are distinct, so k only needs a free slot.
+                i = LinearProbingHashTable._hash_code(k, new_size)
+                while keys[i] is not None:
+                    i = LinearProbingHashTable._rehash(i, new_size)
+                keys[i] = k
+                values[i] = v
+
+    def _shrink_if_needed(self) -> None:
+        """Halves the capacity of this map, if its load factor is smaller than
+        a quarter of the maximum load factor, but not below the initial
+        capacity.
+
+        Time complexity: O(n), if this map is resized, O(1) otherwise."""
+        if (self._n > self._min_capacity and
+                self._size < self._max_load_factor / 4 * self._n):
+            self._resize(max(self._n // 2, self._min_capacity))
 
     def get(self, key: object) -> object:
         """Returns the value associated with key.
 
-        If key is None, a TypeError is raised, because keys cannot be None."""
-        assert is_hash_table(self)
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1), expected."""
+        assert validate(is_hash_table, self)
 
         if key is None:
             raise TypeError("key cannot be None.")
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        value = LinearProbingHashTable._get(key, self._keys, self._values,
-                                            self._n)
+        value = self._values[self._find_slot(key)]
 
-        assert is_hash_table(self)
+        assert validate(is_hash_table, self)
 
         return value
 
-    @staticmethod
-    def _get(key: object, keys: list, values: list, size: int) -> object:
-        """Helper method of self.get."""
-        hash_value = LinearProbingHashTable._hash_code(key, size)
-
-        data = None
-        stop = False
-        found = False
-        position = hash_value
-
-        while keys[position] is not None and not found and not stop:
-
-            if keys[position] == key:
-                found = True
-                data = values[position]
-            else:
-                # Find a new possible position by rehashing.
-                position = LinearProbingHashTable._rehash(position, size)
-
-                # We are at the initial slot, and thus nothing was found.
-                if position == hash_value:
-                    stop = True
-
-        return data
-
     def delete(self, key: object) -> object:
-        """Deletes the mapping between key and its associated value.
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
 
-        If there's no mapping, nothing is done."""
-        assert is_hash_table(self)
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1), expected and amortized."""
+        assert validate(is_hash_table, self)
 
         if key is None:
             raise TypeError("key cannot be None.")
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        try:
-            i = self._keys.index(key)
-            v = self._values[i]
-            self._keys[i] = self._values[i] = None
-            return v
-        except ValueError:
-            pass
-        finally:
-            assert is_hash_table(self)
+        i = self._find_slot(key)
+        if self._keys[i] is None:
+            return None
+
+        v = self._values[i]
+        self._delete_slot(i)
+        self._size -= 1
+        self._shrink_if_needed()
+
+        assert validate(is_hash_table, self)
+
+        return v
+
+    def _delete_slot(self, i: int) -> None:
+        """Empties the slot at index i, which must be occupied, using
+        backward-shift deletion, so that no probe sequence is broken.
+
+        Simply emptying the slot at index i would make the keys after it, in
+        the same cluster (i.e. sequence of occupied slots), unreachable, if
+        their probe sequences pass through slot i. So, the slots after i are
+        scanned until the next free slot, and each key which would not be
+        reachable anymore, i.e. whose hash code is not cyclically in (i, j],
+        where j is its current slot, is moved back to slot i, which then becomes
+        slot j, until the slot to empty is the last of the cluster.
+
+        Time complexity: O(1), expected."""
+        keys = self._keys
+        values = self._values
+        size = self._n
+        j = i
+
+        while True:
+            j = LinearProbingHashTable._rehash(j, size)
+            if keys[j] is None:
+                break
+            h = LinearProbingHashTable._hash_code(keys[j], size)
+            # Whether the key at j is still reachable, if slot i is emptied.
+            if i <= j:
+                reachable = i < h <= j
+            else:
+                reachable = h > i or h <= j
+            if not reachable:
+                keys[i] = keys[j]
+                values[i] = values[j]
+                i = j
+
+        keys[i] = values[i] = None
 
     def show(self) -> None:
         """Prints this hash table in table-like format."""
@@ -309,4 +382,8 @@ def is_hash_table(t: HashTable) -> bool:
         return False
     if len(t._keys) != len(t._values) or len(t._keys) != t._n:
         return False
+    if t._size != sum(k is not None for k in t._keys):
+        return False
+    if t._size > t._max_load_factor * t._n:
+        return False
     return not has_duplicates_ignore_nones(t._keys)
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 15/02/2016
 
-Updated: 29/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -23,20 +23,23 @@ See doc-strings of the module MinHeap.py.
 - http://www.math.clemson.edu/~warner/M865/HeapDelete.html
 """
 
-from ands.ds.BinaryHeap import BinaryHeap
+from ands.ds.BinaryHeap import BinaryHeap, _check_k
+from ands.validation import validate
 
 __all__ = ["MaxHeap", "is_max_heap"]
 
 
 class MaxHeap(BinaryHeap):
     """Sub-class of BinaryHeap, and thus provides the same public interface,
-    but in addition provides two more operations:
+    but in addition provides four more operations:
 
     - find_max
-    - remove_max"""
+    - remove_max
+    - pop_many
+    - peek_many"""
 
-    def __init__(self, ls=None):
-        BinaryHeap.__init__(self, ls)
+    def __init__(self, ls=None, key=None):
+        BinaryHeap.__init__(self, ls, key)
 
     def find_max(self) -> object:
         """Returns the greatest element in this MaxHeap.
@@ -48,15 +51,56 @@ class MaxHeap(BinaryHeap):
         """Removes and returns the greatest element in this MaxHeap.
 
         Time complexity: O(log(n))."""
-        assert is_max_heap(self)
+        assert validate(is_max_heap, self)
         if not self.is_empty():
-            self._swap(0, self.size - 1)
-            m = self.heap.pop()
-            if not self.is_empty():
-                self._push_down(0)
-            assert is_max_heap(self)
+            m = self._remove_root()
+            assert validate(is_max_heap, self)
             return m
 
+    def pop_many(self, k: int) -> list:
+        """Removes the min(k, n) greatest elements from this MaxHeap and returns
+        them in a list, in the order in which remove_max would return them.
+
+        The heap is only validated before and after removing all elements, and
+        not after each removal.
+
+        Time complexity: O(k * log(n))."""
+        _check_k(k)
+        assert validate(is_max_heap, self)
+        ms = [self._remove_root() for _ in range(min(k, self.size))]
+        assert validate(is_max_heap, self)
+        return ms
+
+    def peek_many(self, k: int) -> list:
+        """Returns a list with the min(k, n) greatest elements of this MaxHeap,
+        in the order in which remove_max would return them, without removing
+        them.
+
+        Time complexity: O(k * log(k))."""
+        if self._keys is None:
+            key = self.heap.__getitem__
+        else:
+            keys = self._keys
+            order = self._order
+            key = lambda i: (keys[i], -order[i])
+        return self._peek_many(k, MaxHeap(key=key))
+
+    def _precedes(self, i: int, j: int) -> bool:
+        """Returns true if the element at index i must be closer to the root
+        than the element at index j, i.e. if it is greater, or, if this heap
+        has a key function, if its key is greater, or if the keys are equal and
+        it was added before.
+
+        Time complexity: O(1)."""
+        keys = self._keys
+        if keys is None:
+            return self.heap[i] > self.heap[j]
+        if keys[i] > keys[j]:
+            return True
+        if keys[j] > keys[i]:
+            return False
+        return self._order[i] < self._order[j]
+
     def _push_down(self, i: int) -> None:
         """Max-heapifies this MaxHeap starting from index i.
 
@@ -67,9 +111,9 @@ class MaxHeap(BinaryHeap):
         l = self._left_index(i)
         r = self._right_index(i)
 
-        if l != -1 and self.heap[l] > self.heap[m]:
+        if l != -1 and self._precedes(l, m):
             m = l
-        if r != -1 and self.heap[r] > self.heap[m]:
+        if r != -1 and self._precedes(r, m):
             m = r
 
         if m != i:
@@ -88,7 +132,7 @@ class MaxHeap(BinaryHeap):
         c = i  # Current index.
         p = self._parent_index(i)
 
-        if p != -1 and self.heap[c] > self.heap[p]:
+        if p != -1 and self._precedes(c, p):
             c = p
 
         if c != i:
@@ -97,17 +141,14 @@ class MaxHeap(BinaryHeap):
 
 
 def is_max_heap(h: MaxHeap) -> bool:
-    """Returns true if h is a valid MaxHeap, false otherwise."""
+    """Returns true if h is a valid MaxHeap, false otherwise, i.e. if no element
+    of h is greater than its parent.
+
+    Parents are found with h._parent_index, so that this also works for heaps
+    whose nodes have more than two children, like DaryMaxHeap."""
     if not isinstance(h, MaxHeap):
         return False
-    if h.heap:
-        for i, item in enumerate(h.heap):
-            l = h._left_index(i)
-            r = h._right_index(i)
-            if r != -1 and l == -1:
-                return False
-            if l != -1 and item < h.heap[l]:
-                return False
-            if r != -1 and item < h.heap[r]:
-                return False
+    for i in range(1, h.size):
+        if h._precedes(i, h._parent_index(i)):
+            return False
     return True
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 18/02/2016
 
-Updated: 29/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -26,6 +26,23 @@ The min-max heap ordering is the following:
 
 Even levels are 0, 2, 4, 6, etc., whereas odd levels are 1, 3, 5, 7, etc.
 
+## Bounded min-max heaps
+
+A min-max heap can be given a capacity, e.g. to keep the best N candidates seen
+so far, where both the best and the worst candidates need to be accessed. Once
+the heap is full, add evicts either the current minimum or the current maximum
+(as specified by the parameter evict), by replacing it with the new element and
+by pushing the new element down (or up) from there, with a single sift, instead
+of first adding the new element and then removing the evicted one. If the new
+element would itself be evicted, the heap is not modified at all.
+
+add_many does the same for each element which overflows the heap. Sorting the
+overflowing elements together with the elements in the heap would take
+O((n + k) * log(n + k)) time, which is never better than the O(k * log(n)) time
+of the k sifts. Moreover, elements which would themselves be evicted are
+discarded after a single comparison, so, e.g. when keeping the N greatest of
+many random elements, most elements take O(1) time.
+
 # TODO
 
 - find-kth, i.e. find the kth smallest element in the structure, in O(1) time.
@@ -41,22 +58,121 @@ Even levels are 0, 2, 4, 6, etc., whereas odd levels are 1, 3, 5, 7, etc.
 import math
 
 from ands.ds.BinaryHeap import BinaryHeap
+from ands.validation import validate
 
 __all__ = ["MinMaxHeap", "is_min_max_heap"]
 
 
 class MinMaxHeap(BinaryHeap):
     """Sub-class of BinaryHeap, and thus provides the same public interface,
-    but in addition provides four more operations:
+    but in addition provides five more operations:
 
+    - is_full
     - find_max
     - find_min
     - remove_max
-    - remove_min"""
-
-    def __init__(self, ls=None):
+    - remove_min
+
+    If capacity is not None, this heap never contains more than capacity
+    elements: once it is full, adding an element evicts the smallest element,
+    if evict is "min", or the greatest one, if evict is "max" (see the
+    doc-string of this module)."""
+
+    def __init__(self, ls=None, capacity: int = None, evict: str = "min"):
+        if capacity is not None:
+            if not isinstance(capacity, int):
+                raise TypeError("capacity must be an instance of int")
+            if capacity < 1:
+                raise ValueError("capacity must be greater than or equal to 1")
+            if isinstance(ls, list) and len(ls) > capacity:
+                raise ValueError("ls has more than capacity elements")
+        if evict not in ("min", "max"):
+            raise ValueError("evict must be either \"min\" or \"max\"")
+        self.capacity = capacity
+        self.evict = evict
         BinaryHeap.__init__(self, ls)
 
+    def is_full(self) -> bool:
+        """Returns true if this heap has a capacity and contains capacity
+        elements, false otherwise.
+
+        Time complexity: O(1)."""
+        return self.capacity is not None and self.size >= self.capacity
+
+    def add(self, x: object) -> object:
+        """Adds object x to this heap.
+
+        If this heap is full, either the smallest or the greatest element among
+        x and the elements of this heap (depending on self.evict) is evicted
+        and returned, otherwise None is returned. If x itself is evicted, this
+        heap is not modified.
+
+        Time complexity: O(log(n))."""
+        if not self.is_full():
+            BinaryHeap.add(self, x)
+            return None
+        if x is None:
+            raise ValueError("x cannot be None")
+        return self._replace(x)
+
+    def add_many(self, xs) -> list:
+        """Adds all objects of the iterable xs to this heap, and returns the
+        list of the evicted elements, in no particular order, if this heap has
+        a capacity, otherwise it returns an empty list.
+
+        If xs contains None, ValueError is raised, and this heap is not
+        modified.
+
+        Time complexity: O(min(k * log(n + k), n + k)), if this heap does not
+        overflow, otherwise O(k * log(n)), where k is the number of objects in
+        xs."""
+        xs = list(xs)
+        if any(x is None for x in xs):
+            raise ValueError("xs cannot contain None")
+
+        free = len(xs) if self.capacity is None else self.capacity - self.size
+        BinaryHeap.add_many(self, xs[:free])
+        overflow = xs[free:]
+
+        evicted = [self._replace(x) for x in overflow]
+
+        assert validate(is_min_max_heap, self)
+        return evicted
+
+    def merge(self, o: "Heap") -> None:
+        """Merges this heap with the o heap.
+
+        If this heap has a capacity, the elements of o are added to this heap
+        with add_many, so that the elements which overflow are evicted.
+
+        Time complexity: O(n + m), if this heap does not overflow, otherwise
+        O(m * log(n))."""
+        if self.capacity is None:
+            BinaryHeap.merge(self, o)
+        else:
+            self.add_many(o.heap)
+
+    def _replace(self, x: object) -> object:
+        """Replaces the element which must be evicted from this heap, which
+        must be full, with x, and returns it, unless x itself must be evicted,
+        in which case x is returned.
+
+        Time complexity: O(log(n))."""
+        assert self.is_full()
+        if self.evict == "min":
+            i = 0
+            if not self.heap[i] < x:
+                return x
+        else:
+            i = self._find_max_index()
+            if not x < self.heap[i]:
+                return x
+        m = self.heap[i]
+        self.heap[i] = x
+        self._push_up(i)
+        self._push_down(i)
+        return m
+
     def find_max(self) -> object:
         """Returns the greatest element in this MinMaxHeap.
 
@@ -75,21 +191,21 @@ class MinMaxHeap(BinaryHeap):
         """Removes and returns the greatest element in this MinMaxHeap.
 
         Time complexity: O(log(n))."""
-        assert is_min_max_heap(self)
+        assert validate(is_min_max_heap, self)
 
         if not self.is_empty():
             i = self._find_max_index()
 
             if i == self.size - 1:
                 m = self.heap.pop()
-                assert is_min_max_heap(self)
+                assert validate(is_min_max_heap, self)
                 return m
 
             self._swap(i, self.size - 1)
             m = self.heap.pop()
             self._push_up(i)
             self._push_down(i)
-            assert is_min_max_heap(self)
+            assert validate(is_min_max_heap, self)
             return m
 
     def remove_min(self) -> object:
@@ -99,14 +215,14 @@ class MinMaxHeap(BinaryHeap):
         if not self.is_empty():
             if self.size == 1:
                 m = self.heap.pop()
-                assert is_min_max_heap(self)
+                assert validate(is_min_max_heap, self)
                 return m
 
             self._swap(0, self.size - 1)
             m = self.heap.pop()
             self._push_up(0)
             self._push_down(0)
-            assert is_min_max_heap(self)
+            assert validate(is_min_max_heap, self)
             return m
 
     def _push_down(self, i: int) -> None:
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A min-heap of numeric (floating-point) priorities, each associated with an
+integer payload, e.g. the index of an object stored elsewhere.
+
+Differently from MinHeap, whose list stores a reference to a (boxed) Python
+object per element, this heap stores the priorities in a growable NumPy array
+of 64-bit floats and the payloads in a parallel NumPy array of 64-bit integers,
+so that each element takes 16 bytes, instead of more than 50 bytes.
+
+Single operations, like add and remove_min, still push the elements up or down
+one level at a time, like MinHeap, but they access the arrays through
+memoryviews, which return plain Python floats and integers, rather than NumPy
+scalars.
+
+Bulk operations, i.e. creating a heap from arrays and add_many, are vectorized:
+Floyd's heap construction algorithm pushes down, one level of the heap at a
+time, all nodes of that level simultaneously, given that their subtrees are
+disjoint, with O(log(n)²) NumPy operations overall.
+
+The payloads are not compared: elements with equal priorities are removed in no
+particular order. NaN priorities are not allowed, since they are not ordered.
+
+# References
+
+- https://en.wikipedia.org/wiki/Binary_heap
+- https://en.wikipedia.org/wiki/Binary_heap#Building_a_heap
+- https://numpy.org/doc/stable/reference/arrays.indexing.html
+"""
+
+import math
+
+import numpy as np
+
+from ands.validation import validate
+
+__all__ = ["NumericMinHeap", "is_numeric_min_heap"]
+
+
+class NumericMinHeap:
+    """Min-heap of float priorities with int payloads.
+
+    Public interface:
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - add_many
+    - find_min
+    - remove_min"""
+
+    _MIN_CAPACITY = 16
+
+    def __init__(self, priorities=None, payloads=None):
+        """Creates a heap from priorities and payloads, two array-like objects
+        of the same length, if priorities is not None.
+
+        If payloads is None, the payload of each priority is its index in
+        priorities.
+
+        Time complexity: O(n)."""
+        self._n = 0
+        # Number of elements added so far, used as the default payload.
+        self._counter = 0
+        self._allocate(self._MIN_CAPACITY)
+        if priorities is not None:
+            self.add_many(priorities, payloads)
+
+    def _allocate(self, capacity: int) -> None:
+        """Replaces the arrays of this heap with new ones of the given
+        capacity, which contain the current elements of this heap.
+
+        Time complexity: O(n)."""
+        assert capacity >= self._n
+        priorities = np.empty(capacity, dtype=np.float64)
+        payloads = np.empty(capacity, dtype=np.int64)
+        if self._n:
+            priorities[:self._n] = self._priorities[:self._n]
+            payloads[:self._n] = self._payloads[:self._n]
+        self._priorities = priorities
+        self._payloads = payloads
+        self._p = memoryview(priorities)
+        self._q = memoryview(payloads)
+
+    def _reserve(self, k: int) -> None:
+        """Ensures that k more elements can be added without growing the
+        arrays.
+
+        Time complexity: O(n) if the arrays need to grow, O(1) otherwise."""
+        needed = self._n + k
+        capacity = len(self._priorities)
+        if needed > capacity:
+            self._allocate(max(needed, 2 * capacity))
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this heap.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    def is_empty(self) -> bool:
+        """Returns true if this heap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def clear(self) -> None:
+        """Removes all elements from this heap and releases its memory.
+
+        Time complexity: O(1)."""
+        self._n = 0
+        self._allocate(self._MIN_CAPACITY)
+
+    def add(self, priority: float, payload: int = None) -> None:
+        """Adds priority, together with payload, to this heap.
+
+        If payload is None, the number of elements added so far to this heap
+        (by add or add_many) is used as payload.
+
+        Time complexity: O(log(n)), amortized."""
+        priority = float(priority)
+        if math.isnan(priority):
+            raise ValueError("priority cannot be NaN")
+        if payload is None:
+            payload = self._counter
+        self._reserve(1)
+        i = self._n
+        self._p[i] = priority
+        self._q[i] = payload
+        self._n += 1
+        self._counter += 1
+        self._push_up(i)
+
+    def add_many(self, priorities, payloads=None) -> None:
+        """Adds all priorities, together with their payloads, to this heap,
+        where priorities and payloads are array-like objects of the same
+        length.
+
+        If payloads is None, the numbers of elements added so far to this heap
+        are used as payloads, i.e. as if the priorities were added one by one
+        with add.
+
+        The heap property is restored either by pushing up each of the k new
+        elements or by rebuilding the whole heap, vectorized, depending on
+        which is cheaper (see BinaryHeap.add_many).
+
+        If priorities contains NaN, ValueError is raised, and this heap is not
+        modified.
+
+        Time complexity: O(min(k * log(n + k), n + k))."""
+        priorities = np.asarray(priorities, dtype=np.float64).ravel()
+        k = len(priorities)
+        if payloads is None:
+            payloads = np.arange(self._counter, self._counter + k,
+                                 dtype=np.int64)
+        else:
+            payloads = np.asarray(payloads, dtype=np.int64).ravel()
+            if len(payloads) != k:
+                raise ValueError("priorities and payloads must have the same "
+                                 "length")
+        if np.isnan(priorities).any():
+            raise ValueError("priorities cannot contain NaN")
+        if k == 0:
+            return
+
+        self._reserve(k)
+        start = self._n
+        self._priorities[start:start + k] = priorities
+        self._payloads[start:start + k] = payloads
+        self._n += k
+        self._counter += k
+
+        n = self._n
+        if k * math.log2(n + 1) > n:
+            _heapify(self._priorities, self._payloads, n)
+        else:
+            for i in range(start, n):
+                self._push_up(i)
+        assert validate(is_numeric_min_heap, self)
+
+    def find_min(self) -> tuple:
+        """Returns the tuple (payload, priority) of the element with the
+        smallest priority in this heap, or None if this heap is empty.
+
+        Time complexity: O(1)."""
+        if self._n:
+            return self._q[0], self._p[0]
+
+    def remove_min(self) -> tuple:
+        """Removes the element with the smallest priority from this heap, and
+        returns the tuple (payload, priority), or returns None if this heap is
+        empty.
+
+        Time complexity: O(log(n))."""
+        assert validate(is_numeric_min_heap, self)
+        if self._n:
+            m = self._q[0], self._p[0]
+            self._n -= 1
+            last = self._n
+            if last:
+                self._p[0] = self._p[last]
+                self._q[0] = self._q[last]
+                self._push_down(0)
+            assert validate(is_numeric_min_heap, self)
+            return m
+
+    def _push_down(self, i: int) -> None:
+        """Pushes down the element at index i, until it is smaller than or
+        equal to its children.
+
+        Time complexity: O(log(n))."""
+        p = self._p
+        q = self._q
+        n = self._n
+        x = p[i]
+        y = q[i]
+
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and p[c + 1] < p[c]:
+                c += 1
+            if not p[c] < x:
+                break
+            p[i] = p[c]
+            q[i] = q[c]
+            i = c
+
+        p[i] = x
+        q[i] = y
+
+    def _push_up(self, i: int) -> None:
+        """Pushes up the element at index i, until it is greater than or equal
+        to its parent.
+
+        Time complexity: O(log(n))."""
+        p = self._p
+        q = self._q
+        x = p[i]
+        y = q[i]
+
+        while i > 0:
+            parent = (i - 1) // 2
+            if not x < p[parent]:
+                break
+            p[i] = p[parent]
+            q[i] = q[parent]
+            i = parent
+
+        p[i] = x
+        q[i] = y
+
+    def __str__(self):
+        return str(list(zip(self._q[:self._n].tolist(),
+                            self._p[:self._n].tolist())))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def _heapify(priorities: np.ndarray, payloads: np.ndarray, n: int) -> None:
+    """Rearranges the first n elements of priorities (and, accordingly, of
+    payloads) so that they form a binary min-heap, using Floyd's algorithm.
+
+    Nodes at the same level have disjoint subtrees, so they are all pushed down
+    simultaneously, one level of their subtrees at a time.
+
+    Time complexity: Θ(n), with O(log(n)²) NumPy operations."""
+    if n < 2:
+        return
+    last_parent = (n - 2) // 2
+    deepest = int(math.log2(last_parent + 1))
+
+    for level in range(deepest, -1, -1):
+        i = np.arange(2 ** level - 1, min(2 ** (level + 1) - 1,
+                                          last_parent + 1))
+        while i.size:
+            # All nodes at indices i have at least the left child.
+            c = 2 * i + 1
+            has_right = c + 1 < n
+            right = c[has_right] + 1
+            c[has_right] = np.where(priorities[right] < priorities[right - 1],
+                                    right, right - 1)
+
+            smaller = priorities[c] < priorities[i]
+            i = i[smaller]
+            c = c[smaller]
+            priorities[i], priorities[c] = priorities[c], priorities[i]
+            payloads[i], payloads[c] = payloads[c], payloads[i]
+
+            i = c[2 * c + 1 < n]
+
+
+def is_numeric_min_heap(h: NumericMinHeap) -> bool:
+    """Returns true if h is a valid NumericMinHeap, false otherwise, i.e. if no
+    priority of h is smaller than the priority of its parent.
+
+    Time complexity: O(n), vectorized."""
+    if not isinstance(h, NumericMinHeap):
+        return False
+    p = h._priorities[:h.size]
+    children = np.arange(1, h.size)
+    return bool(np.all(p[children] >= p[(children - 1) // 2]))
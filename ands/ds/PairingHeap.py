@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A pairing heap is a heap-ordered multi-way tree, i.e. a tree whose nodes can
+have any number of children, and in which the key of each node is smaller than
+or equal to the keys of its children, so that the minimum is at the root.
+
+Pairing heaps are "mergeable" heaps: two pairing heaps are merged (or
+"melded") in O(1) time, by simply making the root with the greater key the
+first child of the other root. Insertion is a merge with a heap of one element.
+
+Removing the minimum removes the root, and merges its children, which are
+themselves pairing heaps, in two passes: the first pass merges them in pairs,
+from left to right, and the second pass merges the resulting heaps from right
+to left into a single heap. This takes O(log(n)) amortized time.
+
+Decreasing the key of a node cuts the subtree rooted at it from its parent,
+and merges it with the root, which takes O(1) time, plus the amortized cost of
+the following removals, which has been proven to be o(log(n)) per decrease.
+
+Children are represented with the "left-child, right-sibling" representation:
+each node has a pointer to its first child, to its next sibling, and to its
+previous node, which is its previous sibling, or its parent, if it is the
+first child.
+
+Differently from binary heaps, which are stored in lists, merging two pairing
+heaps does not require to copy or rebuild either of them.
+
+## Handles
+
+add returns the node of the new element, as a handle for decrease_key. To
+detect handles of other heaps, each node refers to an owner object of the heap
+which contains it. Since updating the nodes of a heap when it is merged into
+another one would take O(n) time, the owners of merged heaps are instead united
+in a disjoint-set forest (see DisjointSetsForest.py), with union by rank and
+path compression, whose roots refer to the heaps which contain their nodes.
+
+# References
+
+- https://en.wikipedia.org/wiki/Pairing_heap
+- The Pairing Heap: A New Form of Self-Adjusting Heap (1986), by M. L.
+Fredman, R. Sedgewick, D. D. Sleator and R. E. Tarjan
+- Pairing Heaps: The Forward Variant (2018), by D. Dudek, L. Kozma and S.
+Pettie, for a recent overview of the known bounds
+"""
+
+from ands.validation import validate
+
+__all__ = ["PairingHeap", "is_pairing_heap"]
+
+
+class _PairingNode:
+    """Node of a PairingHeap, which is also returned by PairingHeap.add, as a
+    handle which can be passed to PairingHeap.decrease_key."""
+
+    __slots__ = ("key", "child", "sibling", "prev", "owner")
+
+    def __init__(self, key, owner=None):
+        self.key = key
+        # _Owner of the heap containing this node, or None if this node has
+        # been removed.
+        self.owner = owner
+        self.child = None
+        self.sibling = None
+        # Previous sibling, or parent if this is the first child of its parent.
+        self.prev = None
+
+    def __str__(self):
+        return str(self.key)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class _Owner:
+    """Node of the disjoint-set forest of the owners of the nodes of pairing
+    heaps. Only the roots of the forest refer to a heap, or to None, if the
+    heap has been cleared."""
+
+    __slots__ = ("heap", "parent", "rank")
+
+    def __init__(self, heap):
+        self.heap = heap
+        self.parent = self
+        self.rank = 0
+
+
+def _find_owner(u: _PairingNode) -> _Owner:
+    """Returns the root of the owner of u, and compresses the path to it.
+
+    Time complexity: O(α(n)) amortized."""
+    r = u.owner
+    while r.parent is not r:
+        r = r.parent
+    o = u.owner
+    while o is not r:
+        o.parent, o = r, o.parent
+    u.owner = r
+    return r
+
+
+def _meld(a: _PairingNode, b: _PairingNode) -> _PairingNode:
+    """Merges the heaps rooted at a and b, which must not have siblings, and
+    returns the root of the resulting heap.
+
+    Time complexity: O(1)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b.key < a.key:
+        a, b = b, a
+    # b becomes the first child of a.
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+def _merge_pairs(first: _PairingNode) -> _PairingNode:
+    """Merges the heaps rooted at first and at all its following siblings with
+    the two-pass pairing method, and returns the root of the resulting heap.
+
+    Time complexity: O(log(n)) amortized."""
+    # First pass: meld the heaps in pairs, from left to right.
+    pairs = []
+    u = first
+    while u is not None:
+        a = u
+        b = u.sibling
+        u = b.sibling if b is not None else None
+        a.sibling = a.prev = None
+        if b is not None:
+            b.sibling = b.prev = None
+        pairs.append(_meld(a, b))
+
+    # Second pass: meld the resulting heaps from right to left.
+    root = None
+    for h in reversed(pairs):
+        root = _meld(h, root)
+    return root
+
+
+def _cut(u: _PairingNode) -> None:
+    """Detaches the subtree rooted at u, which is not a root, from its parent
+    and siblings.
+
+    Time complexity: O(1)."""
+    if u.prev.child is u:  # u is the first child of u.prev.
+        u.prev.child = u.sibling
+    else:
+        u.prev.sibling = u.sibling
+    if u.sibling is not None:
+        u.sibling.prev = u.prev
+    u.prev = u.sibling = None
+
+
+class PairingHeap:
+    """Pairing min-heap, which provides the same public interface as MinHeap,
+    but whose add and merge operations take O(1) time, and which also supports
+    decrease_key.
+
+    Public interface:
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - contains
+    - delete
+    - merge
+    - find_min
+    - remove_min
+    - decrease_key
+
+    This heap allows duplicates. It's the responsibility of the client to
+    ensure that inserted elements are comparable among them."""
+
+    def __init__(self, ls=None):
+        """Creates a pairing heap containing the elements of the list ls, if ls
+        is not None.
+
+        Time complexity: O(n)."""
+        self._root = None
+        self._n = 0
+        self._owner = _Owner(self)
+        if ls is not None:
+            for x in ls:
+                self.add(x)
+        assert validate(is_pairing_heap, self)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this heap.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    def is_empty(self) -> bool:
+        """Returns true if this heap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def clear(self) -> None:
+        """Removes all elements from this heap.
+
+        Handles to the removed elements are no longer valid.
+
+        Time complexity: O(1)."""
+        self._root = None
+        self._n = 0
+        self._owner.heap = None
+        self._owner = _Owner(self)
+
+    def add(self, x: object) -> _PairingNode:
+        """Adds x to this heap, and returns a handle to it, which can later be
+        passed to decrease_key.
+
+        Time complexity: O(1)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        u = _PairingNode(x, self._owner)
+        self._root = _meld(self._root, u)
+        self._n += 1
+        return u
+
+    def find_min(self) -> object:
+        """Returns the smallest element in this heap, or None if this heap is
+        empty.
+
+        Time complexity: O(1)."""
+        return self._root.key if self._root is not None else None
+
+    def remove_min(self) -> object:
+        """Removes and returns the smallest element in this heap, or returns
+        None if this heap is empty.
+
+        Time complexity: O(log(n)) amortized."""
+        assert validate(is_pairing_heap, self)
+        if self._root is None:
+            return None
+        r = self._root
+        self._root = _merge_pairs(r.child)
+        r.child = r.owner = None
+        self._n -= 1
+        assert validate(is_pairing_heap, self)
+        return r.key
+
+    def merge(self, o: "PairingHeap") -> None:
+        """Moves all elements of the heap o into this heap, and empties o.
+
+        Handles returned by o.add remain valid, but refer to this heap.
+
+        Time complexity: O(1)."""
+        if not isinstance(o, PairingHeap):
+            raise TypeError("o must be an instance of PairingHeap")
+        if o is self:
+            return
+        self._root = _meld(self._root, o._root)
+        self._n += o._n
+
+        # Union by rank of the owners of the nodes of self and of o.
+        a, b = self._owner, o._owner
+        if a.rank < b.rank:
+            a, b = b, a
+        b.parent = a
+        if a.rank == b.rank:
+            a.rank += 1
+        a.heap = self
+        self._owner = a
+
+        o._root = None
+        o._n = 0
+        o._owner = _Owner(o)
+        assert validate(is_pairing_heap, self)
+
+    def decrease_key(self, handle: _PairingNode, x: object) -> None:
+        """Decreases the element referred to by handle, returned by add, to x.
+
+        If x is greater than the current element, or if handle refers to an
+        element of another heap, ValueError is raised. If handle refers to an
+        element which has been removed, LookupError is raised.
+
+        Time complexity: O(α(n)) amortized, to find the heap containing the
+        element, plus the amortized cost of the following calls to remove_min,
+        which is o(log(n)) per call to decrease_key."""
+        if not isinstance(handle, _PairingNode):
+            raise TypeError("handle must be a handle returned by add")
+        if x is None:
+            raise ValueError("x cannot be None")
+        if handle.owner is None or _find_owner(handle).heap is None:
+            raise LookupError("handle refers to a removed element")
+        if handle.owner.heap is not self:
+            raise ValueError("handle refers to an element of another heap")
+        if handle.key < x:
+            raise ValueError("x is greater than the current element")
+
+        handle.key = x
+        if handle is not self._root:
+            _cut(handle)
+            self._root = _meld(self._root, handle)
+        assert validate(is_pairing_heap, self)
+
+    def _find(self, x: object) -> _PairingNode:
+        """Returns a node with key x, or None if there's no such node.
+
+        Subtrees whose roots are greater than x are skipped.
+
+        Time complexity: O(n)."""
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            u = stack.pop()
+            if u.key == x:
+                return u
+            if u.sibling is not None:
+                stack.append(u.sibling)
+            if u.child is not None and not x < u.key:
+                stack.append(u.child)
+        return None
+
+    def contains(self, x: object) -> bool:
+        """Returns true if x is in this heap, false otherwise.
+
+        Time complexity: O(n)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        return self._find(x) is not None
+
+    def delete(self, x: object) -> None:
+        """Removes the first found x from this heap.
+
+        If x is not in this heap, LookupError is raised.
+
+        Time complexity: O(n), to find x, plus O(log(n)) amortized."""
+        if x is None:
+            raise ValueError("x cannot be None")
+
+        u = self._find(x)
+        if u is None:
+            raise LookupError("x not found")
+
+        if u is self._root:
+            self.remove_min()
+            return
+
+        _cut(u)
+        self._root = _meld(self._root, _merge_pairs(u.child))
+        u.child = u.owner = None
+        self._n -= 1
+        assert validate(is_pairing_heap, self)
+
+    def __str__(self):
+        return "PairingHeap(size=%d, min=%s)" % (self._n, self.find_min())
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def is_pairing_heap(h: PairingHeap) -> bool:
+    """Returns true if h is a valid PairingHeap, false otherwise, i.e. if the
+    key of each node is not smaller than the key of its parent, the prev
+    pointers are consistent, the root has no siblings, each node is owned by
+    h, and h.size is the number of its nodes."""
+    if not isinstance(h, PairingHeap):
+        return False
+    if h._root is None:
+        return h._n == 0
+    if h._root.prev is not None or h._root.sibling is not None:
+        return False
+    if h._owner.parent is not h._owner or h._owner.heap is not h:
+        return False
+
+    n = 0
+    stack = [h._root]
+    while stack:
+        u = stack.pop()
+        n += 1
+        if u.owner is None or _find_owner(u) is not h._owner:
+            return False
+        prev = u
+        c = u.child
+        while c is not None:
+            if c.prev is not prev or c.key < u.key:
+                return False
+            stack.append(c)
+            prev = c
+            c = c.sibling
+    return n == h._n
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Persistent (or immutable) red-black tree, i.e. a red-black tree which is never
+modified in place: insert and delete leave the tree on which they are called
+unchanged and return a new tree, that is, a new version of the tree.
+
+The new version shares with the old one all nodes which are not on the path
+from the root to the inserted or deleted node, which are instead copied ("path
+copying"). Hence, each update only allocates O(log₂(n)) new nodes, and, since
+versions are never modified, taking a snapshot of a tree simply means keeping a
+reference to it, which takes O(1) time. For example, readers can iterate over a
+version of the tree while a writer keeps creating new versions.
+
+In order to keep the number of cases small, this implementation is based on the
+left-leaning red-black trees (LLRB) by R. Sedgewick, in which RED nodes can
+only be left children. LLRBs correspond to 2-3 trees, and their insertion and
+deletion algorithms are naturally expressed recursively, which is what makes
+path copying straightforward: each recursive call returns the new root of the
+subtree it was called on. Nodes do not have parent pointers, since a shared
+node can have several parents, one for each version.
+
+As in ands.ds.RBT, each node also keeps the size of the subtree rooted at it, so
+that rank and select take O(log₂(n)) time.
+
+Differently from ands.ds.RBT, a persistent red-black tree does not allow
+duplicate keys: inserting a key which is already in the tree replaces its
+value.
+
+# References
+
+- https://en.wikipedia.org/wiki/Persistent_data_structure
+- https://en.wikipedia.org/wiki/Left-leaning_red%E2%80%93black_tree
+- Left-leaning Red-Black Trees (2008), by R. Sedgewick
+- http://algs4.cs.princeton.edu/33balanced/RedBlackBST.java.html
+- Purely Functional Data Structures (1998), by C. Okasaki
+- Making Data Structures Persistent (1989), by J. R. Driscoll, N. Sarnak, D.
+D. Sleator and R. E. Tarjan
+"""
+
+from ands.validation import set_validation_level, validate
+
+__all__ = ["PersistentRBT", "is_persistent_rbt"]
+
+
+class _PRBTNode:
+    """Node of a PersistentRBT.
+
+    Nodes are never modified after they have been created, since they can be
+    shared by several versions of a tree."""
+
+    __slots__ = ("key", "value", "left", "right", "red", "size")
+
+    def __init__(self, key, value, left, right, red):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.red = red
+        self.size = _size(left) + _size(right) + 1
+
+    def __str__(self):
+        return str(self.key)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# The following functions never modify the nodes they are given: they return
+# new nodes instead.
+
+def _size(h: _PRBTNode) -> int:
+    return 0 if h is None else h.size
+
+
+def _is_red(h: _PRBTNode) -> bool:
+    return h is not None and h.red
+
+
+def _with_left(h: _PRBTNode, left: _PRBTNode) -> _PRBTNode:
+    return _PRBTNode(h.key, h.value, left, h.right, h.red)
+
+
+def _with_right(h: _PRBTNode, right: _PRBTNode) -> _PRBTNode:
+    return _PRBTNode(h.key, h.value, h.left, right, h.red)
+
+
+def _with_color(h: _PRBTNode, red: bool) -> _PRBTNode:
+    if h.red == red:
+        return h
+    return _PRBTNode(h.key, h.value, h.left, h.right, red)
+
+
+def _rotate_left(h: _PRBTNode) -> _PRBTNode:
+    x = h.right
+    assert _is_red(x)
+    return _PRBTNode(x.key, x.value,
+                     _PRBTNode(h.key, h.value, h.left, x.left, True),
+                     x.right, h.red)
+
+
+def _rotate_right(h: _PRBTNode) -> _PRBTNode:
+    x = h.left
+    assert _is_red(x)
+    return _PRBTNode(x.key, x.value, x.left,
+                     _PRBTNode(h.key, h.value, x.right, h.right, True),
+                     h.red)
+
+
+def _flip_colors(h: _PRBTNode) -> _PRBTNode:
+    return _PRBTNode(h.key, h.value, _with_color(h.left, not h.left.red),
+                     _with_color(h.right, not h.right.red), not h.red)
+
+
+def _balance(h: _PRBTNode) -> _PRBTNode:
+    """Restores the LLRB invariants at h, on the way up from an insertion or a
+    deletion."""
+    if _is_red(h.right) and not _is_red(h.left):
+        h = _rotate_left(h)
+    if _is_red(h.left) and _is_red(h.left.left):
+        h = _rotate_right(h)
+    if _is_red(h.left) and _is_red(h.right):
+        h = _flip_colors(h)
+    return h
+
+
+def _move_red_left(h: _PRBTNode) -> _PRBTNode:
+    """Assuming that h is RED and both h.left and h.left.left are BLACK, makes
+    h.left or one of its children RED."""
+    h = _flip_colors(h)
+    if _is_red(h.right.left):
+        h = _rotate_left(_with_right(h, _rotate_right(h.right)))
+        h = _flip_colors(h)
+    return h
+
+
+def _move_red_right(h: _PRBTNode) -> _PRBTNode:
+    """Assuming that h is RED and both h.right and h.right.left are BLACK,
+    makes h.right or one of its children RED."""
+    h = _flip_colors(h)
+    if _is_red(h.left.left):
+        h = _rotate_right(h)
+        h = _flip_colors(h)
+    return h
+
+
+def _insert(h: _PRBTNode, key: object, value: object) -> _PRBTNode:
+    if h is None:
+        return _PRBTNode(key, value, None, None, True)
+    if key < h.key:
+        h = _with_left(h, _insert(h.left, key, value))
+    elif h.key < key:
+        h = _with_right(h, _insert(h.right, key, value))
+    else:
+        h = _PRBTNode(h.key, value, h.left, h.right, h.red)
+    return _balance(h)
+
+
+def _minimum(h: _PRBTNode) -> _PRBTNode:
+    while h.left is not None:
+        h = h.left
+    return h
+
+
+def _delete_min(h: _PRBTNode) -> _PRBTNode:
+    if h.left is None:
+        return None
+    if not _is_red(h.left) and not _is_red(h.left.left):
+        h = _move_red_left(h)
+    return _balance(_with_left(h, _delete_min(h.left)))
+
+
+def _delete(h: _PRBTNode, key: object) -> _PRBTNode:
+    """Deletes key, which must be in the subtree rooted at h."""
+    if key < h.key:
+        if not _is_red(h.left) and not _is_red(h.left.left):
+            h = _move_red_left(h)
+        h = _with_left(h, _delete(h.left, key))
+    else:
+        if _is_red(h.left):
+            h = _rotate_right(h)
+        if key == h.key and h.right is None:
+            return None
+        if not _is_red(h.right) and not _is_red(h.right.left):
+            h = _move_red_right(h)
+        if key == h.key:
+            m = _minimum(h.right)
+            h = _PRBTNode(m.key, m.value, h.left, _delete_min(h.right), h.red)
+        else:
+            h = _with_right(h, _delete(h.right, key))
+    return _balance(h)
+
+
+class PersistentRBT:
+    """Persistent left-leaning red-black tree, which can be used either as a
+    sorted set or as a sorted map.
+
+    Instances of this class are immutable: insert and delete return new
+    instances, which share most of their nodes with the instance on which they
+    were called.
+
+    It's the responsibility of the client of this class to make sure that keys
+    provided to the methods of this class are comparable among them."""
+
+    def __init__(self):
+        self._root = None
+        assert validate(is_persistent_rbt, self)
+
+    def _new_version(self, root: _PRBTNode) -> "PersistentRBT":
+        """Returns a new PersistentRBT, with the same validation level as this
+        one, whose root is root.
+
+        Time complexity: O(1)."""
+        if root is not None and root.red:
+            root = _with_color(root, False)
+        t = type(self)()
+        set_validation_level(getattr(self, "_validation_level", None), t)
+        t._root = root
+        assert validate(is_persistent_rbt, t)
+        return t
+
+    @property
+    def size(self) -> int:
+        """Returns the number of keys in this tree.
+
+        Time complexity: O(1)."""
+        return _size(self._root)
+
+    def is_empty(self) -> bool:
+        """Returns true if this tree contains no keys, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._root is None
+
+    def insert(self, key: object, value: object = None) -> "PersistentRBT":
+        """Returns a new version of this tree which also contains key,
+        associated with value. If key is already in this tree, its value is
+        replaced in the new version.
+
+        This tree is not modified.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._new_version(_insert(self._root, key, value))
+
+    def delete(self, key: object) -> "PersistentRBT":
+        """Returns a new version of this tree which does not contain key.
+
+        If key is not in this tree, LookupError is raised. This tree is not
+        modified.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        if self._search(key) is None:
+            raise LookupError("key not in this PersistentRBT")
+
+        root = self._root
+        if not _is_red(root.left) and not _is_red(root.right):
+            root = _with_color(root, True)
+        return self._new_version(_delete(root, key))
+
+    def _search(self, key: object) -> _PRBTNode:
+        """Returns the node with key, or None if key is not in this tree.
+
+        Time complexity: O(log₂(n))."""
+        h = self._root
+        while h is not None:
+            if key < h.key:
+                h = h.left
+            elif h.key < key:
+                h = h.right
+            else:
+                return h
+
+    def contains(self, key: object) -> bool:
+        """Returns true if key is in this tree, false otherwise.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        return self._search(key) is not None
+
+    def __contains__(self, key: object) -> bool:
+        return self.contains(key)
+
+    def get(self, key: object, default: object = None) -> object:
+        """Returns the value associated with key, if key is in this tree,
+        otherwise default.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        h = self._search(key)
+        return h.value if h is not None else default
+
+    def __getitem__(self, key: object) -> object:
+        """Returns the value associated with key.
+
+        If key is not in this tree, KeyError is raised.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        h = self._search(key)
+        if h is None:
+            raise KeyError(key)
+        return h.value
+
+    def minimum(self) -> object:
+        """Returns the smallest key in this tree, or None if it is empty.
+
+        Time complexity: O(log₂(n))."""
+        if self._root is not None:
+            return _minimum(self._root).key
+
+    def maximum(self) -> object:
+        """Returns the greatest key in this tree, or None if it is empty.
+
+        Time complexity: O(log₂(n))."""
+        h = self._root
+        if h is not None:
+            while h.right is not None:
+                h = h.right
+            return h.key
+
+    def floor(self, key: object) -> object:
+        """Returns the greatest key in this tree which is less than or equal to
+        key, or None if there's no such key.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        floor = None
+        h = self._root
+        while h is not None:
+            if key < h.key:
+                h = h.left
+            elif h.key < key:
+                floor = h
+                h = h.right
+            else:
+                return h.key
+        return floor.key if floor is not None else None
+
+    def ceiling(self, key: object) -> object:
+        """Returns the smallest key in this tree which is greater than or equal
+        to key, or None if there's no such key.
+
+        Time complexity: O(log₂(n))."""
+        if key is None:
+            raise ValueError("key cannot be None")
+        ceil = None
+        h = self._root
+        while h is not None:
+            if key < h.key:
+                ceil = h
+                h = h.left
+            elif h.key < key:
+                h = h.right
+            else:
+                return h.key
+        return ceil.key if ceil is not None else None
+
+    def rank(self, key: object) -> int:
+        """Returns the number of keys strictly less than key.
+
+        If key is not in this tree, LookupError is raised.
+
+        Time complexity: O(log₂(n))."""
+        if not self.contains(key):
+            raise LookupError("key was not found")
+        r = 0
+        h = self._root
+        while h is not None:
+            if key < h.key:
+                h = h.left
+            elif h.key < key:
+                r += _size(h.left) + 1
+                h = h.right
+            else:
+                return r + _size(h.left)
+
+    def select(self, k: int) -> object:
+        """Returns the key of rank k, i.e. the (k + 1)th smallest key.
+
+        If k is not in the range [0, size), ValueError is raised.
+
+        Time complexity: O(log₂(n))."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0 or k >= self.size:
+            raise ValueError("k must be in the range [0, size)")
+        h = self._root
+        while True:
+            left_size = _size(h.left)
+            if k < left_size:
+                h = h.left
+            elif k > left_size:
+                k -= left_size + 1
+                h = h.right
+            else:
+                return h.key
+
+    def height(self) -> int:
+        """Returns the height of this tree.
+
+        Time complexity: O(n)."""
+
+        def h(u: _PRBTNode) -> int:
+            return 0 if u is None else 1 + max(h(u.left), h(u.right))
+
+        return h(self._root)
+
+    def _iter_nodes(self, lo: object, hi: object):
+        """Generator which yields the nodes whose keys are between lo and hi
+        (both included) in increasing order.
+
+        If lo (or hi) is None, there's no lower (or upper) bound.
+
+        Since nodes are never modified, new versions can be created while this
+        generator is being used."""
+        stack = []
+        h = self._root
+        while True:
+            while h is not None:
+                if lo is not None and h.key < lo:
+                    h = h.right
+                else:
+                    stack.append(h)
+                    h = h.left
+            if not stack:
+                return
+            h = stack.pop()
+            if hi is not None and hi < h.key:
+                return
+            yield h
+            h = h.right
+
+    def __iter__(self):
+        """Returns a generator which lazily yields the keys of this tree in
+        increasing order.
+
+        Time complexity: O(n) to yield all keys."""
+        return (h.key for h in self._iter_nodes(None, None))
+
+    def items(self, lo: object = None, hi: object = None):
+        """Returns a generator which lazily yields, in increasing order of the
+        keys, the tuples (key, value) of this tree such that lo <= key <= hi.
+
+        If lo (or hi) is None, there's no lower (or upper) bound.
+
+        Time complexity: O(log₂(n) + k), where k is the number of yielded
+        tuples."""
+        return ((h.key, h.value) for h in self._iter_nodes(lo, hi))
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def is_persistent_rbt(t: PersistentRBT) -> bool:
+    """Returns true if t is a valid PersistentRBT object, false otherwise, i.e.
+    if its keys are in strictly increasing order, its root is BLACK, no RED
+    node is a right child or has a RED left child, all paths from the root to
+    the leaves contain the same number of BLACK nodes, and the sizes of the
+    subtrees are consistent."""
+    if not isinstance(t, PersistentRBT):
+        return False
+    if _is_red(t._root):
+        return False
+
+    def h(u: _PRBTNode, lo: object, hi: object) -> int:
+        # Returns the black height of u, or -1 if an invariant is violated.
+        if u is None:
+            return 0
+        if not isinstance(u, _PRBTNode):
+            return -1
+        if (lo is not None and not lo < u.key) or (
+                hi is not None and not u.key < hi):
+            return -1
+        if _is_red(u.right) or (u.red and _is_red(u.left)):
+            return -1
+        if u.size != _size(u.left) + _size(u.right) + 1:
+            return -1
+        left = h(u.left, lo, u.key)
+        right = h(u.right, u.key, hi)
+        if left == -1 or left != right:
+            return -1
+        return left + (0 if u.red else 1)
+
+    return h(t._root, None, None) != -1
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/08/2015
 
-Updated: 28/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -108,28 +108,57 @@ A red-black tree works as a binary-search tree for search, insert, etc, so the
 complexity of those operations is T(n) = O(h), that is T(n) = O(log₂(n)), which
 is also the worst case complexity.
 
+## Split and join
+
+Two red-black trees l and r, such that all keys of l are smaller than all keys
+of r, can be joined, together with a key k in the middle, in O(|bh(l) - bh(r)|
++ 1) time, where bh is the black height: k is attached to the tree with the
+smallest black height, in place of the node with the same black height on the
+right (or left) spine of the other tree, and the tree is then fixed as after an
+insertion. Conversely, a tree can be split by a key into the trees of the
+smaller and greater keys in O(log₂(n)) time, by joining the subtrees which are
+hanging from the search path.
+
+The set operations union, intersection and difference can be implemented on top
+of split and join by divide-and-conquer, in O(m * log₂(n / m + 1)) time, where
+m <= n are the sizes of the two trees, which is much faster than inserting (or
+deleting) the m keys of the smallest tree one by one into (or from) the biggest
+one, when m is close to n, and asymptotically optimal.
+
 # References
 
 - https://en.wikipedia.org/wiki/Red%E2%80%93black_tree
 - Slides by prof. A. Carzaniga
 - Chapter 13 of Introduction to Algorithms (3rd ed.) by CLRS
+- https://en.wikipedia.org/wiki/Red%E2%80%93black_tree#Set_operations_and_bulk_operations
+- Just Join for Parallel Ordered Sets (2016), by G. E. Blelloch, D. Ferizovic
+and Y. Sun
+- Problem 13-2 of Introduction to Algorithms (3rd ed.) by CLRS
 """
 
 import math
 
+from ands.algorithms.recursion.is_sorted import pythonic_is_sorted
 from ands.ds.BST import BST, _BSTNode, is_bst
+from ands.validation import validate
 
 __all__ = ["RBT", "is_rbt"]
 
 RED = "RED"
 BLACK = "BLACK"
 
+# Bit of the shape bytes written by dump (see BST.dump) for RED nodes.
+_IS_RED = 4
+
 
 class _RBTNode(_BSTNode):
     """Class to represent a node of a RBT."""
 
-    def __init__(self, key, color=BLACK, parent=None, left=None, right=None):
-        _BSTNode.__init__(self, key, parent, left, right)
+    __slots__ = ("color",)
+
+    def __init__(self, key, color=BLACK, parent=None, left=None, right=None,
+                 value=None):
+        _BSTNode.__init__(self, key, parent, left, right, value)
         self.color = color
 
 
@@ -139,11 +168,81 @@ class RBT(BST):
     Since it's self-balancing operations such as inserting, searching or
     deletion all take O(log₂(n))."""
 
+    _DUMP_KIND = 1
+
     def __init__(self):
         BST.__init__(self)
 
-    def insert(self, key: object) -> None:
-        """Inserts key into this RBT.
+    @classmethod
+    def from_sorted(cls, iterable) -> "RBT":
+        """Creates and returns a new RBT containing the keys in iterable, which
+        must be sorted in increasing order, without calling insert.
+
+        The middle key becomes the root, and the left and right halves of the
+        keys are recursively used to build the left and right subtrees. The
+        resulting tree is therefore as balanced as possible: all its leaves are
+        either at depth d or d + 1, where d = floor(log₂(n + 1)) - 1. In order
+        to satisfy the red-black tree property, the nodes at depth d + 1 are
+        colored RED and all other nodes are colored BLACK.
+
+        Time complexity: O(n)."""
+        keys = list(iterable)
+        if any(key is None for key in keys):
+            raise ValueError("keys cannot be None")
+        assert validate(pythonic_is_sorted, keys)
+
+        t = cls()
+        if keys:
+            red_depth = (len(keys) + 1).bit_length() - 1
+            t._root = t._build_from_sorted(keys, 0, len(keys), 0, red_depth)
+            t._n = len(keys)
+
+        assert validate(is_rbt, t)
+        return t
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "RBT":
+        """Creates and returns a new RBT containing the keys in iterable, which
+        do not need to be sorted, by first sorting them and then calling
+        from_sorted.
+
+        Time complexity: O(n * log₂(n)), but the keys are sorted by the built-in
+        sorted function, so this is a lot faster than n calls to insert."""
+        keys = list(iterable)
+        if any(key is None for key in keys):
+            raise ValueError("keys cannot be None")
+        keys.sort()
+        return cls.from_sorted(keys)
+
+    def _build_from_sorted(self, keys: list, lo: int, hi: int, depth: int,
+                           red_depth: int) -> _RBTNode:
+        """Builds a balanced subtree containing the keys in keys[lo:hi], whose
+        root is at depth depth, and returns its root.
+
+        Nodes at depth red_depth are colored RED, all others BLACK.
+
+        Time complexity: O(hi - lo)."""
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        u = self._new_node(keys[mid], None)
+        u.color = RED if depth == red_depth else BLACK
+
+        u.left = self._build_from_sorted(keys, lo, mid, depth + 1, red_depth)
+        if u.left is not None:
+            u.left.parent = u
+
+        u.right = self._build_from_sorted(keys, mid + 1, hi, depth + 1,
+                                          red_depth)
+        if u.right is not None:
+            u.right.parent = u
+
+        self._update_node(u)
+        return u
+
+    def insert(self, key: object, value: object = None) -> None:
+        """Inserts key, associated with value, into this RBT.
 
         This operation is similar to the insert operation of a classical BST,
         but, in this case, the red-black tree property must be maintained, so
@@ -179,54 +278,61 @@ class RBT(BST):
         _fix_insertion handles these cases in the same order as above.
 
         Time complexity: O(log₂(n))."""
-        assert is_rbt(self)
+        assert validate(is_rbt, self)
 
         if key is None:
             raise ValueError("key cannot be None")
 
-        key_node = _RBTNode(key)
-
-        c = self._root  # Current node.
-        p = None  # Current node's parent.
-
-        while c is not None:
-            p = c
-            if key_node.key < c.key:
-                c = c.left
-            else:  # key.key >= c.key
-                c = c.right
-
-        key_node.parent = p
-
-        # while loop was not executed even once.
-        # Case 1: node is inserted as root.
-        if p is None:
-            self._root = key_node
-        elif p.key > key_node.key:
-            p.left = key_node
-        else:  # p.key < key.key
-            p.right = key_node
+        key_node = self._new_node(key, value)
+        self._insert_node(key_node)
 
         key_node.color = RED
-        self._n += 1
         self._fix_insertion(key_node)
 
-        assert is_rbt(self)
+        assert validate(is_rbt, self)
+
+    def _new_node(self, key: object, value: object) -> _RBTNode:
+        return _RBTNode(key, value=value)
+
+    def _dump_node_flags(self, u: _RBTNode) -> int:
+        return _IS_RED if u.color == RED else 0
+
+    def _load_node_flags(self, u: _RBTNode, flags: int) -> None:
+        u.color = RED if flags & _IS_RED else BLACK
+
+    @classmethod
+    def load(cls, fp) -> "RBT":
+        """Creates and returns a new RBT from the binary file-like object fp,
+        which must contain a RBT written by dump (see BST.load).
 
-    def _fix_insertion(self, u: _RBTNode) -> None:
+        Time complexity: O(n)."""
+        t = super().load(fp)
+        assert validate(is_rbt, t)
+        return t
+
+    def _fix_insertion(self, u: _RBTNode) -> bool:
+        """Restores the red-black tree property after the RED node u has been
+        inserted.
+
+        Returns true if the root was colored BLACK from RED, i.e. if the black
+        height of this tree has increased by 1, false otherwise.
+
+        Time complexity: O(log₂(n))."""
         # u is the root and we color it BLACK.
         if u.parent is None:
+            grew = u.color == RED
             u.color = BLACK
+            return grew
 
         elif u.parent.color == BLACK:
-            return
+            return False
 
         elif (u.parent.color == RED and
               (u.uncle is not None and u.uncle.color == RED)):
             u.parent.color = BLACK
             u.uncle.color = BLACK
             u.grandparent.color = RED
-            self._fix_insertion(u.grandparent)
+            return self._fix_insertion(u.grandparent)
 
         elif (u.parent.color == RED and
               (u.uncle is None or u.uncle.color == BLACK)):
@@ -247,12 +353,12 @@ class RBT(BST):
                 # specifically, u.parent and u, which are both left children of
                 # their parents.
 
-                self._fix_insertion(u.left)
+                return self._fix_insertion(u.left)
 
             # u is added as a left child to a node that is the right child.
             elif u.parent.is_right_child() and u.is_left_child():
                 self._right_rotate(u.parent)
-                self._fix_insertion(u.right)
+                return self._fix_insertion(u.right)
 
             # u is added as a left child to a node that is the left child.
             elif u.parent.is_left_child() and u.is_left_child():
@@ -271,71 +377,13 @@ class RBT(BST):
             else:
                 assert False
 
-    def _left_rotate(self, u: _RBTNode) -> _RBTNode:
-        """Left rotates the subtree rooted at node u.
-
-        Returns the node which is at the previous position of u, that is it
-        returns the parent of u.
-
-        Time complexity: O(1)."""
-        assert u.has_right_child()
-
-        u.right.parent = u.parent
-
-        # Only the root has a None parent.
-        if not u.has_parent():
-            self._root = u.right
-
-        # Checking if u is a left or a right child, in order to set the new left
-        # or right child respectively of its parent.
-        elif u.is_left_child():
-            u.parent.left = u.right
-        else:
-            u.parent.right = u.right
-
-        u.parent = u.right
-
-        # The new right child of u becomes what is the left child of its
-        # previous right child.
-        u.right = u.parent.left
-
-        # Set u to be the parent of its new right child.
-        if u.has_right_child():
-            u.right.parent = u
-
-        # Set u to be the new left child of its new parent.
-        u.parent.left = u
-        return u.parent
-
-    def _right_rotate(self, u: _RBTNode) -> _RBTNode:
-        """Right rotates the subtree rooted at node u.
-
-        Time complexity: O(1)."""
-        assert u.has_left_child()
-
-        u.left.parent = u.parent
-
-        if not u.has_parent():
-            self._root = u.left
-        elif u.is_left_child():
-            u.parent.left = u.left
-        else:
-            u.parent.right = u.left
-
-        u.parent = u.left
-        u.left = u.parent.right
-
-        if u.has_left_child():
-            u.left.parent = u
-
-        u.parent.right = u
-        return u.parent
+        return False
 
     def delete(self, key: object) -> None:
         """Delete key from this RBT object.
 
         Time complexity: O(log₂(n))."""
-        assert is_rbt(self)
+        assert validate(is_rbt, self)
 
         # A few checks of the inputs given.
         if key is None:
@@ -345,6 +393,15 @@ class RBT(BST):
         if key_node is None:
             raise LookupError("key not in this BST")
 
+        self._delete_node(key_node)
+
+        assert validate(is_rbt, self)
+
+    def _delete_node(self, key_node: _RBTNode) -> None:
+        """Removes key_node from this RBT and restores the red-black tree
+        property.
+
+        Time complexity: O(log₂(n))."""
         # If key has 2 non-leaf children, then replace key with its successor.
         # Note: we exchange also the colors of key and its successor.
         if key_node.has_left_child() and key_node.has_right_child():
@@ -451,7 +508,10 @@ class RBT(BST):
 
         self._n -= 1
 
-        assert is_rbt(self)
+        # key_node.parent is still the node key_node was removed from, so all
+        # nodes whose subtrees have lost one node are key_node.parent and its
+        # ancestors.
+        self._update_path(key_node.parent)
 
     def _delete_case_1(self, u: _RBTNode) -> None:
         # This check is necessary because this function is also called from the
@@ -542,23 +602,346 @@ class RBT(BST):
         """Removes the greatest element from self.
 
         Time complexity: O(log₂(n))."""
-        assert is_rbt(self)
+        assert validate(is_rbt, self)
         if self._root is not None:
             m = self.maximum()
             assert m is not None
             self.delete(m)
-            assert is_rbt(self)
+            assert validate(is_rbt, self)
 
     def remove_min(self) -> None:
         """Removes the smallest element from self.
 
         Time complexity: O(log₂(n))."""
-        assert is_rbt(self)
+        assert validate(is_rbt, self)
         if self._root is not None:
             m = self.minimum()
             assert m is not None
             self.delete(m)
-            assert is_rbt(self)
+            assert validate(is_rbt, self)
+
+    # Split, join and set operations.
+
+    def split(self, key: object) -> tuple:
+        """Splits this RBT into two RBTs: left, which contains all keys smaller
+        than key, and right, which contains all keys greater than key.
+
+        Returns the tuple (left, item, right), where item is the tuple (key,
+        value) of the node with key, if key was in this RBT, otherwise None.
+
+        If there are several nodes with key, only one of them is returned as
+        item, and the others end up either in left or in right.
+
+        This RBT is emptied.
+
+        Time complexity: O(log₂(n))."""
+        assert validate(is_rbt, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        l, lbh, found, r, rbh = self._split_node(self._root,
+                                                 self._black_height(), key)
+        left = self._from_root(l)
+        right = self._from_root(r)
+        self._forget_nodes()
+
+        assert validate(is_rbt, left) and validate(is_rbt, right)
+        return left, (found.key, found.value) if found else None, right
+
+    @classmethod
+    def join(cls, left: "RBT", key: object, right: "RBT",
+             value: object = None) -> "RBT":
+        """Creates and returns a new RBT containing all keys of left, key,
+        associated with value, and all keys of right.
+
+        All keys of left must be smaller than or equal to key, and key must be
+        smaller than or equal to all keys of right, otherwise ValueError is
+        raised. Both left and right are emptied.
+
+        Time complexity: O(log₂(n)), where n is the size of the resulting RBT,
+        but the actual joining of the trees only takes O(|bh(left) -
+        bh(right)| + 1) time, where bh is the black height."""
+        if not isinstance(left, RBT) or not isinstance(right, RBT):
+            raise TypeError("left and right must be instances of RBT")
+        if key is None:
+            raise ValueError("key cannot be None")
+        assert validate(is_rbt, left) and validate(is_rbt, right)
+        if left is right and not left.is_empty():
+            raise ValueError("left and right cannot be the same RBT")
+        if ((not left.is_empty() and key < left.maximum()) or
+                (not right.is_empty() and right.minimum() < key)):
+            raise ValueError("keys of left must be <= key <= keys of right")
+
+        t = cls()
+        root, _ = t._join_nodes(left._root, left._black_height(),
+                                 t._new_node(key, value),
+                                 right._root, right._black_height())
+        t._set_root(root)
+        left._forget_nodes()
+        right._forget_nodes()
+
+        assert validate(is_rbt, t)
+        return t
+
+    def union(self, other: "RBT") -> None:
+        """Adds to this RBT all keys of other which are not in this RBT, i.e.
+        this RBT becomes the union of the two sets of keys. If a key is in both
+        trees, the value associated with it in this RBT is kept.
+
+        other is emptied, since its nodes are moved to this RBT.
+
+        This and the other set operations assume that both trees do not contain
+        duplicate keys.
+
+        Time complexity: O(m * log₂(n / m + 1)), where m and n are respectively
+        the sizes of the smallest and of the biggest of the two trees."""
+        self._check_set_operand(other)
+        if other is self:
+            return
+        root, _ = self._union(self._root, self._black_height(), other._root,
+                               other._black_height())
+        self._set_root(root)
+        other._forget_nodes()
+        assert validate(is_rbt, self)
+
+    def intersection(self, other: "RBT") -> None:
+        """Removes from this RBT all keys which are not in other, i.e. this RBT
+        becomes the intersection of the two sets of keys.
+
+        other is emptied.
+
+        Time complexity: O(m * log₂(n / m + 1)), where m and n are respectively
+        the sizes of the smallest and of the biggest of the two trees."""
+        self._check_set_operand(other)
+        if other is self:
+            return
+        root, _ = self._intersection(self._root, self._black_height(),
+                                      other._root, other._black_height())
+        self._set_root(root)
+        other._forget_nodes()
+        assert validate(is_rbt, self)
+
+    def difference(self, other: "RBT") -> None:
+        """Removes from this RBT all keys which are in other, i.e. this RBT
+        becomes the difference between the two sets of keys.
+
+        other is emptied.
+
+        Time complexity: O(m * log₂(n / m + 1)), where m and n are respectively
+        the sizes of the smallest and of the biggest of the two trees."""
+        self._check_set_operand(other)
+        if other is self:
+            self.clear()
+            return
+        root, _ = self._difference(self._root, self._black_height(),
+                                    other._root, other._black_height())
+        self._set_root(root)
+        other._forget_nodes()
+        assert validate(is_rbt, self)
+
+    def _check_set_operand(self, other: "RBT") -> None:
+        if not isinstance(other, RBT):
+            raise TypeError("other must be an instance of RBT")
+        assert validate(is_rbt, self) and validate(is_rbt, other)
+
+    def _black_height(self) -> int:
+        """Returns the number of BLACK nodes on any path from the root to a
+        leaf.
+
+        Time complexity: O(log₂(n))."""
+        bh = 0
+        u = self._root
+        while u is not None:
+            if u.color == BLACK:
+                bh += 1
+            u = u.left
+        return bh
+
+    def _set_root(self, u: _RBTNode) -> None:
+        """Sets the detached subtree rooted at u as the whole tree.
+
+        Time complexity: O(1)."""
+        RBT._blacken(u, 0)
+        BST._set_root(self, u)
+
+    @staticmethod
+    def _blacken(u: _RBTNode, bh: int) -> int:
+        """Colors u BLACK, if it is a RED node, and returns its new black height,
+        given its current black height bh.
+
+        Time complexity: O(1)."""
+        if u is not None and u.color == RED:
+            u.color = BLACK
+            return bh + 1
+        return bh
+
+    @staticmethod
+    def _expose(u: _RBTNode) -> tuple:
+        """Detaches u from its children and returns them as a tuple (left,
+        right) of detached subtrees.
+
+        Time complexity: O(1)."""
+        left, right = u.left, u.right
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+        u.left = u.right = u.parent = None
+        return left, right
+
+    @staticmethod
+    def _child_bh(u: _RBTNode, bh: int) -> int:
+        """Returns the black height of the children of u, given the black height
+        bh of u."""
+        return bh - 1 if u.color == BLACK else bh
+
+    # The following methods operate on detached subtrees, i.e. subtrees whose
+    # roots have no parent, passed together with their black heights, and they
+    # return the resulting detached subtrees in the same way. self._root is
+    # used as a scratch variable by the rotations.
+
+    def _join_nodes(self, l: _RBTNode, lbh: int, x: _RBTNode, r: _RBTNode,
+                    rbh: int) -> tuple:
+        """Joins the subtrees l and r, whose black heights are lbh and rbh,
+        using x as the node in the middle, and returns the tuple (root, bh) of
+        the resulting subtree.
+
+        If l is taller than r, x is attached, as a RED node, in place of the
+        BLACK node on the right spine of l whose black height is equal to the
+        one of r, and the red-black tree property is then restored as after an
+        insertion. The case in which r is taller than l is symmetric.
+
+        Time complexity: O(|lbh - rbh| + 1)."""
+        lbh = RBT._blacken(l, lbh)
+        rbh = RBT._blacken(r, rbh)
+        x.parent = None
+
+        if lbh == rbh:
+            x.left, x.right = l, r
+            if l is not None:
+                l.parent = x
+            if r is not None:
+                r.parent = x
+            x.color = BLACK
+            self._update_node(x)
+            return x, lbh + 1
+
+        self._root = l if lbh > rbh else r
+        c = self._root
+        h = max(lbh, rbh)
+        target = min(lbh, rbh)
+        p = None
+
+        while c is not None and (c.color == RED or h > target):
+            if c.color == BLACK:
+                h -= 1
+            p = c
+            c = c.right if lbh > rbh else c.left
+
+        assert p is not None
+        x.parent = p
+        x.color = RED
+
+        if lbh > rbh:
+            x.left, x.right = c, r
+            p.right = x
+        else:
+            x.left, x.right = l, c
+            p.left = x
+
+        if x.left is not None:
+            x.left.parent = x
+        if x.right is not None:
+            x.right.parent = x
+
+        self._update_path(x)
+        grew = self._fix_insertion(x)
+        return self._root, max(lbh, rbh) + (1 if grew else 0)
+
+    def _join2(self, l: _RBTNode, lbh: int, r: _RBTNode, rbh: int) -> tuple:
+        """Joins the subtrees l and r without a node in the middle, by using
+        the maximum of l as the middle node.
+
+        Time complexity: O(log₂(n))."""
+        if l is None:
+            return r, rbh
+        l, lbh, m = self._split_last(l, lbh)
+        return self._join_nodes(l, lbh, m, r, rbh)
+
+    def _split_last(self, u: _RBTNode, bh: int) -> tuple:
+        """Removes the node with the maximum key from the subtree u and returns
+        the tuple (root, bh, node), where root and bh represent the remaining
+        subtree.
+
+        Time complexity: O(log₂(n))."""
+        cbh = RBT._child_bh(u, bh)
+        l, r = RBT._expose(u)
+        if r is None:
+            return l, cbh, u
+        r, rbh, m = self._split_last(r, cbh)
+        root, bh = self._join_nodes(l, cbh, u, r, rbh)
+        return root, bh, m
+
+    def _split_node(self, u: _RBTNode, bh: int, key: object) -> tuple:
+        """Splits the subtree u by key and returns the tuple (l, lbh, found, r,
+        rbh), where found is the node with key, if any, otherwise None.
+
+        Time complexity: O(log₂(n)), since the costs of the joins along the
+        search path telescope."""
+        if u is None:
+            return None, 0, None, None, 0
+
+        cbh = RBT._child_bh(u, bh)
+        l, r = RBT._expose(u)
+
+        if key == u.key:
+            return l, cbh, u, r, cbh
+        elif key < u.key:
+            ll, llbh, found, lr, lrbh = self._split_node(l, cbh, key)
+            r, rbh = self._join_nodes(lr, lrbh, u, r, cbh)
+            return ll, llbh, found, r, rbh
+        else:
+            rl, rlbh, found, rr, rrbh = self._split_node(r, cbh, key)
+            l, lbh = self._join_nodes(l, cbh, u, rl, rlbh)
+            return l, lbh, found, rr, rrbh
+
+    def _union(self, u1: _RBTNode, bh1: int, u2: _RBTNode, bh2: int) -> tuple:
+        if u1 is None:
+            return u2, bh2
+        if u2 is None:
+            return u1, bh1
+        cbh1 = RBT._child_bh(u1, bh1)
+        l1, r1 = RBT._expose(u1)
+        l2, l2bh, _, r2, r2bh = self._split_node(u2, bh2, u1.key)
+        l, lbh = self._union(l1, cbh1, l2, l2bh)
+        r, rbh = self._union(r1, cbh1, r2, r2bh)
+        return self._join_nodes(l, lbh, u1, r, rbh)
+
+    def _intersection(self, u1: _RBTNode, bh1: int, u2: _RBTNode,
+                      bh2: int) -> tuple:
+        if u1 is None or u2 is None:
+            return None, 0
+        cbh1 = RBT._child_bh(u1, bh1)
+        l1, r1 = RBT._expose(u1)
+        l2, l2bh, found, r2, r2bh = self._split_node(u2, bh2, u1.key)
+        l, lbh = self._intersection(l1, cbh1, l2, l2bh)
+        r, rbh = self._intersection(r1, cbh1, r2, r2bh)
+        if found is not None:
+            return self._join_nodes(l, lbh, u1, r, rbh)
+        return self._join2(l, lbh, r, rbh)
+
+    def _difference(self, u1: _RBTNode, bh1: int, u2: _RBTNode,
+                    bh2: int) -> tuple:
+        if u1 is None:
+            return None, 0
+        if u2 is None:
+            return u1, bh1
+        cbh2 = RBT._child_bh(u2, bh2)
+        l2, r2 = RBT._expose(u2)
+        l1, l1bh, _, r1, r1bh = self._split_node(u1, bh1, u2.key)
+        l, lbh = self._difference(l1, l1bh, l2, cbh2)
+        r, rbh = self._difference(r1, r1bh, r2, cbh2)
+        return self._join2(l, lbh, r, rbh)
 
 
 def black_height(n: _RBTNode) -> int:
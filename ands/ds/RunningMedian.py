@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+The median of a stream of numbers can be maintained, as the numbers arrive,
+with two heaps:
+
+- a MaxHeap, lo, which contains the smaller half of the numbers, and
+
+- a MinHeap, hi, which contains the greater half of the numbers,
+
+so that every number in lo is smaller than or equal to every number in hi, and
+lo contains either as many numbers as hi or one more. The median is then either
+the greatest number in lo or the mean of the greatest number in lo and of the
+smallest number in hi, which can be found in O(1) time. A new number is added
+either to lo or to hi, depending on whether it is smaller than or equal to the
+greatest number in lo or not, and, if the heaps are then unbalanced, the top of
+one of them is moved to the other, in O(log(n)) time.
+
+## Sliding windows
+
+To compute the median of the last w numbers of a stream, the numbers which
+leave the window must also be removed from the heaps. Removing an arbitrary
+element from a heap (see BinaryHeap.delete) takes O(n) time, since it needs to
+be found first. SlidingWindowMedian uses lazy deletion instead: an expired
+number is only counted in a dictionary of pending deletions and is no longer
+counted in the size of its heap, and it is removed from its heap only when it
+reaches its top. When the pending deletions outnumber the numbers in the
+window, both heaps are rebuilt from the numbers in the window, so that the
+heaps never contain more than 2 * w numbers.
+
+# References
+
+- https://en.wikipedia.org/wiki/Median
+- https://leetcode.com/problems/sliding-window-median/
+"""
+
+from collections import deque
+
+from ands.ds.MaxHeap import MaxHeap
+from ands.ds.MinHeap import MinHeap
+from ands.validation import validate
+
+__all__ = ["RunningMedian", "SlidingWindowMedian", "is_running_median"]
+
+
+class RunningMedian:
+    """Maintains the median of all numbers added to it.
+
+    Public interface:
+
+    - size
+    - is_empty
+    - add
+    - median
+    - median_low
+    - median_high
+
+    Numbers must be comparable among them (and numbers which compare equal must
+    have the same hash, for SlidingWindowMedian). median_low and median_high
+    also work for other comparable objects, e.g. strings."""
+
+    def __init__(self):
+        self._lo = MaxHeap()
+        self._hi = MinHeap()
+        # Numbers of elements of lo and hi which are not pending deletion.
+        self._lo_size = 0
+        self._hi_size = 0
+        # Maps each number pending deletion to the number of its occurrences
+        # which are pending deletion.
+        self._delayed = {}
+
+    @property
+    def size(self) -> int:
+        """Returns the number of numbers whose median is maintained.
+
+        Time complexity: O(1)."""
+        return self._lo_size + self._hi_size
+
+    def is_empty(self) -> bool:
+        """Returns true if there are no numbers, false otherwise.
+
+        Time complexity: O(1)."""
+        return self.size == 0
+
+    def add(self, x: object) -> None:
+        """Adds number x.
+
+        Time complexity: O(log(n))."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        if self._lo_size == 0 or not self._lo.find_max() < x:
+            self._lo.add(x)
+            self._lo_size += 1
+        else:
+            self._hi.add(x)
+            self._hi_size += 1
+        self._rebalance()
+        assert validate(is_running_median, self)
+
+    def median(self) -> object:
+        """Returns the median of the numbers, i.e. the middle one, if their
+        count is odd, otherwise the mean of the two middle ones, or None if
+        there are no numbers.
+
+        Time complexity: O(1)."""
+        if self.is_empty():
+            return None
+        if self._lo_size > self._hi_size:
+            return self._lo.find_max()
+        return (self._lo.find_max() + self._hi.find_min()) / 2
+
+    def median_low(self) -> object:
+        """Returns the middle number, if the count of the numbers is odd,
+        otherwise the smaller of the two middle ones, or None if there are no
+        numbers.
+
+        Time complexity: O(1)."""
+        return None if self.is_empty() else self._lo.find_max()
+
+    def median_high(self) -> object:
+        """Returns the middle number, if the count of the numbers is odd,
+        otherwise the greater of the two middle ones, or None if there are no
+        numbers.
+
+        Time complexity: O(1)."""
+        if self.is_empty():
+            return None
+        if self._lo_size > self._hi_size:
+            return self._lo.find_max()
+        return self._hi.find_min()
+
+    def _rebalance(self) -> None:
+        """Moves the top of lo to hi or vice-versa, if lo contains more than
+        one number more than hi or less numbers than hi.
+
+        Time complexity: O(log(n)), amortized."""
+        if self._lo_size > self._hi_size + 1:
+            self._hi.add(self._lo.remove_max())
+            self._lo_size -= 1
+            self._hi_size += 1
+            self._prune(self._lo, self._lo.remove_max, self._lo.find_max)
+        elif self._lo_size < self._hi_size:
+            self._lo.add(self._hi.remove_min())
+            self._hi_size -= 1
+            self._lo_size += 1
+            self._prune(self._hi, self._hi.remove_min, self._hi.find_min)
+
+    def _prune(self, heap, remove, find) -> None:
+        """Removes from the top of heap the numbers pending deletion, so that
+        its top is never pending deletion.
+
+        Time complexity: O(log(n)), amortized."""
+        delayed = self._delayed
+        while delayed and not heap.is_empty():
+            x = find()
+            count = delayed.get(x)
+            if count is None:
+                break
+            if count == 1:
+                del delayed[x]
+            else:
+                delayed[x] = count - 1
+            remove()
+
+
+class SlidingWindowMedian(RunningMedian):
+    """Maintains the median of the last window_size numbers added to it.
+
+    Sub-class of RunningMedian, and thus provides the same public interface,
+    but in addition provides:
+
+    - window_size
+    - remove_oldest
+
+    Numbers must be hashable."""
+
+    def __init__(self, window_size: int):
+        if not isinstance(window_size, int):
+            raise TypeError("window_size must be an instance of int")
+        if window_size < 1:
+            raise ValueError("window_size must be greater than or equal to 1")
+        RunningMedian.__init__(self)
+        self.window_size = window_size
+        self._window = deque()
+        # Total number of numbers pending deletion.
+        self._pending = 0
+
+    def add(self, x: object) -> object:
+        """Adds number x and, if the window already contains window_size
+        numbers, removes and returns the oldest number, otherwise it returns
+        None.
+
+        Time complexity: O(log(w)), amortized, where w is the window size."""
+        RunningMedian.add(self, x)
+        self._window.append(x)
+        if len(self._window) > self.window_size:
+            return self.remove_oldest()
+
+    def remove_oldest(self) -> object:
+        """Removes and returns the oldest number in the window, e.g. for windows
+        of variable size, or None if the window is empty.
+
+        Time complexity: O(log(w)), amortized."""
+        if not self._window:
+            return None
+        x = self._window.popleft()
+        self._delayed[x] = self._delayed.get(x, 0) + 1
+        self._pending += 1
+
+        if not self._lo.find_max() < x:
+            self._lo_size -= 1
+            self._prune(self._lo, self._lo.remove_max, self._lo.find_max)
+        else:
+            self._hi_size -= 1
+            self._prune(self._hi, self._hi.remove_min, self._hi.find_min)
+        self._rebalance()
+
+        if self._pending > len(self._window):
+            self._rebuild()
+        assert validate(is_running_median, self)
+        return x
+
+    def _prune(self, heap, remove, find) -> None:
+        before = heap.size
+        RunningMedian._prune(self, heap, remove, find)
+        self._pending -= before - heap.size
+
+    def _rebuild(self) -> None:
+        """Rebuilds lo and hi from the numbers in the window, discarding the
+        numbers pending deletion.
+
+        Time complexity: O(w * log(w))."""
+        xs = sorted(self._window)
+        mid = (len(xs) + 1) // 2
+        self._lo = MaxHeap(xs[:mid])
+        self._hi = MinHeap(xs[mid:])
+        self._lo_size = mid
+        self._hi_size = len(xs) - mid
+        self._delayed.clear()
+        self._pending = 0
+
+
+def is_running_median(m: RunningMedian) -> bool:
+    """Returns true if m is a valid RunningMedian (or SlidingWindowMedian),
+    false otherwise, i.e. if lo contains as many numbers as hi or one more, and
+    the greatest number in lo is not greater than the smallest one in hi, and
+    neither of them is pending deletion."""
+    if not isinstance(m, RunningMedian):
+        return False
+    if not 0 <= m._lo_size - m._hi_size <= 1:
+        return False
+    if m._lo_size > m._lo.size or m._hi_size > m._hi.size:
+        return False
+    if m._hi_size > 0:
+        lo_max = m._lo.find_max()
+        hi_min = m._hi.find_min()
+        if hi_min < lo_max or lo_max in m._delayed or hi_min in m._delayed:
+            return False
+    return True
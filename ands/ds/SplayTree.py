@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A splay tree is a self-adjusting binary-search tree: each time a node is
+accessed, it is moved to the root by a sequence of rotations, called splaying.
+No balance information is kept in the nodes.
+
+Splaying a node u, until it becomes the root, repeats one of the following
+steps, depending on the positions of u, of its parent p and of its grandparent
+g:
+
+1. zig: p is the root, then u is rotated over p;
+
+2. zig-zig: u and p are both left (or both right) children, then p is first
+rotated over g, and then u over p;
+
+3. zig-zag: u is a left child and p a right child, or vice-versa, then u is
+rotated first over p and then over g.
+
+A single operation can take O(n) time, but any sequence of m operations takes
+O(m * log₂(n)) time, i.e. each operation takes O(log₂(n)) amortized time.
+Moreover, frequently accessed keys stay close to the root, so that, when
+accesses are skewed, i.e. a few keys are accessed much more often than the
+others, splay trees can be faster than balanced trees, like red-black trees.
+For example, a splay tree is as fast as any static BST, up to a constant factor
+(the "static optimality theorem").
+
+The operations which splay are insert, delete, contains, get, __getitem__,
+__setitem__ and __delitem__. When a search is unsuccessful, the last node
+visited is splayed. Note that, since searches modify the tree, this tree should
+not be searched while it is being iterated.
+
+# References
+
+- https://en.wikipedia.org/wiki/Splay_tree
+- Self-Adjusting Binary Search Trees (1985), by D. D. Sleator and R. E. Tarjan
+"""
+
+from ands.ds.BST import BST, _BSTNode, is_bst
+from ands.validation import validate
+
+__all__ = ["SplayTree", "is_splay_tree"]
+
+
+class SplayTree(BST):
+    """Splay tree, i.e. a self-adjusting binary-search tree, whose operations
+    take O(log₂(n)) amortized time, and in which recently accessed keys are
+    close to the root.
+
+    This implementation does allow duplicate elements."""
+
+    _DUMP_KIND = 3
+
+    def __init__(self):
+        BST.__init__(self)
+        assert validate(is_splay_tree, self)
+
+    def _splay(self, u: _BSTNode) -> None:
+        """Moves u to the root of this tree by a sequence of zig, zig-zig and
+        zig-zag steps.
+
+        Time complexity: O(log₂(n)) amortized."""
+        while u.parent is not None:
+            p = u.parent
+            g = p.parent
+            if g is not None:
+                if (p.left is u) == (g.left is p):  # zig-zig
+                    self._rotate_up(p)
+                else:  # zig-zag
+                    self._rotate_up(u)
+            self._rotate_up(u)  # zig, or second half of zig-zig or zig-zag
+        assert self._root is u
+
+    def _rotate_up(self, u: _BSTNode) -> None:
+        """Rotates u over its parent p, i.e. right rotates p, if u is a left
+        child, otherwise left rotates p.
+
+        This is equivalent to self._right_rotate(p) or self._left_rotate(p),
+        but, since splaying performs a rotation for each node on the path from
+        the root to the accessed node, it avoids their redundant checks.
+
+        Time complexity: O(1)."""
+        p = u.parent
+        g = p.parent
+
+        if p.left is u:
+            p.left = u.right
+            if u.right is not None:
+                u.right.parent = p
+            u.right = p
+        else:
+            p.right = u.left
+            if u.left is not None:
+                u.left.parent = p
+            u.left = p
+
+        p.parent = u
+        u.parent = g
+        if g is None:
+            self._root = u
+        elif g.left is p:
+            g.left = u
+        else:
+            g.right = u
+
+        self._update_node(p)
+        self._update_node(u)
+
+    def _access(self, key: object) -> _BSTNode:
+        """Searches for key and splays the node with key, if key is in this
+        tree, otherwise the last node visited by the search.
+
+        Returns the node with key, or None if key is not in this tree.
+
+        Time complexity: O(log₂(n)) amortized."""
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        last = None
+        c = self._root
+        while c is not None:
+            last = c
+            if key == c.key:
+                break
+            elif key < c.key:
+                c = c.left
+            else:
+                c = c.right
+
+        if last is not None:
+            self._splay(last)
+
+        assert validate(is_splay_tree, self)
+        return c
+
+    def insert(self, key: object, value: object = None) -> None:
+        """Inserts key, associated with value, into this tree, and splays the
+        new node.
+
+        Time complexity: O(log₂(n)) amortized."""
+        assert validate(is_splay_tree, self)
+
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        u = self._new_node(key, value)
+        self._insert_node(u)
+        self._splay(u)
+
+        assert validate(is_splay_tree, self)
+
+    def contains(self, key: object) -> bool:
+        """Returns true if key is in this tree, false otherwise.
+
+        Time complexity: O(log₂(n)) amortized."""
+        return self._access(key) is not None
+
+    def get(self, key: object, default: object = None) -> object:
+        """Returns the value associated with key, if key is in this tree,
+        otherwise default.
+
+        Time complexity: O(log₂(n)) amortized."""
+        u = self._access(key)
+        return u.value if u is not None else default
+
+    def __getitem__(self, key: object) -> object:
+        """Returns the value associated with key.
+
+        If key is not in this tree, KeyError is raised.
+
+        Time complexity: O(log₂(n)) amortized."""
+        u = self._access(key)
+        if u is None:
+            raise KeyError(key)
+        return u.value
+
+    def __setitem__(self, key: object, value: object) -> None:
+        """Associates value with key, replacing the value previously associated
+        with key, if key is already in this tree, otherwise inserting key.
+
+        Time complexity: O(log₂(n)) amortized."""
+        u = self._access(key)
+        if u is None:
+            self.insert(key, value)
+        else:
+            u.value = value
+
+    def _delete_node(self, u: _BSTNode) -> None:
+        """Removes u from this tree, by splaying it, and then joining its left
+        and right subtrees, after having splayed the maximum of the left one.
+
+        Time complexity: O(log₂(n)) amortized."""
+        self._splay(u)
+        left, right = u.left, u.right
+        u.right = u.left = None
+        self._n -= 1
+
+        if left is None:
+            self._root = right
+            if right is not None:
+                right.parent = None
+            return
+
+        left.parent = None
+        self._root = left
+        m = BST._maximum(left)
+        self._splay(m)
+
+        # m is the maximum of the left subtree, so it has no right child.
+        m.right = right
+        if right is not None:
+            right.parent = m
+        self._update_node(m)
+
+
+def is_splay_tree(t: SplayTree) -> bool:
+    """Returns true if t is a valid SplayTree object, false otherwise, i.e. if
+    t is a valid BST."""
+    return isinstance(t, SplayTree) and is_bst(t)
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 05/09/2015
 
-Updated: 28/09/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -59,6 +59,8 @@ TSTs are:
 - http://stackoverflow.com/a/27178771/3924118
 """
 
+from ands.validation import validate
+
 __all__ = ["TST"]
 
 
@@ -80,7 +82,12 @@ class _TSTNode:
         lexicographically than key;
 
         - mid, which is a pointer to a _TSTNode whose key is the following
-        character of key in an inserted string."""
+        character of key in an inserted string.
+
+    These fields are declared in __slots__, so that nodes do not have a
+    per-instance __dict__."""
+
+    __slots__ = ("key", "value", "parent", "left", "mid", "right")
 
     def __init__(self, key, value=None, parent=None, left=None, mid=None,
                  right=None):
@@ -205,7 +212,7 @@ class TST:
         Time complexity: O(m + h), where m = length(key), which also represents
         how many times we follow the middle link, and h is the number of left
         and right turns. So, a lower bound of the complexity would be Ω(m)."""
-        assert is_tst(self)
+        assert validate(is_tst, self)
 
         if not isinstance(key, str):
             raise TypeError("key must be an instance of type str.")
@@ -215,7 +222,7 @@ class TST:
             raise ValueError("value cannot be None.")
         self._root = self._insert(self._root, key, value, 0)
 
-        assert is_tst(self)
+        assert validate(is_tst, self)
 
     def _insert(self, node: _TSTNode, key: str, value: object,
                 index: int) -> _TSTNode:
@@ -379,7 +386,7 @@ class TST:
         are. k is the number of "no more necessary" cleaned up after deletion of
         the node associated with key. Unnecessary nodes are nodes with no
         children and value equal to None."""
-        assert is_tst(self)
+        assert validate(is_tst, self)
 
         if not isinstance(key, str):
             raise TypeError("key must be an instance of type str.")
@@ -398,7 +405,7 @@ class TST:
         else:
             result = None
 
-        assert is_tst(self)
+        assert validate(is_tst, self)
 
         return result
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A min-heap which can be shared between threads, e.g. between producers and
+consumers of a thread pool, without any further synchronization.
+
+ThreadSafeMinHeap is a sub-class of queue.Queue, of the standard library, and
+thus provides the same interface (put, get, with optional blocking and timeout,
+task_done, join, qsize, empty, full and maxsize), but its elements are stored
+in a MinHeap, so that get always returns the smallest element.
+
+queue.Queue only holds its lock while it calls the hooks _put and _get, which
+here only append an element and push it up, or remove the root and push down
+the element which replaces it, in O(log(n)) time. The heap is never validated
+(see ands.validation) while the lock is held, since the O(n) validators would
+serialize all threads.
+
+# References
+
+- https://docs.python.org/3/library/queue.html
+- https://github.com/python/cpython/blob/main/Lib/queue.py
+"""
+
+import queue
+
+from ands.ds.MinHeap import MinHeap
+
+__all__ = ["ThreadSafeMinHeap"]
+
+
+class ThreadSafeMinHeap(queue.Queue):
+    """Thread-safe min-heap with the interface of queue.Queue.
+
+    If maxsize is less than or equal to 0, the heap is unbounded, otherwise
+    put blocks (or raises queue.Full) while it contains maxsize elements.
+    Similarly, get blocks (or raises queue.Empty) while it is empty.
+
+    key is a key function, as in MinHeap, and elements with equal keys are
+    returned in the order in which they were put."""
+
+    def __init__(self, maxsize: int = 0, key=None):
+        self._heap_key = key
+        queue.Queue.__init__(self, maxsize)
+
+    def put(self, x: object, block: bool = True, timeout: float = None) -> None:
+        """Puts x into this heap.
+
+        If x is None, ValueError is raised.
+
+        Time complexity: O(log(n)), plus the waiting time, if this heap is
+        full."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        queue.Queue.put(self, x, block, timeout)
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = MinHeap(key=self._heap_key)
+
+    def _qsize(self) -> int:
+        return self.queue.size
+
+    def _put(self, x: object) -> None:
+        """Adds x to self.queue without validating it.
+
+        Time complexity: O(log(n))."""
+        h = self.queue
+        h._append(x)
+        h._push_up(h.size - 1)
+
+    def _get(self) -> object:
+        """Removes and returns the smallest element of self.queue without
+        validating it.
+
+        Time complexity: O(log(n))."""
+        return self.queue._remove_root()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+A treap is a binary-search tree in which each node is also assigned a random
+priority, chosen independently of its key, and whose nodes are also
+heap-ordered with respect to their priorities: the priority of a node is
+smaller than or equal to the priorities of its children. The name comes from
+"tree" and "heap".
+
+Given the priorities, the shape of a treap is the one of the BST obtained by
+inserting its keys in increasing order of priority, i.e. the shape of a BST
+built by inserting the keys in random order, regardless of the actual order of
+the insertions. Hence, the expected height of a treap is O(log₂(n)), and the
+expected time of insert, delete and search is O(log₂(n)).
+
+Insertion inserts the new node as a leaf, as in BST, and then rotates it up
+until the heap order is restored. Deletion rotates the node down, towards the
+child with the smallest priority, until it has at most one child, and then
+removes it as in BST.
+
+## Split and merge
+
+A treap can be split, with respect to a key, into two treaps in expected
+O(log₂(n)) time, by simply descending the tree along the path of the key.
+Conversely, two treaps, where all keys of the first one are smaller than or
+equal to all keys of the second one, can be merged in expected O(log₂(n)) time,
+by descending the right spine of the first one and the left spine of the
+second one, choosing at each step the root with the smallest priority.
+
+# References
+
+- https://en.wikipedia.org/wiki/Treap
+- Randomized Search Trees (1996), by R. Seidel and C. R. Aragon
+- Introduction to Algorithms (3rd edition), problem 13-4, by CLRS
+"""
+
+import random
+
+from ands.ds.BST import BST, _BSTNode, is_bst
+from ands.validation import validate
+
+__all__ = ["Treap", "is_treap"]
+
+
+class _TreapNode(_BSTNode):
+    """Class to represent a node of a Treap."""
+
+    __slots__ = ("priority",)
+
+    def __init__(self, key, priority=0.0, parent=None, left=None, right=None,
+                 value=None):
+        _BSTNode.__init__(self, key, parent, left, right, value)
+        self.priority = priority
+
+
+class Treap(BST):
+    """Treap, i.e. a randomized binary-search tree, whose operations take
+    O(log₂(n)) expected time, independently of the order of the keys provided
+    by the client.
+
+    This implementation does allow duplicate elements."""
+
+    _DUMP_KIND = 2
+
+    def __init__(self):
+        BST.__init__(self)
+        assert validate(is_treap, self)
+
+    def _new_node(self, key: object, value: object) -> _TreapNode:
+        return _TreapNode(key, random.random(), value=value)
+
+    def insert(self, key: object, value: object = None) -> None:
+        """Inserts key, associated with value, into this treap.
+
+        Time complexity: O(log₂(n)) expected."""
+        assert validate(is_treap, self)
+
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        u = self._new_node(key, value)
+        self._insert_node(u)
+
+        # Rotate u up until its parent has a smaller priority.
+        while u.parent is not None and u.priority < u.parent.priority:
+            if u.is_left_child():
+                self._right_rotate(u.parent)
+            else:
+                self._left_rotate(u.parent)
+
+        assert validate(is_treap, self)
+
+    def delete(self, key: object) -> None:
+        """Deletes key from this treap.
+
+        If key is not in this treap, LookupError is raised.
+
+        Time complexity: O(log₂(n)) expected."""
+        BST.delete(self, key)
+        assert validate(is_treap, self)
+
+    def _delete_node(self, u: _TreapNode) -> None:
+        """Removes u from this treap, by first rotating it down until it has at
+        most one child.
+
+        Time complexity: O(log₂(n)) expected."""
+        while u.has_two_children():
+            # The child with the smallest priority takes the place of u.
+            if u.left.priority < u.right.priority:
+                self._right_rotate(u)
+            else:
+                self._left_rotate(u)
+        self._n -= 1
+        self._delete_when_at_most_one_child(u)
+        u.right = u.left = u.parent = None
+
+    def split(self, key: object) -> tuple:
+        """Splits this treap into two treaps: left, which contains all keys
+        smaller than key, and right, which contains all keys greater than key.
+
+        Returns the tuple (left, item, right), where item is the tuple (key,
+        value) of the node with key, if key was in this treap, otherwise None.
+
+        If there are several nodes with key, only one of them is returned as
+        item, and the others end up in right.
+
+        This treap is emptied.
+
+        Time complexity: O(log₂(n)) expected."""
+        assert validate(is_treap, self)
+        if key is None:
+            raise ValueError("key cannot be None")
+
+        l, r = self._split_node(self._root, key)
+
+        # All keys of r are greater than or equal to key, so, if key was in
+        # this treap, the minimum of r is a node with key.
+        item = None
+        if r is not None:
+            m = BST._minimum(r)
+            if m.key == key:
+                item = m.key, m.value
+                if m.parent is None:
+                    r = m.right
+                else:
+                    m.parent.left = m.right
+                if m.right is not None:
+                    m.right.parent = m.parent
+                self._update_path(m.parent)
+
+        left = self._from_root(l)
+        right = self._from_root(r)
+        self._forget_nodes()
+
+        assert validate(is_treap, left) and validate(is_treap, right)
+        return left, item, right
+
+    def _split_node(self, u: _TreapNode, key: object) -> tuple:
+        """Splits the subtree rooted at u into two detached subtrees, the first
+        of which contains the keys smaller than key, and the second one the
+        keys greater than or equal to key.
+
+        Returns the roots of the two subtrees.
+
+        Time complexity: O(log₂(n)) expected."""
+        if u is None:
+            return None, None
+
+        if u.key < key:
+            l, r = self._split_node(u.right, key)
+            u.right = l
+            if l is not None:
+                l.parent = u
+            self._update_node(u)
+            u.parent = None
+            return u, r
+        else:
+            l, r = self._split_node(u.left, key)
+            u.left = r
+            if r is not None:
+                r.parent = u
+            self._update_node(u)
+            u.parent = None
+            return l, u
+
+    @classmethod
+    def merge(cls, left: "Treap", right: "Treap") -> "Treap":
+        """Creates and returns a new treap containing all keys of left and of
+        right.
+
+        All keys of left must be smaller than or equal to all keys of right,
+        otherwise ValueError is raised. Both left and right are emptied.
+
+        Time complexity: O(log₂(n)) expected, where n is the size of the
+        resulting treap."""
+        if not isinstance(left, Treap) or not isinstance(right, Treap):
+            raise TypeError("left and right must be instances of Treap")
+        assert validate(is_treap, left) and validate(is_treap, right)
+        if left is right and not left.is_empty():
+            raise ValueError("left and right cannot be the same Treap")
+        if (not left.is_empty() and not right.is_empty() and
+                right.minimum() < left.maximum()):
+            raise ValueError("keys of left must be <= keys of right")
+
+        t = cls()
+        t._set_root(t._merge_nodes(left._root, right._root))
+        left._forget_nodes()
+        right._forget_nodes()
+
+        assert validate(is_treap, t)
+        return t
+
+    def _merge_nodes(self, a: _TreapNode, b: _TreapNode) -> _TreapNode:
+        """Merges the detached subtrees rooted at a and b, where all keys of a
+        are smaller than or equal to all keys of b, and returns the root of the
+        resulting subtree.
+
+        Time complexity: O(log₂(n)) expected."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        if a.priority < b.priority:
+            a.right = self._merge_nodes(a.right, b)
+            a.right.parent = a
+            self._update_node(a)
+            return a
+        else:
+            b.left = self._merge_nodes(a, b.left)
+            b.left.parent = b
+            self._update_node(b)
+            return b
+
+    def _load(self, fp) -> None:
+        """Loads the nodes of this treap written by dump, and rebuilds it with
+        new random priorities.
+
+        Priorities are not stored by dump, and they cannot be fitted to the
+        loaded shape, since they would then depend on the keys, and the
+        expected height of the treap would no more be O(log₂(n)) after further
+        operations. Instead, each node is assigned a new random priority, and
+        the treap of the sorted nodes with these priorities, i.e. their
+        Cartesian tree, is built from left to right with a stack, which holds
+        the right spine of the treap built so far.
+
+        Time complexity: O(n)."""
+        BST._load(self, fp)
+
+        nodes = list(self._iter_nodes(None, None, False))
+        stack = []
+        for u in nodes:
+            u.priority = random.random()
+            u.parent = u.right = None
+            # The nodes of the right spine with greater priorities than u
+            # become the left subtree of u, and they are complete.
+            last = None
+            while stack and stack[-1].priority > u.priority:
+                last = stack.pop()
+                self._update_node(last)
+            u.left = last
+            if last is not None:
+                last.parent = u
+            if stack:
+                stack[-1].right = u
+                u.parent = stack[-1]
+            stack.append(u)
+        self._root = stack[0] if stack else None
+        while stack:
+            self._update_node(stack.pop())
+
+        assert validate(is_treap, self)
+
+
+def is_treap(t: Treap) -> bool:
+    """Returns true if t is a valid Treap object, false otherwise, i.e. if t is
+    a valid BST whose nodes are _TreapNode objects, and the priority of each
+    node is smaller than or equal to the priorities of its children."""
+    if not isinstance(t, Treap) or not is_bst(t):
+        return False
+
+    stack = [t._root] if t._root is not None else []
+    while stack:
+        u = stack.pop()
+        if not isinstance(u, _TreapNode):
+            return False
+        for c in (u.left, u.right):
+            if c is not None:
+                if not isinstance(c, _TreapNode) or c.priority < u.priority:
+                    return False
+                stack.append(c)
+
+    return True
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Most data structures and several algorithms of this package assert, before
+and/or after each operation, that their invariants hold, by calling a validator
+(e.g. is_bst or is_min_heap), which usually visits the whole structure, thus it
+usually runs in O(n) time. See CONVENTIONS.md to know more about the reasons
+why we use assertions.
+
+These assertions are removed if Python is run with the -O flag, but this affects
+the whole process. This module allows to choose, package-wide or for single
+data structures, how often the validators are actually called, while the cheap
+O(1) assertions are kept. The available validation levels are:
+
+- OFF, i.e. the validators are never called;
+
+- SAMPLED, i.e. a validator is only called once every sample rate calls (which
+can be specified with set_sample_rate);
+
+- FULL, i.e. the validators are always called, which is the default.
+
+The initial package-wide validation level and sample rate can also be specified
+through the environment variables ANDS_VALIDATION (whose value must be either
+"off", "sampled" or "full") and ANDS_VALIDATION_SAMPLE_RATE.
+
+Validators should be called through the function validate in an assert
+statement as follows
+
+    assert validate(is_bst, self)
+
+so that no work at all is done if Python is run with the -O flag.
+
+# References
+
+- https://docs.python.org/3/reference/simple_stmts.html#the-assert-statement
+"""
+
+import os
+
+__all__ = ["OFF", "SAMPLED", "FULL", "get_validation_level",
+           "set_validation_level", "get_sample_rate", "set_sample_rate",
+           "validate"]
+
+OFF = "off"
+SAMPLED = "sampled"
+FULL = "full"
+
+_LEVELS = (OFF, SAMPLED, FULL)
+
+
+def _check_level(level: str) -> None:
+    if level not in _LEVELS:
+        raise ValueError("level must be either OFF, SAMPLED or FULL")
+
+
+def _check_sample_rate(rate: int) -> None:
+    if not isinstance(rate, int):
+        raise TypeError("rate must be an instance of int")
+    if rate < 1:
+        raise ValueError("rate must be greater or equal to 1")
+
+
+_level = os.environ.get("ANDS_VALIDATION", FULL).lower()
+_check_level(_level)
+
+_sample_rate = int(os.environ.get("ANDS_VALIDATION_SAMPLE_RATE", 100))
+_check_sample_rate(_sample_rate)
+
+# Number of validations requested so far when the level is SAMPLED.
+_calls = 0
+
+
+def get_validation_level(ds: object = None) -> str:
+    """Returns the validation level of the data structure ds, if ds is not None
+    and its validation level was set with set_validation_level, otherwise it
+    returns the package-wide validation level.
+
+    Time complexity: O(1)."""
+    level = getattr(ds, "_validation_level", None)
+    return level if level is not None else _level
+
+
+def set_validation_level(level: str, ds: object = None) -> None:
+    """Sets the validation level of the data structure ds to level, if ds is
+    not None, otherwise sets the package-wide validation level.
+
+    If ds is not None, level can also be None, so that ds goes back to use the
+    package-wide validation level.
+
+    Time complexity: O(1)."""
+    global _level
+    if ds is None:
+        _check_level(level)
+        _level = level
+    else:
+        if level is not None:
+            _check_level(level)
+        ds._validation_level = level
+
+
+def get_sample_rate() -> int:
+    """Returns the package-wide sample rate used by the SAMPLED validation
+    level.
+
+    Time complexity: O(1)."""
+    return _sample_rate
+
+
+def set_sample_rate(rate: int) -> None:
+    """Sets the package-wide sample rate used by the SAMPLED validation level,
+    i.e. only one every rate validations is actually performed.
+
+    Time complexity: O(1)."""
+    global _sample_rate
+    _check_sample_rate(rate)
+    _sample_rate = rate
+
+
+def validate(predicate, ds: object) -> bool:
+    """Returns predicate(ds), if, according to the validation level of ds (see
+    get_validation_level), ds needs to be validated, otherwise it returns true
+    without calling predicate.
+
+    Time complexity: O(1), apart from the call to predicate."""
+    global _calls
+    level = get_validation_level(ds)
+    if level == FULL:
+        return predicate(ds)
+    if level == SAMPLED:
+        _calls += 1
+        if _calls % _sample_rate == 0:
+            return predicate(ds)
+    return True
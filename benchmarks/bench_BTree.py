@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares the running times of the main operations of ands.ds.BTree and
+ands.ds.RBT, for trees of several sizes.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_BTree --sizes 100000 1000000 10000000
+
+Note that building an RBT with 10^7 keys requires several GBs of memory.
+"""
+
+import argparse
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.BTree import BTree
+from ands.ds.RBT import RBT
+from ands.validation import OFF, set_validation_level
+
+
+def timed(f) -> float:
+    """Returns the number of seconds taken by calling f."""
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def bench(cls, build, n: int, queries: list, new_keys: list,
+          scan: int) -> list:
+    """Returns the running times of the operations on a tree of n keys."""
+    times = []
+    tree = None
+
+    def load():
+        nonlocal tree
+        tree = build(range(0, 2 * n, 2))
+
+    times.append(timed(load))
+    times.append(timed(lambda: [tree.contains(k) for k in queries]))
+    times.append(timed(lambda: [tree.rank(k) for k in queries[::10]
+                                if k % 2 == 0]))
+
+    def range_scans():
+        for k in queries[:100]:
+            for _ in tree.iter_range(k, k + 2 * scan):
+                pass
+
+    times.append(timed(range_scans))
+    times.append(timed(lambda: [tree.insert(k) for k in new_keys]))
+    return [cls.__name__, n] + ["%.3f" % s for s in times]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares the running times of BTree and RBT.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--scan", type=int, default=1000,
+                        help="number of keys yielded by each range scan")
+    parser.add_argument("--t", type=int, default=32,
+                        help="minimum degree of the B-tree")
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    rows = []
+    for n in args.sizes:
+        queries = [random.randrange(2 * n) for _ in range(args.queries)]
+        new_keys = random.sample(range(1, 2 * n, 2), min(n, args.queries))
+        rows.append(bench(BTree, lambda ks: BTree.from_sorted(ks, args.t), n,
+                          queries, new_keys, args.scan))
+        rows.append(bench(RBT, RBT.from_sorted, n, queries, new_keys,
+                          args.scan))
+
+    print(tabulate(rows, headers=["tree", "n", "bulk load (s)", "contains (s)",
+                                  "rank (s)", "range scans (s)", "inserts (s)"]))
+
+
+if __name__ == "__main__":
+    main()
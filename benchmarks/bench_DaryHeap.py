@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares the running times of ands.ds.DaryMinHeap, for several arities d, and
+of ands.ds.MinHeap, for a push-heavy and a pop-heavy mix of operations:
+
+- push-heavy: each step adds an element and, with probability 1 / 10, also
+removes the minimum;
+
+- pop-heavy: the heap is first filled with n elements, which are then all
+removed, one by one.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_DaryHeap --n 100000 --d 2 4 8 16
+"""
+
+import argparse
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.DaryMinHeap import DaryMinHeap
+from ands.ds.MinHeap import MinHeap
+from ands.validation import OFF, set_validation_level
+
+
+def timed(f) -> float:
+    """Returns the number of seconds taken by calling f."""
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def push_heavy(h, elements: list, pops: list) -> None:
+    for x, pop in zip(elements, pops):
+        h.add(x)
+        if pop:
+            h.remove_min()
+
+
+def pop_heavy(h, elements: list) -> None:
+    for x in elements:
+        h.add(x)
+    while not h.is_empty():
+        h.remove_min()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares d-ary min-heaps for several arities.")
+    parser.add_argument("--n", type=int, default=100000,
+                        help="number of elements added")
+    parser.add_argument("--d", type=int, nargs="+", default=[2, 3, 4, 8, 16])
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    elements = [random.random() for _ in range(args.n)]
+    pops = [random.random() < 0.1 for _ in range(args.n)]
+
+    heaps = [("MinHeap", MinHeap)]
+    heaps += [("DaryMinHeap, d = %d" % d, lambda d=d: DaryMinHeap(d=d))
+              for d in args.d]
+
+    rows = []
+    for name, new_heap in heaps:
+        rows.append([name,
+                     "%.3f" % timed(lambda: push_heavy(new_heap(), elements,
+                                                       pops)),
+                     "%.3f" % timed(lambda: pop_heavy(new_heap(), elements))])
+
+    print(tabulate(rows, headers=["heap", "push-heavy (s)", "pop-heavy (s)"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Measures, for several maximum load factors α of
+ands.ds.LinearProbingHashTable, after n random keys have been inserted in a
+table whose initial capacity is the smallest one that can hold them, so that
+the table is never resized and its final load factor is (about) α:
+
+- the average number of slots inspected by a successful search (probe length);
+
+- the average number of slots inspected by an unsuccessful search;
+
+- the time taken by the insertions and by n successful searches.
+
+The probe lengths are computed from the buffers of the table, without calling
+get, and they are compared with the ones predicted by Knuth's analysis of
+linear probing, i.e. (1 + 1 / (1 - α)) / 2 and (1 + 1 / (1 - α)²) / 2, for
+successful and unsuccessful searches, respectively, where α is the load factor.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_LinearProbingHashTable --n 100000
+"""
+
+import argparse
+import math
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.LinearProbingHashTable import LinearProbingHashTable
+from ands.validation import OFF, set_validation_level
+
+
+def probe_lengths(t: LinearProbingHashTable) -> tuple:
+    """Returns the average number of slots inspected by a successful and by an
+    unsuccessful search in t, assuming that all keys and all initial slots are
+    equally likely."""
+    keys = t._keys
+    size = len(keys)
+
+    successful = 0
+    for i, k in enumerate(keys):
+        if k is not None:
+            successful += (i - hash(k) % size) % size + 1
+
+    # An unsuccessful search starting at slot i inspects all slots from i to
+    # the first free slot (included).
+    unsuccessful = 0
+    run = 0  # Number of occupied slots before the current one.
+    first_free = keys.index(None)
+    for j in range(first_free + 1, first_free + 1 + size):
+        if keys[j % size] is None:
+            unsuccessful += (run + 1) * (run + 2) // 2
+            run = 0
+        else:
+            run += 1
+
+    return successful / max(t.size, 1), unsuccessful / size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures probe lengths of LinearProbingHashTable for "
+                    "several maximum load factors.")
+    parser.add_argument("--n", type=int, default=100000,
+                        help="number of keys inserted")
+    parser.add_argument("--max-load-factor", type=float, nargs="+",
+                        default=[0.25, 0.5, 0.6, 0.75, 0.9, 0.95])
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    keys = random.sample(range(args.n * 100), args.n)
+
+    rows = []
+    for max_load_factor in args.max_load_factor:
+        t = LinearProbingHashTable(math.ceil(args.n / max_load_factor),
+                                   max_load_factor)
+
+        start = time.perf_counter()
+        for k in keys:
+            t.put(k, k)
+        put_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for k in keys:
+            t.get(k)
+        get_seconds = time.perf_counter() - start
+
+        a = t.load_factor
+        hit, miss = probe_lengths(t)
+        rows.append([max_load_factor, "%.3f" % a,
+                     "%.2f (%.2f)" % (hit, (1 + 1 / (1 - a)) / 2),
+                     "%.2f (%.2f)" % (miss, (1 + 1 / (1 - a) ** 2) / 2),
+                     "%.3f" % put_seconds, "%.3f" % get_seconds])
+
+    print(tabulate(rows, headers=["max load factor", "load factor",
+                                  "hit probes (expected)",
+                                  "miss probes (expected)", "put (s)",
+                                  "get (s)"]))
+
+
+if __name__ == "__main__":
+    main()
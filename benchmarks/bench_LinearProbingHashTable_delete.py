@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Stress test of the deletion of ands.ds.LinearProbingHashTable.
+
+For several numbers of keys n, a table is first filled with n random keys, and
+then a mixed workload of n operations is run on it, where each operation either
+deletes a random key of the table or inserts a new random key, with the same
+probability, so that the size of the table stays about n. Then each key is
+searched and the result is compared with a dict which underwent the same
+operations.
+
+The same is done with a table whose delete is implemented as it was before
+backward-shift deletion, i.e. by finding the key with a linear scan of the
+buffer and by emptying its slot, which breaks the probe sequences of colliding
+keys.
+
+For each table, the time per delete and the number of wrong search results are
+reported.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_LinearProbingHashTable_delete --n 1000 10000
+"""
+
+import argparse
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.LinearProbingHashTable import LinearProbingHashTable
+from ands.validation import OFF, set_validation_level
+
+
+class ScanningDeleteHashTable(LinearProbingHashTable):
+    """LinearProbingHashTable whose delete finds the key with a linear scan and
+    simply empties its slot."""
+
+    def delete(self, key: object) -> object:
+        try:
+            i = self._keys.index(key)
+        except ValueError:
+            return None
+        v = self._values[i]
+        self._keys[i] = self._values[i] = None
+        self._size -= 1
+        return v
+
+
+def stress(new_table, n: int, seed: int) -> tuple:
+    """Returns the average number of seconds per delete and the number of wrong
+    search results, after running the mixed workload on the table returned by
+    new_table."""
+    rng = random.Random(seed)
+    t = new_table()
+    d = {}
+    keys = []
+
+    def insert():
+        k = rng.randrange(n * 10)
+        if k not in d:
+            keys.append(k)
+        t.put(k, k)
+        d[k] = k
+
+    for _ in range(n):
+        insert()
+
+    delete_seconds = 0
+    deletes = 0
+    for _ in range(n):
+        if rng.random() < 0.5 and keys:
+            k = keys.pop(rng.randrange(len(keys)))
+            start = time.perf_counter()
+            t.delete(k)
+            delete_seconds += time.perf_counter() - start
+            deletes += 1
+            del d[k]
+        else:
+            insert()
+
+    wrong = sum(t.get(k) != d.get(k) for k in range(n * 10))
+    return delete_seconds / max(deletes, 1), wrong
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stress test of LinearProbingHashTable.delete.")
+    parser.add_argument("--n", type=int, nargs="+", default=[1000, 10000],
+                        help="numbers of keys")
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    rows = []
+    for n in args.n:
+        for name, table in [("backward shift", LinearProbingHashTable),
+                            ("linear scan + empty slot",
+                             ScanningDeleteHashTable)]:
+            seconds, wrong = stress(lambda: table(max_load_factor=0.75), n, n)
+            rows.append([n, name, "%.2f" % (seconds * 1e6), wrong])
+
+    print(tabulate(rows, headers=["n", "delete", "µs/delete",
+                                  "wrong searches"]))
+
+
+if __name__ == "__main__":
+    main()
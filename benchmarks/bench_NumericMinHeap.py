@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares ands.ds.NumericMinHeap with ands.ds.MinHeap of tuples (priority,
+payload), for n random float priorities, in terms of:
+
+- the time to build the heap from all priorities at once;
+
+- the time to remove the first 10% of the elements, one by one;
+
+- the number of bytes allocated per element.
+
+Building the heaps is timed while tracemalloc is tracing allocations, which
+slows down mostly MinHeap, whose construction allocates many Python objects.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_NumericMinHeap --n 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from tabulate import tabulate
+
+from ands.ds.MinHeap import MinHeap
+from ands.ds.NumericMinHeap import NumericMinHeap
+from ands.validation import OFF, set_validation_level
+
+
+def timed(f) -> tuple:
+    """Returns the object returned by f, the number of seconds taken by calling
+    f and the number of bytes allocated by f and still in use after it
+    returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = f()
+        seconds = time.perf_counter() - start
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares NumericMinHeap with MinHeap.")
+    parser.add_argument("--n", type=int, default=1000000,
+                        help="number of priorities")
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    priorities = np.random.rand(args.n)
+    pops = args.n // 10
+
+    builders = [
+        ("MinHeap", lambda: MinHeap(list(zip(priorities.tolist(),
+                                             range(args.n))))),
+        ("NumericMinHeap", lambda: NumericMinHeap(priorities))
+    ]
+
+    rows = []
+    for name, build in builders:
+        h, build_seconds, allocated = timed(build)
+        start = time.perf_counter()
+        for _ in range(pops):
+            h.remove_min()
+        pop_seconds = time.perf_counter() - start
+        rows.append([name, "%.3f" % build_seconds, "%.3f" % pop_seconds,
+                     "%.1f" % (allocated / args.n)])
+
+    print(tabulate(rows, headers=["heap", "build (s)",
+                                  "remove %d (s)" % pops, "bytes/element"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares, under contention, the throughput of:
+
+- a MinHeap shared through a client-side lock and condition, whose remove_min
+validates the heap while the lock is held (validation level FULL);
+
+- the same, but with validation turned off;
+
+- ands.ds.ThreadSafeMinHeap;
+
+- queue.PriorityQueue, of the standard library, as a reference.
+
+For each number of threads t, t producers put n / t elements each, while t
+consumers get them.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_ThreadSafeMinHeap --n 5000 --threads 1 2 4 8
+"""
+
+import argparse
+import queue
+import random
+import threading
+import time
+
+from tabulate import tabulate
+
+from ands.ds.MinHeap import MinHeap
+from ands.ds.ThreadSafeMinHeap import ThreadSafeMinHeap
+from ands.validation import FULL, OFF, set_validation_level
+
+
+class LockedMinHeap:
+    """A MinHeap protected by a lock and a condition, as a client would write
+    it, which only provides put and get."""
+
+    def __init__(self):
+        self.heap = MinHeap()
+        self.not_empty = threading.Condition()
+
+    def put(self, x):
+        with self.not_empty:
+            self.heap.add(x)
+            self.not_empty.notify()
+
+    def get(self):
+        with self.not_empty:
+            while self.heap.is_empty():
+                self.not_empty.wait()
+            return self.heap.remove_min()
+
+
+def run(q, elements: list, threads: int) -> float:
+    """Returns the number of seconds taken by threads producers and threads
+    consumers to move all elements through q."""
+    chunks = [elements[i::threads] for i in range(threads)]
+
+    def produce(chunk):
+        for x in chunk:
+            q.put(x)
+
+    def consume(count):
+        for _ in range(count):
+            q.get()
+
+    workers = [threading.Thread(target=produce, args=(c,)) for c in chunks]
+    workers += [threading.Thread(target=consume, args=(len(c),))
+                for c in chunks]
+
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares thread-safe min-heaps under contention.")
+    parser.add_argument("--n", type=int, default=5000,
+                        help="number of elements moved through each heap")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="numbers of producers (and of consumers)")
+    args = parser.parse_args()
+
+    elements = [random.random() for _ in range(args.n)]
+
+    heaps = [("MinHeap + lock (FULL)", FULL, LockedMinHeap),
+             ("MinHeap + lock (OFF)", OFF, LockedMinHeap),
+             ("ThreadSafeMinHeap", FULL, ThreadSafeMinHeap),
+             ("queue.PriorityQueue", FULL, queue.PriorityQueue)]
+
+    rows = []
+    for name, level, new_heap in heaps:
+        set_validation_level(level)
+        rows.append([name] + ["%.3f" % run(new_heap(), elements, t)
+                              for t in args.threads])
+    set_validation_level(FULL)
+
+    print(tabulate(rows, headers=["heap"] + ["%d threads (s)" % t
+                                             for t in args.threads]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares the amortized cost per element of keeping the best N of n elements in
+an ands.ds.MinMaxHeap:
+
+- unbounded, by calling remove_min after each add which makes the heap grow
+beyond N elements;
+
+- bounded (with capacity N), by calling add for each element;
+
+- bounded (with capacity N), by calling add_many with chunks of elements.
+
+Each is run both with validation turned off and at the default validation
+level (see ands.validation), since the unbounded heap validates itself at each
+remove_min, whereas the bounded one never does at each add.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_bounded_MinMaxHeap --n 100000 --capacity 100
+"""
+
+import argparse
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.MinMaxHeap import MinMaxHeap
+from ands.validation import FULL, OFF, set_validation_level
+
+
+def unbounded(elements: list, capacity: int) -> MinMaxHeap:
+    h = MinMaxHeap()
+    for x in elements:
+        h.add(x)
+        if h.size > capacity:
+            h.remove_min()
+    return h
+
+
+def bounded_add(elements: list, capacity: int) -> MinMaxHeap:
+    h = MinMaxHeap(capacity=capacity)
+    for x in elements:
+        h.add(x)
+    return h
+
+
+def bounded_add_many(elements: list, capacity: int, chunk: int) -> MinMaxHeap:
+    h = MinMaxHeap(capacity=capacity)
+    for i in range(0, len(elements), chunk):
+        h.add_many(elements[i:i + chunk])
+    return h
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares bounded and unbounded MinMaxHeaps.")
+    parser.add_argument("--n", type=int, default=100000,
+                        help="number of elements added")
+    parser.add_argument("--capacity", type=int, default=100,
+                        help="number of elements kept")
+    parser.add_argument("--chunk", type=int, default=1000,
+                        help="number of elements per call to add_many")
+    args = parser.parse_args()
+
+    elements = [random.random() for _ in range(args.n)]
+    expected = sorted(elements)[-args.capacity:]
+
+    strategies = [
+        ("unbounded add + remove_min", lambda: unbounded(elements,
+                                                         args.capacity)),
+        ("bounded add", lambda: bounded_add(elements, args.capacity)),
+        ("bounded add_many", lambda: bounded_add_many(elements, args.capacity,
+                                                      args.chunk))
+    ]
+
+    rows = []
+    for name, run in strategies:
+        row = [name]
+        for level in (OFF, FULL):
+            set_validation_level(level)
+            start = time.perf_counter()
+            h = run()
+            seconds = time.perf_counter() - start
+            assert sorted(h.heap) == expected
+            row.append("%.2f" % (seconds / args.n * 1e6))
+        rows.append(row)
+    set_validation_level(FULL)
+
+    print(tabulate(rows, headers=["strategy", "OFF (µs/element)",
+                                  "FULL (µs/element)"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Compares the running times of lookups in ands.ds.SplayTree, ands.ds.Treap and
+ands.ds.RBT, when the accessed keys follow a Zipfian distribution, i.e. when
+the key with the k-th highest frequency is accessed with probability
+proportional to 1 / k^s. The greater the exponent s, the more skewed the
+accesses. With s = 0, accesses are uniform.
+
+The hot keys are chosen at random among all keys, so that they are not
+clustered.
+
+Validation is turned off (see ands.validation), since the validators would
+dominate the running times.
+
+Run it from the root of the repository, for example, as follows
+
+    python -m benchmarks.bench_skewed_access --sizes 100000 --s 0 0.8 1.2
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from tabulate import tabulate
+
+from ands.ds.RBT import RBT
+from ands.ds.SplayTree import SplayTree
+from ands.ds.Treap import Treap
+from ands.validation import OFF, set_validation_level
+
+
+def timed(f) -> float:
+    """Returns the number of seconds taken by calling f."""
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def zipf_queries(keys: list, s: float, q: int) -> list:
+    """Returns q keys drawn from keys with a Zipfian distribution of exponent
+    s."""
+    hot = random.sample(keys, len(keys))
+    cum_weights = list(itertools.accumulate(1 / (k ** s)
+                                            for k in range(1, len(hot) + 1)))
+    return random.choices(hot, cum_weights=cum_weights, k=q)
+
+
+def bench(cls, keys: list, queries: list) -> list:
+    """Returns the running times of building a tree of type cls, by inserting
+    keys, and of searching it for queries."""
+    tree = cls()
+
+    def build():
+        for k in keys:
+            tree.insert(k)
+
+    times = [timed(build),
+             timed(lambda: [tree.contains(k) for k in queries]),
+             timed(lambda: [tree.get(k) for k in queries])]
+    return [cls.__name__] + ["%.3f" % t for t in times]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares SplayTree, Treap and RBT under skewed lookups.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    parser.add_argument("--queries", type=int, default=200000)
+    parser.add_argument("--s", type=float, nargs="+", default=[0, 0.8, 1.2],
+                        help="exponents of the Zipfian distributions")
+    args = parser.parse_args()
+
+    set_validation_level(OFF)
+
+    rows = []
+    for n in args.sizes:
+        keys = random.sample(range(10 * n), n)
+        for s in args.s:
+            queries = zipf_queries(keys, s, args.queries)
+            for cls in (SplayTree, Treap, RBT):
+                rows.append([n, s] + bench(cls, keys, queries))
+
+    print(tabulate(rows, headers=["n", "s", "tree", "build (s)",
+                                  "contains (s)", "get (s)"]))
+
+
+if __name__ == "__main__":
+    main()
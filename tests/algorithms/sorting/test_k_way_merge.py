@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the functions in the ands.algorithms.sorting.k_way_merge module.
+"""
+
+import os
+import tempfile
+import unittest
+from random import randint
+
+from ands.algorithms.sorting.k_way_merge import k_way_merge
+from tests.algorithms.sorting.base_tests import build_random_list
+
+
+class TestKWayMerge(unittest.TestCase):
+    def test_no_iterables(self):
+        self.assertEqual(list(k_way_merge()), [])
+
+    def test_empty_iterables(self):
+        self.assertEqual(list(k_way_merge([], [], iter([]))), [])
+
+    def test_one_iterable(self):
+        a = sorted(build_random_list(50))
+        self.assertEqual(list(k_way_merge(a)), a)
+
+    def test_random_iterables(self):
+        ls = [sorted(build_random_list(randint(0, 100), -50, 50))
+              for _ in range(randint(2, 20))]
+        expected = sorted(x for a in ls for x in a)
+        self.assertEqual(list(k_way_merge(*ls)), expected)
+        self.assertEqual(list(k_way_merge(*(iter(a) for a in ls))), expected)
+
+    def test_is_lazy(self):
+        def naturals(start):
+            i = start
+            while True:
+                yield i
+                i += 2
+
+        m = k_way_merge(naturals(0), naturals(1))
+        self.assertEqual([next(m) for _ in range(10)], list(range(10)))
+
+    def test_key_and_reverse(self):
+        ls = [sorted(build_random_list(30, -50, 50), key=abs, reverse=True)
+              for _ in range(5)]
+        merged = list(k_way_merge(*ls, key=abs, reverse=True))
+        self.assertEqual(merged, sorted((x for a in ls for x in a), key=abs,
+                                        reverse=True))
+
+    def test_is_stable(self):
+        ls = [[(x, i) for x in sorted(build_random_list(30, 0, 5))]
+              for i in range(6)]
+        merged = list(k_way_merge(*ls, key=lambda t: t[0]))
+        expected = sorted((t for a in ls for t in a), key=lambda t: t[0])
+        self.assertEqual(merged, expected)
+
+    def test_is_stable_when_reverse(self):
+        ls = [[(x, i) for x in sorted(build_random_list(30, 0, 5),
+                                      reverse=True)]
+              for i in range(6)]
+        merged = list(k_way_merge(*ls, key=lambda t: t[0], reverse=True))
+        expected = sorted((t for a in ls for t in a), key=lambda t: t[0],
+                          reverse=True)
+        self.assertEqual(merged, expected)
+
+    def test_buffer_size(self):
+        ls = [sorted(build_random_list(randint(0, 100))) for _ in range(7)]
+        expected = sorted(x for a in ls for x in a)
+        for buffer_size in (2, 3, 64, 1000):
+            self.assertEqual(list(k_way_merge(*ls, buffer_size=buffer_size)),
+                             expected)
+        self.assertRaises(TypeError, next, k_way_merge([1], buffer_size=2.0))
+        self.assertRaises(ValueError, next, k_way_merge([1], buffer_size=0))
+
+    def test_files(self):
+        ls = [sorted(build_random_list(randint(0, 100), -500, 500))
+              for _ in range(4)]
+        with tempfile.TemporaryDirectory() as directory:
+            files = []
+            for i, a in enumerate(ls):
+                path = os.path.join(directory, "%d.txt" % i)
+                with open(path, "w") as f:
+                    f.writelines("%d\n" % x for x in a)
+                files.append(open(path))
+            try:
+                merged = [int(line) for line in
+                          k_way_merge(*files, key=int, buffer_size=16)]
+            finally:
+                for f in files:
+                    f.close()
+        self.assertEqual(merged, sorted(x for a in ls for x in a))
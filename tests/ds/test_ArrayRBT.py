@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.ArrayRBT module.
+"""
+
+import pickle
+import unittest
+from random import randint, sample, shuffle
+
+from ands.ds.ArrayRBT import ArrayRBT, is_array_rbt
+from ands.ds.RBT import RBT
+from ands.validation import OFF, set_validation_level
+from tests.ds.util import allocated_bytes
+
+
+class TestArrayRBT(unittest.TestCase):
+    def setUp(self):
+        self.t = ArrayRBT()
+
+    def test_empty_tree(self):
+        self.assertTrue(self.t.is_empty())
+        self.assertEqual(self.t.size, 0)
+        self.assertEqual(self.t.height(), 0)
+        self.assertIsNone(self.t.minimum())
+        self.assertIsNone(self.t.maximum())
+        self.assertEqual(list(self.t), [])
+        self.assertTrue(is_array_rbt(self.t))
+
+    def test_insert_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.insert, None)
+
+    def test_insert_one(self):
+        self.t.insert(7)
+        self.assertFalse(self.t.is_empty())
+        self.assertEqual(self.t.size, 1)
+        self.assertTrue(self.t.contains(7))
+        self.assertEqual(self.t.minimum(), 7)
+        self.assertEqual(self.t.maximum(), 7)
+
+    def test_insert_many(self):
+        ls = [randint(-100, 100) for _ in range(500)]
+        for i, e in enumerate(ls):
+            self.t.insert(e)
+            self.assertEqual(self.t.size, i + 1)
+        self.assertEqual(list(self.t), sorted(ls))
+        self.assertTrue(is_array_rbt(self.t))
+
+    def test_insert_sorted_keys_keeps_tree_balanced(self):
+        for e in range(1023):
+            self.t.insert(e)
+        # The height of a red-black tree with n nodes is at most 2log₂(n + 1).
+        self.assertLessEqual(self.t.height(), 20)
+
+    def test_contains_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.contains, None)
+
+    def test_contains(self):
+        ls = sample(range(1000), 200)
+        for e in ls:
+            self.t.insert(e)
+        for e in range(1000):
+            self.assertEqual(self.t.contains(e), e in ls)
+
+    def test_delete_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.delete, None)
+
+    def test_delete_when_key_not_present(self):
+        self.t.insert(3)
+        self.assertRaises(LookupError, self.t.delete, 4)
+
+    def test_delete_all(self):
+        ls = [randint(-50, 50) for _ in range(300)]
+        for e in ls:
+            self.t.insert(e)
+        shuffle(ls)
+        for i, e in enumerate(ls):
+            self.t.delete(e)
+            self.assertEqual(self.t.size, len(ls) - i - 1)
+        self.assertTrue(self.t.is_empty())
+        self.assertTrue(is_array_rbt(self.t))
+
+    def test_delete_reuses_free_slots(self):
+        for e in range(100):
+            self.t.insert(e)
+        capacity = len(self.t._keys)
+        for e in range(0, 100, 2):
+            self.t.delete(e)
+        for e in range(100, 150):
+            self.t.insert(e)
+        self.assertEqual(len(self.t._keys), capacity)
+        self.assertEqual(list(self.t), list(range(1, 100, 2)) +
+                         list(range(100, 150)))
+
+    def test_successor_and_predecessor(self):
+        ls = sample(range(1000), 300)
+        for e in ls:
+            self.t.insert(e)
+        ls.sort()
+        for i, e in enumerate(ls):
+            self.assertEqual(self.t.successor(e),
+                             ls[i + 1] if i + 1 < len(ls) else None)
+            self.assertEqual(self.t.predecessor(e),
+                             ls[i - 1] if i > 0 else None)
+
+    def test_successor_when_key_not_present(self):
+        self.assertRaises(LookupError, self.t.successor, 3)
+        self.assertRaises(LookupError, self.t.predecessor, 3)
+        self.assertRaises(ValueError, self.t.successor, None)
+        self.assertRaises(ValueError, self.t.predecessor, None)
+
+    def test_remove_min_and_remove_max(self):
+        for e in range(10):
+            self.t.insert(e)
+        self.t.remove_min()
+        self.t.remove_max()
+        self.assertEqual(list(self.t), list(range(1, 9)))
+        self.assertIsNone(ArrayRBT().remove_min())
+
+    def test_clear(self):
+        for e in range(10):
+            self.t.insert(e)
+        self.t.clear()
+        self.assertTrue(self.t.is_empty())
+        self.assertEqual(len(self.t._keys), 1)
+        self.assertTrue(is_array_rbt(self.t))
+
+    def test_same_behaviour_as_rbt(self):
+        r = RBT()
+        for _ in range(2000):
+            e = randint(0, 200)
+            if r.contains(e) and randint(0, 1):
+                r.delete(e)
+                self.t.delete(e)
+            else:
+                r.insert(e)
+                self.t.insert(e)
+            self.assertEqual(self.t.size, r.size)
+        self.assertEqual(list(self.t), list(r))
+        self.assertEqual(self.t.minimum(), r.minimum())
+        self.assertEqual(self.t.maximum(), r.maximum())
+
+    def test_pickle(self):
+        for e in sample(range(100), 50):
+            self.t.insert(e)
+        self.t.delete(self.t.minimum())
+        u = pickle.loads(pickle.dumps(self.t))
+        self.assertTrue(is_array_rbt(u))
+        self.assertEqual(list(u), list(self.t))
+        u.insert(1000)
+        self.assertFalse(self.t.contains(1000))
+
+    def test_is_array_rbt_when_corrupted(self):
+        for e in range(20):
+            self.t.insert(e)
+        self.assertTrue(is_array_rbt(self.t))
+        self.t._colors[self.t._root] = 1  # Red root.
+        self.assertFalse(is_array_rbt(self.t))
+        self.assertFalse(is_array_rbt(RBT()))
+
+
+class TestArrayRBTMemoryFootprint(unittest.TestCase):
+    def test_bytes_per_key_less_than_rbt(self):
+        n = 2000
+        keys = [randint(10 ** 6, 10 ** 9) for _ in range(n)]
+
+        def build(cls):
+            def _build():
+                t = cls()
+                set_validation_level(OFF, t)
+                for key in keys:
+                    t.insert(key)
+                return t
+
+            return _build
+
+        t, array_size = allocated_bytes(build(ArrayRBT))
+        self.assertEqual(t.size, n)
+        _, node_size = allocated_bytes(build(RBT))
+        self.assertLessEqual(array_size / n, 32)
+        self.assertLess(array_size, node_size / 2)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.AsyncMinHeap module.
+"""
+
+import asyncio
+import unittest
+from random import randint
+
+from ands.ds.AsyncMinHeap import AsyncMinHeap
+
+
+def run(coroutine):
+    """Runs coroutine in a new event loop and returns its result."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncMinHeap(unittest.TestCase):
+    def test_creation_default(self):
+        async def f():
+            h = AsyncMinHeap()
+            self.assertTrue(h.empty())
+            self.assertEqual(h.qsize(), 0)
+            self.assertIn("size=0", repr(h))
+
+        run(f())
+
+    def test_get_returns_smallest(self):
+        ls = [randint(-100, 100) for _ in range(100)]
+
+        async def f():
+            h = AsyncMinHeap()
+            for x in ls:
+                await h.put(x)
+            self.assertEqual(h.qsize(), 100)
+            return [await h.get() for _ in range(100)]
+
+        self.assertEqual(run(f()), sorted(ls))
+
+    def test_put_when_none(self):
+        async def f():
+            h = AsyncMinHeap()
+            self.assertRaises(ValueError, h.put_nowait, None)
+            with self.assertRaises(ValueError):
+                await h.put(None)
+            self.assertTrue(h.empty())
+
+        run(f())
+
+    def test_key_ties_are_returned_in_insertion_order(self):
+        async def f():
+            h = AsyncMinHeap(key=lambda t: t[0])
+            for i in range(50):
+                h.put_nowait((i % 3, i))
+            return [h.get_nowait() for _ in range(50)]
+
+        expected = sorted(((i % 3, i) for i in range(50)), key=lambda t: t[0])
+        self.assertEqual(run(f()), expected)
+
+    def test_get_nowait_when_empty_and_put_nowait_when_full(self):
+        async def f():
+            h = AsyncMinHeap(maxsize=1)
+            self.assertRaises(asyncio.QueueEmpty, h.get_nowait)
+            h.put_nowait(1)
+            self.assertTrue(h.full())
+            self.assertRaises(asyncio.QueueFull, h.put_nowait, 0)
+
+        run(f())
+
+    def test_producers_and_consumers(self):
+        async def f():
+            h = AsyncMinHeap(maxsize=5)
+            got = []
+
+            async def produce(p):
+                for i in range(100):
+                    await h.put(p * 100 + i)
+
+            async def consume():
+                while True:
+                    got.append(await h.get())
+                    h.task_done()
+
+            consumers = [asyncio.ensure_future(consume()) for _ in range(2)]
+            await asyncio.gather(*(produce(p) for p in range(3)))
+            await h.join()
+            for c in consumers:
+                c.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+            return got
+
+        self.assertEqual(sorted(run(f())), list(range(300)))
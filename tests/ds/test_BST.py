@@ -8,18 +8,37 @@ Author: Nelson Brochado
 
 Created: 13/02/2016
 
-Updated: 14/03/2017
+Updated: 16/10/2026
 
 # Description
 
 Unit tests for the classes and functions in the ands.ds.BST module.
 """
 
+import copy
+import io
+import mmap
+import pickle
 import string
+import tempfile
 import unittest
 from random import randint, choice
 
 from ands.ds.BST import BST, _BSTNode
+from ands.validation import OFF, get_validation_level, set_validation_level
+from tests.ds.util import allocated_bytes
+
+
+def shape(t: BST) -> list:
+    """Returns the list of the keys of t in pre-order, each one together with
+    the keys of its children, which is enough to identify the shape of t."""
+    nodes = []
+    stack = [t._root] if t._root is not None else []
+    while stack:
+        u = stack.pop()
+        nodes.append((u.key, u.left and u.left.key, u.right and u.right.key))
+        stack.extend(c for c in (u.right, u.left) if c is not None)
+    return nodes
 
 
 class TestBST(unittest.TestCase):
@@ -91,6 +110,66 @@ class TestBST(unittest.TestCase):
             self.t.insert(e)
         self.assertEqual(self.t.rank(6), 1)
 
+    def test_rank_when_duplicates(self):
+        for e in [5, 3, 5, 8, 5, 1]:
+            self.t.insert(e)
+        self.assertEqual(self.t.rank(5), 2)
+        self.assertEqual(self.t.rank(8), 5)
+
+    def test_select_when_k_is_not_int(self):
+        self.t.insert(3)
+        self.assertRaises(TypeError, self.t.select, 0.5)
+
+    def test_select_when_k_out_of_range(self):
+        self.assertRaises(ValueError, self.t.select, 0)
+        for e in [10, 5, 6]:
+            self.t.insert(e)
+        self.assertRaises(ValueError, self.t.select, -1)
+        self.assertRaises(ValueError, self.t.select, 3)
+
+    def test_select(self):
+        for e in [10, 5, 6, 19, 1]:
+            self.t.insert(e)
+        self.assertEqual([self.t.select(k) for k in range(5)], [1, 5, 6, 10, 19])
+
+    def test_count_between_when_lo_or_hi_is_None(self):
+        self.assertRaises(ValueError, self.t.count_between, None, 3)
+        self.assertRaises(ValueError, self.t.count_between, 3, None)
+
+    def test_count_between_when_empty_tree(self):
+        self.assertEqual(self.t.count_between(1, 10), 0)
+
+    def test_count_between_when_hi_smaller_than_lo(self):
+        for e in [10, 5, 6]:
+            self.t.insert(e)
+        self.assertEqual(self.t.count_between(10, 5), 0)
+
+    def test_count_between(self):
+        for e in [10, 5, 6, 19, 1, 6]:
+            self.t.insert(e)
+        self.assertEqual(self.t.count_between(5, 10), 4)
+        self.assertEqual(self.t.count_between(2, 7), 3)
+        self.assertEqual(self.t.count_between(20, 30), 0)
+        self.assertEqual(self.t.count_between(-5, 30), 6)
+
+    def test_order_statistics_after_random_inserts_and_deletes(self):
+        ls = [randint(-100, 100) for _ in range(300)]
+        for e in ls:
+            self.t.insert(e)
+        for _ in range(150):
+            elem = choice(ls)
+            ls.remove(elem)
+            self.t.delete(elem)
+        self.t.remove_min()
+        self.t.remove_max()
+        ls.sort()
+        ls = ls[1:-1]
+
+        self.assertEqual(self.t.size, len(ls))
+        for k, e in enumerate(ls):
+            self.assertEqual(self.t.select(k), e)
+            self.assertEqual(self.t.rank(e), ls.index(e))
+
     def test_height_when_tree_empty(self):
         self.assertEqual(self.t.height(), 0)
 
@@ -258,6 +337,167 @@ class TestBST(unittest.TestCase):
 
         self.assertTrue(self.t.is_empty())
 
+    def test_iter_range_when_lo_or_hi_is_None(self):
+        self.assertRaises(ValueError, self.t.iter_range, None, 3)
+        self.assertRaises(ValueError, self.t.iter_range, 3, None)
+
+    def test_iter_range_when_empty_tree(self):
+        self.assertEqual(list(self.t.iter_range(1, 10)), [])
+        self.assertEqual(list(self.t.iter_range(1, 10, reverse=True)), [])
+
+    def test_iter_range(self):
+        for e in [10, 4, 85, 43, 6, 1, 69, 6]:
+            self.t.insert(e)
+        self.assertEqual(list(self.t.iter_range(4, 43)), [4, 6, 6, 10, 43])
+        self.assertEqual(list(self.t.iter_range(5, 42)), [6, 6, 10])
+        self.assertEqual(list(self.t.iter_range(86, 100)), [])
+        self.assertEqual(list(self.t.iter_range(43, 4)), [])
+
+    def test_iter_range_reverse(self):
+        for e in [10, 4, 85, 43, 6, 1, 69, 6]:
+            self.t.insert(e)
+        self.assertEqual(list(self.t.iter_range(4, 43, reverse=True)),
+                         [43, 10, 6, 6, 4])
+        self.assertEqual(list(self.t.iter_range(-10, 0, reverse=True)), [])
+
+    def test_iter_range_is_lazy(self):
+        for e in range(100):
+            self.t.insert(e)
+        g = self.t.iter_range(10, 90)
+        self.assertEqual(next(g), 10)
+        self.assertEqual(next(g), 11)
+
+    def test_iter_and_reversed(self):
+        ls = [randint(-100, 100) for _ in range(200)]
+        for e in ls:
+            self.t.insert(e)
+        self.assertEqual(list(self.t), sorted(ls))
+        self.assertEqual(list(reversed(self.t)), sorted(ls, reverse=True))
+
+    def test_iter_when_tree_deeper_than_recursion_limit(self):
+        # The tree validator is recursive, so it cannot be used on such tree.
+        set_validation_level(OFF, self.t)
+        n = 1500
+        for e in range(n):
+            self.t.insert(e)
+        self.assertEqual(list(self.t), list(range(n)))
+        self.assertEqual(list(self.t.iter_range(10, 20, reverse=True)),
+                         list(range(20, 9, -1)))
+
+    def test_floor_and_ceiling_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.floor, None)
+        self.assertRaises(ValueError, self.t.ceiling, None)
+
+    def test_floor_and_ceiling_when_empty_tree(self):
+        self.assertIsNone(self.t.floor(3))
+        self.assertIsNone(self.t.ceiling(3))
+
+    def test_floor_and_ceiling(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t.insert(e)
+        self.assertEqual(self.t.floor(43), 43)
+        self.assertEqual(self.t.floor(42), 10)
+        self.assertEqual(self.t.floor(100), 85)
+        self.assertIsNone(self.t.floor(0))
+        self.assertEqual(self.t.ceiling(43), 43)
+        self.assertEqual(self.t.ceiling(44), 69)
+        self.assertEqual(self.t.ceiling(0), 1)
+        self.assertIsNone(self.t.ceiling(86))
+
+    def test_floor_and_ceiling_random(self):
+        ls = sorted(set(randint(-1000, 1000) for _ in range(300)))
+        for e in ls:
+            self.t.insert(e)
+        for probe in range(-1100, 1100, 7):
+            le = [e for e in ls if e <= probe]
+            ge = [e for e in ls if e >= probe]
+            self.assertEqual(self.t.floor(probe), le[-1] if le else None)
+            self.assertEqual(self.t.ceiling(probe), ge[0] if ge else None)
+
+    def test_insert_with_value(self):
+        self.t.insert(3, "three")
+        self.assertEqual(self.t[3], "three")
+        self.t.insert(4)
+        self.assertIsNone(self.t[4])
+
+    def test_getitem_when_key_not_found(self):
+        self.t.insert(3, "three")
+        self.assertRaises(KeyError, self.t.__getitem__, 4)
+        self.assertRaises(ValueError, self.t.__getitem__, None)
+
+    def test_get(self):
+        self.t.insert(3, "three")
+        self.assertEqual(self.t.get(3), "three")
+        self.assertIsNone(self.t.get(4))
+        self.assertEqual(self.t.get(4, "four"), "four")
+
+    def test_setitem(self):
+        self.t[5] = "five"
+        self.t[2] = "two"
+        self.t[5] = "FIVE"
+        self.assertEqual(self.t.size, 2)
+        self.assertEqual(self.t[5], "FIVE")
+        self.assertEqual(self.t[2], "two")
+        self.assertRaises(ValueError, self.t.__setitem__, None, 1)
+
+    def test_delitem(self):
+        for e in [5, 2, 10, 8]:
+            self.t[e] = str(e)
+        del self.t[5]
+        self.assertEqual(self.t.size, 3)
+        self.assertNotIn(5, self.t)
+        self.assertEqual(list(self.t.items()), [(2, "2"), (8, "8"),
+                                                (10, "10")])
+        self.assertRaises(KeyError, self.t.__delitem__, 5)
+
+    def test_contains_operator(self):
+        self.t.insert(3)
+        self.assertIn(3, self.t)
+        self.assertNotIn(4, self.t)
+
+    def test_pop_min_and_pop_max_when_empty_tree(self):
+        self.assertIsNone(self.t.pop_min())
+        self.assertIsNone(self.t.pop_max())
+
+    def test_pop_min_and_pop_max(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t[e] = -e
+        self.assertEqual(self.t.pop_min(), (1, -1))
+        self.assertEqual(self.t.pop_max(), (85, -85))
+        self.assertEqual(self.t.pop_min(), (4, -4))
+        self.assertEqual(self.t.size, 4)
+        self.assertEqual(list(self.t), [6, 10, 43, 69])
+
+    def test_pop_min_when_duplicates(self):
+        self.t.insert(2, "a")
+        self.t.insert(1, "b")
+        self.t.insert(1, "c")
+        popped = [self.t.pop_min(), self.t.pop_min(), self.t.pop_min()]
+        self.assertEqual(sorted(popped), [(1, "b"), (1, "c"), (2, "a")])
+        self.assertTrue(self.t.is_empty())
+
+    def test_items(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t[e] = str(e)
+        self.assertEqual([k for k, _ in self.t.items()],
+                         [1, 4, 6, 10, 43, 69, 85])
+        self.assertEqual(list(self.t.items(5, 43)),
+                         [(6, "6"), (10, "10"), (43, "43")])
+        self.assertEqual(list(self.t.items(lo=50)),
+                         [(69, "69"), (85, "85")])
+        self.assertEqual(list(self.t.items(hi=4)), [(1, "1"), (4, "4")])
+
+    def test_values_follow_keys_after_deletions(self):
+        ls = list(set(randint(-500, 500) for _ in range(300)))
+        for e in ls:
+            self.t[e] = e * 2
+        for e in ls[::3]:
+            del self.t[e]
+        for e in ls[1::3]:
+            self.t.delete(e)
+        self.assertEqual(list(self.t.items()),
+                         sorted((e, e * 2) for e in ls[2::3]))
+
     def test_in_order_traversal(self):
         for e in [10, 4, 85, 43, 6, 1, 69]:
             self.t.insert(e)
@@ -278,6 +518,105 @@ class TestBST(unittest.TestCase):
             self.t.insert(e)
         self.t.reverse_in_order_traversal()
 
+    def dump(self, t: BST) -> bytes:
+        fp = io.BytesIO()
+        t.dump(fp)
+        return fp.getvalue()
+
+    def test_dump_and_load_empty(self):
+        t = type(self.t).load(io.BytesIO(self.dump(self.t)))
+        self.assertIsInstance(t, type(self.t))
+        self.assertTrue(t.is_empty())
+
+    def test_dump_and_load_preserves_keys_and_values(self):
+        for e in [randint(0, 100) for _ in range(300)]:
+            self.t.insert(e, choice([None, str(e)]))
+        data = self.dump(self.t)
+        t = type(self.t).load(io.BytesIO(data))
+        self.assertEqual(list(t.items()), list(self.t.items()))
+        self.assertEqual(t.size, self.t.size)
+        # The order statistics are restored, too.
+        for k in range(t.size):
+            self.assertEqual(t.select(k), self.t.select(k))
+
+    def test_dump_and_load_preserves_shape(self):
+        for e in [randint(0, 100) for _ in range(300)]:
+            self.t.insert(e)
+        t = type(self.t).load(io.BytesIO(self.dump(self.t)))
+        self.assertEqual(shape(t), shape(self.t))
+
+    def test_dump_and_load_without_values(self):
+        for e in range(10):
+            self.t.insert(e)
+        t = type(self.t).load(io.BytesIO(self.dump(self.t)))
+        self.assertEqual(list(t.items()), [(e, None) for e in range(10)])
+
+    def test_load_from_mmap(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t.insert(e, -e)
+        with tempfile.TemporaryFile() as f:
+            self.t.dump(f)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                t = type(self.t).load(m)
+        self.assertEqual(list(t.items()), list(self.t.items()))
+
+    def test_load_when_dump_is_invalid(self):
+        for e in range(10):
+            self.t.insert(e)
+        data = self.dump(self.t)
+        for bad in [b"", b"ANDS", b"XXXX" + data[4:], data[:-1],
+                    data[:len(data) // 2]]:
+            self.assertRaises(ValueError, type(self.t).load, io.BytesIO(bad))
+
+    def test_pickle_and_deepcopy(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t.insert(e, str(e))
+        for t in [pickle.loads(pickle.dumps(self.t)), copy.deepcopy(self.t)]:
+            self.assertIsInstance(t, type(self.t))
+            self.assertEqual(list(t.items()), list(self.t.items()))
+            t.delete(10)
+            self.assertIn(10, self.t)
+
+
+class TestBSTSerialization(unittest.TestCase):
+    def setUp(self):
+        # is_bst is recursive, so it can't validate the degenerate trees below.
+        self.level = get_validation_level()
+        set_validation_level(OFF)
+
+    def tearDown(self):
+        set_validation_level(self.level)
+
+    def test_dump_and_load_degenerate_tree(self):
+        # A tree of height n must not be dumped or loaded recursively.
+        t = BST()
+        for e in range(5000):
+            t.insert(e)
+        fp = io.BytesIO()
+        t.dump(fp)
+        fp.seek(0)
+        u = BST.load(fp)
+        self.assertEqual(list(u), list(range(5000)))
+        self.assertEqual(shape(u), shape(t))
+
+
+class TestBSTMemoryFootprint(unittest.TestCase):
+    def test_bytes_per_node(self):
+        n = 2000
+        keys = [randint(10 ** 6, 10 ** 9) for _ in range(n)]
+
+        def build():
+            t = BST()
+            set_validation_level(OFF, t)
+            for key in keys:
+                t.insert(key)
+            return t
+
+        t, size = allocated_bytes(build)
+        self.assertEqual(t.size, n)
+        self.assertLessEqual(size / n, 88)
+
 
 class TestBSTNode(unittest.TestCase):
     def test_create_when_key_None(self):
@@ -288,6 +627,7 @@ class TestBSTNode(unittest.TestCase):
 
     def test_create_default(self):
         n = _BSTNode(12)
+        self.assertFalse(hasattr(n, "__dict__"))
         self.assertEqual(n.key, 12)
         self.assertIsNone(n.left)
         self.assertIsNone(n.right)
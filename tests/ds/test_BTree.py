@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.BTree module.
+"""
+
+import unittest
+from bisect import bisect_left, bisect_right
+from random import randint, sample, shuffle
+
+from ands.ds.BTree import BTree, is_btree
+from ands.validation import OFF, set_validation_level
+
+
+class TestBTree(unittest.TestCase):
+    def setUp(self):
+        # A small minimum degree, so that nodes are often split and merged.
+        self.t = BTree(2)
+
+    def test_create_when_invalid_t(self):
+        self.assertRaises(TypeError, BTree, 2.0)
+        self.assertRaises(ValueError, BTree, 1)
+
+    def test_create_default(self):
+        t = BTree()
+        self.assertEqual(t.t, 32)
+        self.assertTrue(t.is_empty())
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.height(), 0)
+        self.assertIsNone(t.minimum())
+        self.assertIsNone(t.maximum())
+        self.assertEqual(list(t), [])
+
+    def test_insert_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.insert, None)
+
+    def test_insert_many(self):
+        ls = sample(range(10000), 1000)
+        for i, e in enumerate(ls):
+            self.t.insert(e, -e)
+            self.assertEqual(self.t.size, i + 1)
+        self.assertTrue(is_btree(self.t))
+        self.assertEqual(list(self.t), sorted(ls))
+        self.assertEqual(self.t.minimum(), min(ls))
+        self.assertEqual(self.t.maximum(), max(ls))
+
+    def test_insert_existing_key_replaces_value(self):
+        self.t.insert(3, "three")
+        self.t.insert(3, "THREE")
+        self.assertEqual(self.t.size, 1)
+        self.assertEqual(self.t[3], "THREE")
+
+    def test_height_is_logarithmic(self):
+        t = BTree(16)
+        set_validation_level(OFF, t)
+        for e in range(10000):
+            t.insert(e)
+        self.assertLessEqual(t.height(), 4)
+
+    def test_contains(self):
+        ls = sample(range(1000), 300)
+        for e in ls:
+            self.t.insert(e)
+        for e in range(1000):
+            self.assertEqual(self.t.contains(e), e in ls)
+            self.assertEqual(e in self.t, e in ls)
+        self.assertRaises(ValueError, self.t.contains, None)
+
+    def test_map_access(self):
+        self.t[5] = "five"
+        self.t[2] = "two"
+        self.assertEqual(self.t[5], "five")
+        self.assertEqual(self.t.get(2), "two")
+        self.assertEqual(self.t.get(3, "x"), "x")
+        self.assertRaises(KeyError, self.t.__getitem__, 3)
+        del self.t[5]
+        self.assertNotIn(5, self.t)
+        self.assertRaises(KeyError, self.t.__delitem__, 5)
+
+    def test_delete_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.delete, None)
+
+    def test_delete_when_key_not_found(self):
+        self.t.insert(3)
+        self.assertRaises(LookupError, self.t.delete, 4)
+
+    def test_delete_all_in_random_order(self):
+        ls = sample(range(10000), 500)
+        for e in ls:
+            self.t.insert(e)
+        shuffle(ls)
+        for i, e in enumerate(ls):
+            self.t.delete(e)
+            self.assertNotIn(e, self.t)
+            self.assertEqual(self.t.size, len(ls) - i - 1)
+        self.assertTrue(self.t.is_empty())
+        self.assertTrue(is_btree(self.t))
+
+    def test_random_operations_against_dict(self):
+        d = {}
+        for step in range(3000):
+            e = randint(0, 300)
+            if e in d and randint(0, 1):
+                self.t.delete(e)
+                del d[e]
+            else:
+                self.t[e] = step
+                d[e] = step
+        self.assertTrue(is_btree(self.t))
+        self.assertEqual(list(self.t.items()), sorted(d.items()))
+
+    def test_successor_and_predecessor(self):
+        ls = sorted(sample(range(1000), 300))
+        for e in ls:
+            self.t.insert(e)
+        for i, e in enumerate(ls):
+            self.assertEqual(self.t.successor(e),
+                             ls[i + 1] if i + 1 < len(ls) else None)
+            self.assertEqual(self.t.predecessor(e), ls[i - 1] if i else None)
+        self.assertRaises(LookupError, self.t.successor, 1000)
+        self.assertRaises(LookupError, self.t.predecessor, 1000)
+
+    def test_floor_and_ceiling(self):
+        ls = sorted(sample(range(1000), 200))
+        for e in ls:
+            self.t.insert(e)
+        for probe in range(-10, 1010, 3):
+            i = bisect_right(ls, probe)
+            self.assertEqual(self.t.floor(probe), ls[i - 1] if i else None)
+            i = bisect_left(ls, probe)
+            self.assertEqual(self.t.ceiling(probe),
+                             ls[i] if i < len(ls) else None)
+        self.assertRaises(ValueError, self.t.floor, None)
+        self.assertRaises(ValueError, self.t.ceiling, None)
+
+    def test_rank_and_select(self):
+        ls = sorted(sample(range(1000), 300))
+        for e in sample(ls, len(ls)):
+            self.t.insert(e)
+        for i, e in enumerate(ls):
+            self.assertEqual(self.t.rank(e), i)
+            self.assertEqual(self.t.select(i), e)
+        self.assertRaises(LookupError, self.t.rank, 1000)
+        self.assertRaises(ValueError, self.t.select, -1)
+        self.assertRaises(ValueError, self.t.select, 300)
+        self.assertRaises(TypeError, self.t.select, "0")
+
+    def test_count_between(self):
+        ls = sorted(sample(range(1000), 300))
+        for e in ls:
+            self.t.insert(e)
+        for _ in range(100):
+            lo, hi = randint(-10, 1010), randint(-10, 1010)
+            self.assertEqual(self.t.count_between(lo, hi),
+                             len([e for e in ls if lo <= e <= hi]))
+        self.assertRaises(ValueError, self.t.count_between, None, 3)
+
+    def test_iter_range(self):
+        for e in [10, 4, 85, 43, 6, 1, 69, 7, 100, 2]:
+            self.t.insert(e)
+        self.assertEqual(list(self.t.iter_range(4, 43)), [4, 6, 7, 10, 43])
+        self.assertEqual(list(self.t.iter_range(5, 42, reverse=True)),
+                         [10, 7, 6])
+        self.assertEqual(list(self.t.iter_range(86, 99)), [])
+        self.assertEqual(list(self.t.iter_range(43, 4)), [])
+        self.assertRaises(ValueError, self.t.iter_range, None, 4)
+
+    def test_iter_and_reversed(self):
+        ls = sample(range(1000), 500)
+        for e in ls:
+            self.t.insert(e)
+        self.assertEqual(list(self.t), sorted(ls))
+        self.assertEqual(list(reversed(self.t)), sorted(ls, reverse=True))
+
+    def test_items(self):
+        for e in [10, 4, 85, 43, 6]:
+            self.t[e] = str(e)
+        self.assertEqual(list(self.t.items(5, 43)),
+                         [(6, "6"), (10, "10"), (43, "43")])
+        self.assertEqual(list(self.t.items(lo=50)), [(85, "85")])
+
+    def test_pop_min_and_pop_max(self):
+        self.assertIsNone(self.t.pop_min())
+        self.assertIsNone(self.t.pop_max())
+        for e in range(20):
+            self.t[e] = -e
+        self.assertEqual(self.t.pop_min(), (0, 0))
+        self.assertEqual(self.t.pop_max(), (19, -19))
+        self.t.remove_min()
+        self.t.remove_max()
+        self.assertEqual(list(self.t), list(range(2, 18)))
+
+    def test_clear(self):
+        for e in range(100):
+            self.t.insert(e)
+        self.t.clear()
+        self.assertTrue(self.t.is_empty())
+        self.assertTrue(is_btree(self.t))
+
+
+class TestBTreeBulkLoading(unittest.TestCase):
+    def test_from_sorted_when_key_is_None(self):
+        self.assertRaises(ValueError, BTree.from_sorted, [1, None])
+
+    def test_from_sorted_all_sizes(self):
+        for t in [2, 3, 5]:
+            for n in range(150):
+                tree = BTree.from_sorted(range(n), t)
+                self.assertTrue(is_btree(tree))
+                self.assertEqual(tree.t, t)
+                self.assertEqual(list(tree), list(range(n)))
+
+    def test_from_sorted_has_minimum_height(self):
+        tree = BTree.from_sorted(range(10000), 16)
+        # A B-tree of height 2 with t = 16 contains at most 32^2 - 1 keys.
+        self.assertEqual(tree.height(), 3)
+
+    def test_from_sorted_then_insert_and_delete(self):
+        tree = BTree.from_sorted(range(0, 1000, 2), 3)
+        for e in range(1, 1000, 2):
+            tree.insert(e)
+        for e in range(0, 1000, 3):
+            tree.delete(e)
+        self.assertTrue(is_btree(tree))
+        self.assertEqual(tree.size, 1000 - len(range(0, 1000, 3)))
+
+    def test_from_iterable(self):
+        ls = [randint(0, 300) for _ in range(1000)]
+        tree = BTree.from_iterable(ls, 4)
+        self.assertTrue(is_btree(tree))
+        self.assertEqual(list(tree), sorted(set(ls)))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.DaryMaxHeap module.
+"""
+
+import unittest
+from random import randint, choice
+
+from ands.ds.DaryMaxHeap import DaryMaxHeap
+from ands.ds.MaxHeap import MaxHeap, is_max_heap
+from tests.ds.test_MinHeap import _Task
+
+
+class TestDaryMaxHeap(unittest.TestCase):
+    def test_creation_default(self):
+        h = DaryMaxHeap()
+        self.assertIsInstance(h, MaxHeap)
+        self.assertEqual(h.d, 4)
+        self.assertTrue(h.is_empty())
+        self.assertIsNone(h.find_max())
+        self.assertIsNone(h.remove_max())
+
+    def test_creation_when_invalid_d(self):
+        self.assertRaises(TypeError, DaryMaxHeap, None, 2.0)
+        self.assertRaises(ValueError, DaryMaxHeap, None, 1)
+
+    def test_creation_given_list(self):
+        for d in [2, 3, 4, 8]:
+            for n in range(40):
+                a = [randint(-100, 100) for _ in range(n)]
+                h = DaryMaxHeap(list(a), d)
+                self.assertTrue(is_max_heap(h))
+                self.assertEqual(h.size, n)
+                self.assertEqual(h.find_max(), max(a) if a else None)
+
+    def test_parent_index(self):
+        h = DaryMaxHeap(list(range(20)), 3)
+        self.assertEqual(h._parent_index(0), -1)
+        for i in range(1, 20):
+            self.assertEqual(h._parent_index(i), (i - 1) // 3)
+
+    def test_add_and_remove_max(self):
+        for d in [2, 3, 5, 16]:
+            h = DaryMaxHeap(d=d)
+            a = [randint(-1000, 1000) for _ in range(500)]
+            for e in a:
+                h.add(e)
+            self.assertTrue(is_max_heap(h))
+            self.assertEqual([h.remove_max() for _ in a],
+                             sorted(a, reverse=True))
+            self.assertTrue(h.is_empty())
+
+    def test_add_when_argument_is_None(self):
+        self.assertRaises(ValueError, DaryMaxHeap().add, None)
+
+    def test_interleaved_operations(self):
+        h = DaryMaxHeap(d=8)
+        model = []
+        for _ in range(2000):
+            if model and randint(0, 2) == 0:
+                model.remove(max(model))
+                h.remove_max()
+            else:
+                e = randint(0, 100)
+                model.append(e)
+                h.add(e)
+            self.assertEqual(h.find_max(), max(model) if model else None)
+        self.assertTrue(is_max_heap(h))
+
+    def test_delete(self):
+        a = [randint(-100, 100) for _ in range(200)]
+        h = DaryMaxHeap(list(a), 3)
+        while a:
+            e = choice(a)
+            a.remove(e)
+            h.delete(e)
+            self.assertTrue(is_max_heap(h))
+        self.assertTrue(h.is_empty())
+        self.assertRaises(LookupError, h.delete, 3)
+
+    def test_merge(self):
+        a = DaryMaxHeap([randint(-100, 100) for _ in range(100)], 4)
+        b = DaryMaxHeap([randint(-100, 100) for _ in range(100)], 4)
+        expected = sorted(a.heap + b.heap, reverse=True)
+        a.merge(b)
+        self.assertTrue(is_max_heap(a))
+        self.assertEqual([a.remove_max() for _ in range(200)], expected)
+
+    def test_batch_operations(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        h = DaryMaxHeap(list(a[:50]), 5)
+        h.add_many(a[50:])
+        self.assertTrue(is_max_heap(h))
+        expected = sorted(a, reverse=True)
+        self.assertEqual(h.peek_many(20), expected[:20])
+        self.assertEqual(h.pop_many(20), expected[:20])
+        self.assertEqual(h.peek_many(100), expected[20:])
+
+    def test_key_orders_elements_by_their_keys(self):
+        for d in [2, 3, 5]:
+            ls = [randint(-100, 100) for _ in range(randint(0, 100))]
+            h = DaryMaxHeap(list(ls), d, key=abs)
+            self.assertTrue(is_max_heap(h))
+            for x in [randint(-100, 100) for _ in range(randint(0, 100))]:
+                h.add(x)
+                ls.append(x)
+            removed = [h.remove_max() for _ in range(h.size)]
+            self.assertEqual([abs(x) for x in removed],
+                             sorted((abs(x) for x in ls), reverse=True))
+
+    def test_key_ties_are_removed_in_insertion_order(self):
+        for d in [2, 3, 5]:
+            tasks = [_Task(randint(0, 5), i) for i in range(300)]
+            h = DaryMaxHeap(tasks[:100], d, key=lambda t: t.priority)
+            for t in tasks[100:200]:
+                h.add(t)
+            h.add_many(tasks[200:])
+            h.delete(tasks[7])
+            self.assertTrue(is_max_heap(h))
+            removed = [h.remove_max() for _ in range(h.size)]
+            expected = sorted(tasks[:7] + tasks[8:], key=lambda t: t.priority,
+                              reverse=True)
+            self.assertEqual([t.name for t in removed],
+                             [t.name for t in expected])
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 22/02/2016
 
-Updated: 08/03/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -20,6 +20,7 @@ import unittest
 from random import randint, choice
 
 from ands.ds.DisjointSetsForest import DisjointSetsForest, _DSFNode
+from tests.ds.util import allocated_bytes
 
 
 class TestDSFNode(unittest.TestCase):
@@ -45,6 +46,26 @@ class TestDSFNode(unittest.TestCase):
         n = _DSFNode(39)
         self.assertEqual("39", str(n))
 
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(_DSFNode(3), "__dict__"))
+
+
+class TestDSFMemoryFootprint(unittest.TestCase):
+    def test_bytes_per_node(self):
+        n = 2000
+        xs = [randint(10 ** 6, 10 ** 9) for _ in range(n)]
+
+        def build():
+            d = DisjointSetsForest()
+            for x in set(xs):
+                d.make_set(x)
+            return d
+
+        d, size = allocated_bytes(build)
+        # Each element also has an entry in the dictionary which maps elements
+        # to their nodes.
+        self.assertLessEqual(size / d.size, 120)
+
 
 class TestDSForests(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.IndexedMinHeap module.
+"""
+
+import unittest
+from random import randint, sample, shuffle
+
+from ands.ds.IndexedMinHeap import IndexedMinHeap, is_indexed_min_heap
+from ands.ds.MinHeap import MinHeap
+
+
+class TestIndexedMinHeap(unittest.TestCase):
+    def setUp(self):
+        self.h = IndexedMinHeap()
+
+    def test_creation_default(self):
+        self.assertTrue(self.h.is_empty())
+        self.assertEqual(self.h.size, 0)
+        self.assertIsInstance(self.h, MinHeap)
+        self.assertIsNone(self.h.find_min())
+        self.assertIsNone(self.h.remove_min())
+
+    def test_creation_given_items(self):
+        d = {"a": 5, "b": 2, "c": 9, "d": 1}
+        h = IndexedMinHeap(d.items())
+        self.assertTrue(is_indexed_min_heap(h))
+        self.assertEqual(h.size, 4)
+        self.assertEqual(h.find_min(), ("d", 1))
+        self.assertEqual(sorted(h), sorted(d.items()))
+
+    def test_creation_when_items_are_not_distinct(self):
+        self.assertRaises(ValueError, IndexedMinHeap, [("a", 1), ("a", 2)])
+        self.assertRaises(ValueError, IndexedMinHeap, [(None, 1)])
+
+    def test_add(self):
+        ls = sample(range(1000), 200)
+        for i, e in enumerate(ls):
+            self.h.add(str(e), e)
+            self.assertEqual(self.h.size, i + 1)
+        self.assertTrue(is_indexed_min_heap(self.h))
+        self.assertEqual(self.h.find_min(), (str(min(ls)), min(ls)))
+
+    def test_add_when_invalid_arguments(self):
+        self.assertRaises(ValueError, self.h.add, None, 1)
+        self.assertRaises(ValueError, self.h.add, "a", None)
+        self.h.add("a", 1)
+        self.assertRaises(ValueError, self.h.add, "a", 2)
+
+    def test_items_do_not_need_to_be_comparable(self):
+        a, b = object(), object()
+        self.h.add(a, 1)
+        self.h.add(b, 1)
+        self.h.add((3, 4), 0)
+        self.assertEqual(self.h.remove_min(), ((3, 4), 0))
+        self.assertEqual({self.h.remove_min()[0], self.h.remove_min()[0]},
+                         {a, b})
+
+    def test_contains(self):
+        for e in range(10):
+            self.h.add(e, -e)
+        self.assertTrue(self.h.contains(3))
+        self.assertIn(9, self.h)
+        self.assertNotIn(10, self.h)
+        self.assertRaises(ValueError, self.h.contains, None)
+
+    def test_priority(self):
+        self.h.add("a", 3)
+        self.assertEqual(self.h.priority("a"), 3)
+        self.assertRaises(LookupError, self.h.priority, "b")
+
+    def test_update_priority(self):
+        ls = sample(range(1000), 300)
+        priorities = {}
+        for e in ls:
+            self.h.add(e, e)
+            priorities[e] = e
+        for e in sample(ls, 200):
+            p = randint(-1000, 2000)
+            self.h.update_priority(e, p)
+            priorities[e] = p
+            self.assertEqual(self.h.priority(e), p)
+        self.assertTrue(is_indexed_min_heap(self.h))
+        self.assertRaises(LookupError, self.h.update_priority, 1000, 3)
+        self.assertRaises(ValueError, self.h.update_priority, ls[0], None)
+        result = [self.h.remove_min() for _ in range(len(ls))]
+        self.assertEqual([p for _, p in result],
+                         sorted(priorities.values()))
+
+    def test_decrease_key(self):
+        for e in range(100):
+            self.h.add(e, e)
+        self.h.decrease_key(50, -1)
+        self.assertEqual(self.h.find_min(), (50, -1))
+        self.h.decrease_key(60, 60)
+        self.assertRaises(ValueError, self.h.decrease_key, 70, 71)
+        self.assertRaises(LookupError, self.h.decrease_key, 100, 0)
+        self.assertTrue(is_indexed_min_heap(self.h))
+
+    def test_delete(self):
+        ls = list(range(300))
+        for e in ls:
+            self.h.add(e, randint(0, 50))
+        shuffle(ls)
+        for i, e in enumerate(ls):
+            self.h.delete(e)
+            self.assertNotIn(e, self.h)
+            self.assertEqual(self.h.size, len(ls) - i - 1)
+            if i % 20 == 0:
+                self.assertTrue(is_indexed_min_heap(self.h))
+        self.assertTrue(self.h.is_empty())
+        self.assertRaises(LookupError, self.h.delete, 0)
+        self.assertRaises(ValueError, self.h.delete, None)
+
+    def test_remove_min(self):
+        ls = [randint(-100, 100) for _ in range(200)]
+        for i, p in enumerate(ls):
+            self.h.add(i, p)
+        self.assertEqual([self.h.remove_min()[1] for _ in ls], sorted(ls))
+        self.assertTrue(self.h.is_empty())
+
+    def test_clear(self):
+        for e in range(10):
+            self.h.add(e, e)
+        self.h.clear()
+        self.assertTrue(self.h.is_empty())
+        self.assertNotIn(3, self.h)
+        self.h.add(3, 3)
+        self.assertTrue(is_indexed_min_heap(self.h))
+
+    def test_merge(self):
+        a = IndexedMinHeap((i, i) for i in range(0, 100, 2))
+        b = IndexedMinHeap((i, i) for i in range(1, 100, 2))
+        a.merge(b)
+        self.assertTrue(is_indexed_min_heap(a))
+        self.assertEqual(a.size, 100)
+        self.assertEqual(b.size, 50)
+        a.decrease_key(99, -1)
+        self.assertEqual(a.find_min(), (99, -1))
+        self.assertEqual(b.priority(99), 99)
+
+    def test_merge_when_items_in_common(self):
+        a = IndexedMinHeap([(1, 1), (2, 2)])
+        b = IndexedMinHeap([(2, 3)])
+        self.assertRaises(ValueError, a.merge, b)
+        self.assertRaises(ValueError, a.merge, a)
+        self.assertRaises(TypeError, a.merge, MinHeap([1]))
+        self.assertEqual(a.size, 2)
+
+    def test_dijkstra(self):
+        graph = {"s": {"a": 7, "b": 2}, "a": {"c": 1}, "b": {"a": 3, "c": 8},
+                 "c": {}}
+        dist = {"s": 0}
+        self.h.add("s", 0)
+        done = set()
+        while not self.h.is_empty():
+            u, d = self.h.remove_min()
+            done.add(u)
+            for v, w in graph[u].items():
+                if v in done:
+                    continue
+                if v not in dist:
+                    dist[v] = d + w
+                    self.h.add(v, d + w)
+                elif d + w < dist[v]:
+                    dist[v] = d + w
+                    self.h.decrease_key(v, d + w)
+        self.assertEqual(dist, {"s": 0, "a": 5, "b": 2, "c": 6})
+
+    def test_add_many(self):
+        priorities = [randint(-100, 100) for _ in range(100)]
+        self.h.add_many((i, p) for i, p in enumerate(priorities[:90]))
+        self.h.add_many((i, p) for i, p in enumerate(priorities) if i >= 90)
+        self.assertTrue(is_indexed_min_heap(self.h))
+        self.assertEqual([p for _, p in self.h.pop_many(100)],
+                         sorted(priorities))
+
+    def test_add_many_when_items_are_not_distinct(self):
+        self.h.add("a", 1)
+        self.assertRaises(ValueError, self.h.add_many, [("b", 1), ("a", 2)])
+        self.assertRaises(ValueError, self.h.add_many, [("b", 1), ("b", 2)])
+        self.assertEqual(self.h.size, 1)
+        self.assertFalse(self.h.contains("b"))
+
+    def test_pop_many_and_peek_many(self):
+        items = {i: randint(-100, 100) for i in range(50)}
+        self.h.add_many(items.items())
+        expected = sorted(items.values())
+        self.assertEqual([p for _, p in self.h.peek_many(10)], expected[:10])
+        popped = self.h.pop_many(10)
+        self.assertEqual([p for _, p in popped], expected[:10])
+        self.assertTrue(is_indexed_min_heap(self.h))
+        for item, p in popped:
+            self.assertEqual(items[item], p)
+            self.assertFalse(self.h.contains(item))
+
+    def test_is_indexed_min_heap(self):
+        self.assertFalse(is_indexed_min_heap(MinHeap()))
+        for e in range(10):
+            self.h.add(e, e)
+        self.h._positions[3] = 4
+        self.assertFalse(is_indexed_min_heap(self.h))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.IntervalTree module.
+"""
+
+import io
+import unittest
+from random import randint, choice
+
+from ands.ds.IntervalTree import IntervalTree, is_interval_tree
+from ands.ds.RBT import RBT
+from ands.validation import OFF, set_validation_level
+
+
+def random_interval(lo: int = 0, hi: int = 1000, max_length: int = 50):
+    low = randint(lo, hi)
+    return low, low + randint(0, max_length)
+
+
+def overlapping(intervals: list, a, b) -> list:
+    return sorted(iv for iv in intervals if iv[0] <= b and a <= iv[1])
+
+
+class TestIntervalTree(unittest.TestCase):
+    def setUp(self):
+        self.t = IntervalTree()
+
+    def test_create(self):
+        self.assertTrue(self.t.is_empty())
+        self.assertIsInstance(self.t, RBT)
+        self.assertTrue(is_interval_tree(self.t))
+        self.assertEqual(list(self.t.overlapping(0, 10)), [])
+
+    def test_insert_when_interval_is_invalid(self):
+        self.assertRaises(ValueError, self.t.insert_interval, 3, 2)
+        self.assertRaises(ValueError, self.t.insert_interval, None, 2)
+        self.assertRaises(ValueError, self.t.insert_interval, 2, None)
+        self.assertRaises(TypeError, self.t.insert, 3)
+        self.assertRaises(TypeError, self.t.insert, (1, 2, 3))
+
+    def test_insert_interval(self):
+        self.t.insert_interval(5, 10, "a")
+        self.t.insert_interval(1, 3)
+        self.t.insert_interval(5, 10, "b")
+        self.t.insert_interval(7, 7)
+        self.assertEqual(self.t.size, 4)
+        self.assertEqual(list(self.t), [(1, 3), (5, 10), (5, 10), (7, 7)])
+        self.assertIn((7, 7), self.t)
+        self.assertTrue(is_interval_tree(self.t))
+
+    def test_map_access(self):
+        self.t[(1, 4)] = "a"
+        self.t[(1, 4)] = "b"
+        self.assertEqual(self.t.size, 1)
+        self.assertEqual(self.t[(1, 4)], "b")
+        self.assertRaises(ValueError, self.t.__setitem__, (4, 1), "c")
+
+    def test_delete_interval(self):
+        for iv in [(5, 10), (1, 3), (5, 10), (7, 7)]:
+            self.t.insert_interval(*iv)
+        self.t.delete_interval(5, 10)
+        self.assertEqual(list(self.t), [(1, 3), (5, 10), (7, 7)])
+        self.assertRaises(LookupError, self.t.delete_interval, 5, 11)
+        self.assertTrue(is_interval_tree(self.t))
+
+    def test_overlapping_when_query_is_invalid(self):
+        self.assertRaises(ValueError, self.t.overlapping, 3, 2)
+        self.assertRaises(ValueError, self.t.overlapping, None, 2)
+
+    def test_overlapping(self):
+        intervals = [(15, 20), (10, 30), (17, 19), (5, 20), (12, 15),
+                     (30, 40)]
+        for iv in intervals:
+            self.t.insert_interval(*iv)
+        self.assertEqual(list(self.t.overlapping(14, 16)),
+                         [(5, 20), (10, 30), (12, 15), (15, 20)])
+        # Endpoints are included.
+        self.assertEqual(list(self.t.overlapping(40, 50)), [(30, 40)])
+        self.assertEqual(list(self.t.overlapping(0, 5)), [(5, 20)])
+        self.assertEqual(list(self.t.overlapping(41, 50)), [])
+        # Stabbing query.
+        self.assertEqual(list(self.t.overlapping(18, 18)),
+                         [(5, 20), (10, 30), (15, 20), (17, 19)])
+
+    def test_overlapping_items(self):
+        self.t.insert_interval(1, 5, "a")
+        self.t.insert_interval(4, 8, "b")
+        self.t.insert_interval(9, 9, "c")
+        self.assertEqual(list(self.t.overlapping_items(5, 9)),
+                         [((1, 5), "a"), ((4, 8), "b"), ((9, 9), "c")])
+
+    def test_random_operations(self):
+        intervals = []
+        for step in range(600):
+            if intervals and randint(0, 2) == 0:
+                iv = choice(intervals)
+                intervals.remove(iv)
+                self.t.delete_interval(*iv)
+            else:
+                iv = random_interval()
+                intervals.append(iv)
+                self.t.insert_interval(*iv)
+            if step % 20 == 0:
+                a, b = random_interval(-10, 1050, 100)
+                self.assertEqual(list(self.t.overlapping(a, b)),
+                                 overlapping(intervals, a, b))
+        self.assertTrue(is_interval_tree(self.t))
+        self.assertEqual(list(self.t), sorted(intervals))
+
+    def test_max_high_after_pop_min_and_pop_max(self):
+        for _ in range(200):
+            self.t.insert_interval(*random_interval())
+        while not self.t.is_empty():
+            self.t.pop_min()
+            self.t.pop_max()
+            self.assertTrue(is_interval_tree(self.t))
+
+    def test_overlapping_visits_few_nodes(self):
+        class Counted(int):
+            comparisons = 0
+
+            def __lt__(self, other):
+                Counted.comparisons += 1
+                return int.__lt__(self, other)
+
+        t = IntervalTree()
+        set_validation_level(OFF, t)
+        for i in range(2 ** 14):
+            t.insert_interval(2 * i, Counted(2 * i + 1))
+        Counted.comparisons = 0
+        self.assertEqual(list(t.overlapping(1000, 1002)),
+                         [(1000, 1001), (1002, 1003)])
+        # Only a few paths from the root are visited, not the whole tree.
+        self.assertLess(Counted.comparisons, 10 * 14)
+
+    def test_from_sorted(self):
+        intervals = sorted(random_interval() for _ in range(500))
+        t = IntervalTree.from_sorted(intervals)
+        self.assertTrue(is_interval_tree(t))
+        for _ in range(20):
+            a, b = random_interval(-10, 1050)
+            self.assertEqual(list(t.overlapping(a, b)),
+                             overlapping(intervals, a, b))
+
+    def test_split_and_join(self):
+        intervals = [random_interval() for _ in range(300)]
+        for iv in intervals:
+            self.t.insert_interval(*iv)
+        left, item, right = self.t.split((500, 510))
+        self.assertTrue(is_interval_tree(left) and is_interval_tree(right))
+        t = IntervalTree.join(left, (500, 510), right)
+        self.assertTrue(is_interval_tree(t))
+        # join inserts the interval removed by split, if any.
+        if item is None:
+            intervals.append((500, 510))
+        self.assertEqual(list(t.overlapping(400, 600)),
+                         overlapping(intervals, 400, 600))
+
+    def test_dump_and_load(self):
+        for i in range(100):
+            self.t.insert_interval(*random_interval(), value=i)
+        fp = io.BytesIO()
+        self.t.dump(fp)
+        fp.seek(0)
+        t = IntervalTree.load(fp)
+        self.assertTrue(is_interval_tree(t))
+        self.assertEqual(list(t.items()), list(self.t.items()))
+
+    def test_is_interval_tree(self):
+        self.assertFalse(is_interval_tree(RBT()))
+        for i in range(10):
+            self.t.insert_interval(i, i + 5)
+        self.t._root.max_high = 100
+        self.assertFalse(is_interval_tree(self.t))
@@ -36,6 +36,20 @@ def gen_rand_list_of_distinct_ascii_and_numbers() -> list:
     return ls
 
 
+class CollidingKey:
+    """A key whose hash code is chosen among few values, so that many keys
+    collide."""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 7
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
 class TestHasDuplicatesIgnoreNones(unittest.TestCase):
     def test_empty_list(self):
         self.assertFalse(has_duplicates_ignore_nones([]))
@@ -80,6 +94,12 @@ class TestLinearProbingHashTable(unittest.TestCase):
         self.assertRaises(ValueError, LinearProbingHashTable, 0)
         self.assertRaises(ValueError, LinearProbingHashTable, -1)
 
+    def test_create_max_load_factor_not_valid(self):
+        self.assertRaises(TypeError, LinearProbingHashTable, 11, "0.5")
+        self.assertRaises(ValueError, LinearProbingHashTable, 11, 0)
+        self.assertRaises(ValueError, LinearProbingHashTable, 11, 1)
+        self.assertRaises(ValueError, LinearProbingHashTable, 11, 1.5)
+
     def test_create_set_initial_capacity(self):
         t = LinearProbingHashTable(9)
         self.assertEqual(t.capacity, 9)
@@ -186,6 +206,33 @@ class TestLinearProbingHashTable(unittest.TestCase):
         for elem in ls:
             self.assertIsNotNone(t.get(elem))
 
+    def test_put_grows_when_load_factor_exceeds_max(self):
+        for max_load_factor in (0.25, 0.5, 0.75, 0.9):
+            t = LinearProbingHashTable(1, max_load_factor)
+            ls = gen_rand_list_of_distinct_ascii_and_numbers()
+            for i, key in enumerate(ls):
+                t.put(key, i)
+                self.assertLessEqual(t.load_factor, max_load_factor)
+                self.assertEqual(t.size, i + 1)
+            self.assertEqual(t.max_load_factor, max_load_factor)
+            for i, key in enumerate(ls):
+                self.assertEqual(t.get(key), i)
+
+    def test_delete_shrinks_but_not_below_initial_capacity(self):
+        t = LinearProbingHashTable(5, 0.5)
+        for i in range(1000):
+            t.put(i, i)
+        self.assertGreaterEqual(t.capacity, 2000)
+        for i in range(990):
+            self.assertEqual(t.delete(i), i)
+        self.assertEqual(t.size, 10)
+        self.assertLess(t.capacity, 100)
+        for i in range(990, 1000):
+            self.assertEqual(t.get(i), i)
+        for i in range(990, 1000):
+            t.delete(i)
+        self.assertEqual(t.capacity, 5)
+
     def test_delete_key_None(self):
         t = LinearProbingHashTable()
         self.assertRaises(TypeError, t.delete, None)
@@ -229,6 +276,48 @@ class TestLinearProbingHashTable(unittest.TestCase):
 
         self.assertEqual(t.size, 0)
 
+    def test_delete_keeps_colliding_keys_reachable(self):
+        t = LinearProbingHashTable(23, 0.9)
+        keys = [CollidingKey(i) for i in range(20)]
+        for k in keys:
+            t.put(k, k.value)
+        for k in sample(keys, 10):
+            self.assertEqual(t.delete(k), k.value)
+            keys.remove(k)
+            for other in keys:
+                self.assertEqual(t.get(other), other.value)
+        self.assertEqual(t.size, 10)
+
+    def test_delete_wrapping_around(self):
+        t = LinearProbingHashTable(11, 0.9)
+        # All keys hash to slot 9, so they wrap around to the slots 0, 1, ...
+        for k in (9, 20, 31, 42):
+            t.put(k, k)
+        self.assertEqual(t.delete(20), 20)
+        for k in (9, 31, 42):
+            self.assertEqual(t.get(k), k)
+        self.assertIsNone(t.get(20))
+        self.assertEqual(t.delete(9), 9)
+        self.assertEqual(t.get(31), 31)
+        self.assertEqual(t.get(42), 42)
+
+    def test_mixed_puts_and_deletes(self):
+        for max_load_factor in (0.5, 0.9):
+            t = LinearProbingHashTable(max_load_factor=max_load_factor)
+            d = {}
+            for _ in range(3000):
+                k = CollidingKey(randint(0, 200))
+                if randint(0, 2) == 0:
+                    self.assertEqual(t.delete(k), d.pop(k, None))
+                else:
+                    v = randint(0, 1000)
+                    t.put(k, v)
+                    d[k] = v
+            self.assertEqual(t.size, len(d))
+            for i in range(201):
+                k = CollidingKey(i)
+                self.assertEqual(t.get(k), d.get(k))
+
     def test_show(self):
         t = LinearProbingHashTable()
         ls = sample(range(3), 3)
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 17/02/2016
 
-Updated: 12/03/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -21,6 +21,20 @@ from random import randint, choice, sample
 from ands.ds.MaxHeap import MaxHeap, is_max_heap
 
 
+class _Task:
+    """An element which is not comparable, and which is only ordered by a key
+    function."""
+
+    def __init__(self, priority: int, name: str):
+        self.priority = priority
+        self.name = name
+
+    def __lt__(self, other):
+        raise AssertionError("elements should not be compared")
+
+    __gt__ = __le__ = __ge__ = __lt__
+
+
 class TestMaxHeap(unittest.TestCase):
     def test_heap_creation_default(self):
         h = MaxHeap()
@@ -180,3 +194,130 @@ class TestMaxHeap(unittest.TestCase):
         self.assertIsNone(a.merge(b))
         self.assertEqual(a.size, size * 2)
         self.assertEqual(b.size, size)
+
+    def test_key_when_not_callable(self):
+        self.assertRaises(TypeError, MaxHeap, [1, 2], 3)
+
+    def test_key_orders_elements_by_their_keys(self):
+        ls = [randint(-100, 100) for _ in range(randint(0, 100))]
+        h = MaxHeap(list(ls), key=abs)
+        self.assertTrue(is_max_heap(h))
+        for x in [randint(-100, 100) for _ in range(randint(0, 100))]:
+            h.add(x)
+            ls.append(x)
+        ks = [abs(x) for x in ls]
+        removed = [h.remove_max() for _ in range(h.size)]
+        self.assertEqual([abs(x) for x in removed], sorted(ks, reverse=True))
+        self.assertTrue(h.is_empty())
+
+    def test_key_is_computed_once_per_element(self):
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return x
+
+        h = MaxHeap([3, 1, 2], key=key)
+        h.add(0)
+        h.remove_max()
+        h.delete(2)
+        self.assertEqual(sorted(calls), [0, 1, 2, 3])
+
+    def test_key_ties_are_removed_in_insertion_order(self):
+        tasks = [_Task(randint(0, 5), i) for i in range(200)]
+        h = MaxHeap(tasks[:50], key=lambda t: t.priority)
+        for t in tasks[50:]:
+            h.add(t)
+        removed = [h.remove_max() for _ in range(h.size)]
+        expected = sorted(tasks, key=lambda t: t.priority,
+                          reverse=True)
+        self.assertEqual([t.name for t in removed],
+                         [t.name for t in expected])
+
+    def test_key_delete_keeps_keys_aligned(self):
+        tasks = [_Task(randint(0, 20), i) for i in range(100)]
+        h = MaxHeap(key=lambda t: t.priority)
+        for t in tasks:
+            h.add(t)
+        for t in sample(tasks, 50):
+            h.delete(t)
+            tasks.remove(t)
+            self.assertTrue(is_max_heap(h))
+        self.assertEqual(h._keys, [t.priority for t in h.heap])
+        expected = sorted(tasks, key=lambda t: t.priority, reverse=True)
+        self.assertEqual([h.remove_max().name for _ in range(h.size)],
+                         [t.name for t in expected])
+
+    def test_key_merge(self):
+        a = MaxHeap([_Task(1, "a1"), _Task(2, "a2")], key=lambda t: t.priority)
+        b = MaxHeap([_Task(1, "b1"), _Task(2, "b2")], key=lambda t: t.priority)
+        a.merge(b)
+        self.assertEqual(a.size, 4)
+        self.assertTrue(is_max_heap(a))
+        self.assertEqual([a.remove_max().name for _ in range(a.size)],
+                         ["a2", "b2", "a1", "b1"])
+
+    def test_key_clear(self):
+        h = MaxHeap([3, 1, 2], key=lambda x: -x)
+        h.clear()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h._keys, [])
+        h.add(5)
+        self.assertEqual(h.find_max(), 5)
+
+    def test_add_many_few_elements(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        b = [randint(-100, 100) for _ in range(3)]
+        h = MaxHeap(list(a))
+        self.assertIsNone(h.add_many(iter(b)))
+        self.assertTrue(is_max_heap(h))
+        self.assertEqual([h.remove_max() for _ in range(h.size)],
+                         sorted(a + b, reverse=True))
+
+    def test_add_many_many_elements(self):
+        a = [randint(-100, 100) for _ in range(10)]
+        b = [randint(-100, 100) for _ in range(200)]
+        h = MaxHeap(list(a))
+        h.add_many(b)
+        self.assertTrue(is_max_heap(h))
+        self.assertEqual([h.remove_max() for _ in range(h.size)],
+                         sorted(a + b, reverse=True))
+
+    def test_add_many_when_none(self):
+        h = MaxHeap([3, 1])
+        self.assertRaises(ValueError, h.add_many, [2, None])
+        self.assertEqual(h.size, 2)
+
+    def test_pop_many(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        h = MaxHeap(list(a))
+        expected = sorted(a, reverse=True)
+        self.assertEqual(h.pop_many(0), [])
+        self.assertEqual(h.pop_many(30), expected[:30])
+        self.assertTrue(is_max_heap(h))
+        self.assertEqual(h.size, 70)
+        self.assertEqual(h.pop_many(100), expected[30:])
+        self.assertTrue(h.is_empty())
+
+    def test_pop_many_when_k_is_not_valid(self):
+        h = MaxHeap([1, 2])
+        self.assertRaises(TypeError, h.pop_many, 1.0)
+        self.assertRaises(ValueError, h.pop_many, -1)
+
+    def test_peek_many(self):
+        a = [randint(-100, 100) for _ in range(randint(0, 100))]
+        h = MaxHeap(list(a))
+        heap = list(h.heap)
+        for k in (0, 1, 10, len(a), len(a) + 5):
+            self.assertEqual(h.peek_many(k), sorted(a, reverse=True)[:k])
+        self.assertEqual(h.heap, heap)
+
+    def test_peek_many_with_key_keeps_insertion_order(self):
+        tasks = [_Task(randint(0, 5), i) for i in range(100)]
+        h = MaxHeap(key=lambda t: t.priority)
+        h.add_many(tasks)
+        expected = sorted(tasks, key=lambda t: t.priority, reverse=True)
+        self.assertEqual([t.name for t in h.peek_many(40)],
+                         [t.name for t in expected[:40]])
+        self.assertEqual([t.name for t in h.pop_many(40)],
+                         [t.name for t in expected[:40]])
@@ -228,3 +228,78 @@ class TestMinMaxHeap(unittest.TestCase):
         self.assertIsNone(a.merge(b))
         self.assertEqual(a.size, size * 2)
         self.assertEqual(b.size, size)
+
+    def test_creation_with_invalid_capacity_or_evict(self):
+        self.assertRaises(TypeError, MinMaxHeap, None, 2.0)
+        self.assertRaises(ValueError, MinMaxHeap, None, 0)
+        self.assertRaises(ValueError, MinMaxHeap, [1, 2, 3], 2)
+        self.assertRaises(ValueError, MinMaxHeap, None, 2, "median")
+
+    def test_bounded_add_evicts_min(self):
+        a = [randint(-100, 100) for _ in range(200)]
+        h = MinMaxHeap(capacity=10)
+        evicted = []
+        for x in a:
+            e = h.add(x)
+            if e is not None:
+                evicted.append(e)
+            self.assertTrue(is_min_max_heap(h))
+            self.assertLessEqual(h.size, 10)
+        self.assertTrue(h.is_full())
+        self.assertEqual(sorted(h.heap), sorted(a)[-10:])
+        self.assertEqual(sorted(evicted), sorted(a)[:-10])
+
+    def test_bounded_add_evicts_max(self):
+        a = [randint(-100, 100) for _ in range(200)]
+        h = MinMaxHeap(capacity=10, evict="max")
+        evicted = [h.add(x) for x in a]
+        self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(sorted(h.heap), sorted(a)[:10])
+        self.assertEqual(sorted(e for e in evicted if e is not None),
+                         sorted(a)[10:])
+
+    def test_bounded_add_when_x_is_evicted(self):
+        h = MinMaxHeap([5, 7, 9], capacity=3)
+        heap = list(h.heap)
+        self.assertEqual(h.add(1), 1)
+        self.assertEqual(h.heap, heap)
+        self.assertEqual(h.add(8), 5)
+        self.assertEqual(h.find_min(), 7)
+        self.assertEqual(h.find_max(), 9)
+
+    def test_bounded_add_many(self):
+        for evict in ("min", "max"):
+            for k in (3, 5, 500):
+                a = [randint(-100, 100) for _ in range(20)]
+                b = [randint(-100, 100) for _ in range(k)]
+                h = MinMaxHeap(list(a), capacity=22, evict=evict)
+                heap = h.heap
+                evicted = h.add_many(b)
+                # The elements are replaced in place.
+                self.assertIs(h.heap, heap)
+                self.assertTrue(is_min_max_heap(h))
+                self.assertEqual(h.size, min(22, 20 + k))
+                expected = sorted(a + b)
+                if evict == "min":
+                    kept, out = expected[-22:], expected[:-22]
+                else:
+                    kept, out = expected[:22], expected[22:]
+                self.assertEqual(sorted(h.heap), kept)
+                self.assertEqual(sorted(evicted), out)
+
+    def test_unbounded_add_many(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        h = MinMaxHeap()
+        self.assertEqual(h.add_many(a), [])
+        self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(h.size, 100)
+        self.assertRaises(ValueError, h.add_many, [1, None])
+        self.assertEqual(h.size, 100)
+
+    def test_bounded_merge(self):
+        a = MinMaxHeap([randint(-100, 100) for _ in range(30)], capacity=40)
+        b = MinMaxHeap([randint(-100, 100) for _ in range(30)])
+        expected = sorted(a.heap + b.heap)[-40:]
+        self.assertIsNone(a.merge(b))
+        self.assertTrue(is_min_max_heap(a))
+        self.assertEqual(sorted(a.heap), expected)
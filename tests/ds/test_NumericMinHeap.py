@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.NumericMinHeap module.
+"""
+
+import unittest
+from random import randint, random
+
+import numpy as np
+
+from ands.ds.MinHeap import MinHeap
+from ands.ds.NumericMinHeap import NumericMinHeap, is_numeric_min_heap
+from tests.ds.util import allocated_bytes
+
+
+class TestNumericMinHeap(unittest.TestCase):
+    def test_creation_default(self):
+        h = NumericMinHeap()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h.size, 0)
+        self.assertIsNone(h.find_min())
+        self.assertIsNone(h.remove_min())
+
+    def test_creation_from_arrays(self):
+        for n in (1, 2, 3, 7, 8, 100, randint(0, 1000)):
+            priorities = np.random.rand(n)
+            h = NumericMinHeap(priorities)
+            self.assertEqual(h.size, n)
+            self.assertTrue(is_numeric_min_heap(h))
+            removed = [h.remove_min() for _ in range(n)]
+            self.assertEqual([p for _, p in removed], sorted(priorities))
+            for payload, priority in removed:
+                self.assertEqual(priorities[payload], priority)
+
+    def test_creation_with_payloads(self):
+        h = NumericMinHeap([3.0, 1.0, 2.0], [30, 10, 20])
+        self.assertEqual(h.find_min(), (10, 1.0))
+        self.assertRaises(ValueError, NumericMinHeap, [1.0, 2.0], [1])
+
+    def test_add_and_remove_min(self):
+        priorities = [random() for _ in range(200)]
+        h = NumericMinHeap()
+        for p in priorities:
+            h.add(p)
+            self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.size, 200)
+        removed = [h.remove_min() for _ in range(200)]
+        self.assertEqual([p for _, p in removed], sorted(priorities))
+        self.assertEqual([priorities[i] for i, _ in removed],
+                         sorted(priorities))
+        self.assertTrue(h.is_empty())
+
+    def test_add_when_nan(self):
+        h = NumericMinHeap()
+        self.assertRaises(ValueError, h.add, float("nan"))
+        self.assertRaises(ValueError, h.add_many, [1.0, float("nan")])
+        self.assertTrue(h.is_empty())
+
+    def test_add_many_few_and_many_elements(self):
+        h = NumericMinHeap(np.random.rand(500))
+        h.add_many(np.random.rand(3), [-1, -2, -3])
+        self.assertTrue(is_numeric_min_heap(h))
+        h.add_many(np.random.rand(2000))
+        self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.size, 2503)
+        removed = [h.remove_min()[1] for _ in range(h.size)]
+        self.assertEqual(removed, sorted(removed))
+
+    def test_default_payloads_follow_insertion_order(self):
+        h = NumericMinHeap([5.0, 4.0])
+        h.add(3.0)
+        h.add_many([2.0, 1.0])
+        self.assertEqual([h.remove_min()[0] for _ in range(5)],
+                         [4, 3, 2, 1, 0])
+
+    def test_clear(self):
+        h = NumericMinHeap(np.random.rand(100))
+        self.assertIsNone(h.clear())
+        self.assertTrue(h.is_empty())
+        h.add(1.5, 7)
+        self.assertEqual(h.find_min(), (7, 1.5))
+
+    def test_memory_per_element(self):
+        n = 100000
+        priorities = np.random.rand(n)
+        h, numeric_bytes = allocated_bytes(lambda: NumericMinHeap(priorities))
+        self.assertEqual(h.size, n)
+        self.assertLessEqual(numeric_bytes / n, 17)
+        # The equivalent MinHeap of tuples (priority, payload).
+        _, list_bytes = allocated_bytes(
+            lambda: MinHeap(list(zip(priorities.tolist(), range(n)))))
+        self.assertLess(numeric_bytes * 3, list_bytes)
+
+    def test_is_numeric_min_heap(self):
+        self.assertFalse(is_numeric_min_heap(MinHeap()))
+        h = NumericMinHeap([1.0, 2.0, 3.0])
+        h._priorities[0] = 4.0
+        self.assertFalse(is_numeric_min_heap(h))
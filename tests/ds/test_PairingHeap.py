@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.PairingHeap module.
+"""
+
+import unittest
+from random import randint, choice
+
+from ands.ds.PairingHeap import PairingHeap, is_pairing_heap
+
+
+class TestPairingHeap(unittest.TestCase):
+    def setUp(self):
+        self.h = PairingHeap()
+
+    def test_creation_default(self):
+        self.assertTrue(self.h.is_empty())
+        self.assertEqual(self.h.size, 0)
+        self.assertIsNone(self.h.find_min())
+        self.assertIsNone(self.h.remove_min())
+        self.assertTrue(is_pairing_heap(self.h))
+
+    def test_creation_given_list(self):
+        a = [12, 14, 28, 6, 7, 10, 18]
+        h = PairingHeap(a)
+        self.assertEqual(h.size, len(a))
+        self.assertEqual(h.find_min(), 6)
+        self.assertTrue(is_pairing_heap(h))
+
+    def test_clear(self):
+        h = PairingHeap([randint(-100, 100) for _ in range(100)])
+        h.clear()
+        self.assertTrue(h.is_empty())
+        self.assertIsNone(h.find_min())
+
+    def test_add_when_argument_is_None(self):
+        self.assertRaises(ValueError, self.h.add, None)
+
+    def test_add_and_remove_min(self):
+        a = [randint(-1000, 1000) for _ in range(1000)]
+        for i, x in enumerate(a):
+            self.h.add(x)
+            self.assertEqual(self.h.size, i + 1)
+            self.assertEqual(self.h.find_min(), min(a[:i + 1]))
+        self.assertEqual([self.h.remove_min() for _ in a], sorted(a))
+        self.assertTrue(self.h.is_empty())
+
+    def test_contains(self):
+        self.h = PairingHeap([6, 8, 2, 2, 60, 7, 9])
+        self.assertTrue(self.h.contains(2))
+        self.assertTrue(self.h.contains(60))
+        self.assertFalse(self.h.contains(5))
+        self.assertRaises(ValueError, self.h.contains, None)
+
+    def test_delete(self):
+        a = [randint(-100, 100) for _ in range(300)]
+        self.h = PairingHeap(a)
+        # Give the heap some structure.
+        self.h.add(self.h.remove_min())
+        while a:
+            x = choice(a)
+            a.remove(x)
+            self.h.delete(x)
+            self.assertEqual(self.h.size, len(a))
+            self.assertEqual(self.h.find_min(), min(a) if a else None)
+        self.assertTrue(is_pairing_heap(self.h))
+        self.assertRaises(LookupError, self.h.delete, 3)
+        self.assertRaises(ValueError, self.h.delete, None)
+
+    def test_merge(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        b = [randint(-100, 100) for _ in range(50)]
+        h1, h2 = PairingHeap(a), PairingHeap(b)
+        h1.merge(h2)
+        self.assertTrue(h2.is_empty())
+        self.assertEqual(h1.size, 150)
+        self.assertEqual([h1.remove_min() for _ in range(150)], sorted(a + b))
+
+    def test_merge_with_empty_heap_and_itself(self):
+        h = PairingHeap([3, 1, 2])
+        h.merge(PairingHeap())
+        h.merge(h)
+        self.assertEqual(h.size, 3)
+        PairingHeap().merge(h)
+        self.assertRaises(TypeError, h.merge, [1, 2])
+
+    def test_merge_keeps_handles_valid(self):
+        h1 = PairingHeap([5, 6])
+        h2 = PairingHeap()
+        handle = h2.add(10)
+        h2.add(7)
+        h1.merge(h2)
+        h1.decrease_key(handle, 1)
+        self.assertEqual(h1.find_min(), 1)
+
+    def test_decrease_key(self):
+        handles = [self.h.add(x) for x in range(100, 200)]
+        model = list(range(100, 200))
+        for _ in range(300):
+            i = randint(0, 99)
+            model[i] -= randint(0, 50)
+            self.h.decrease_key(handles[i], model[i])
+            self.assertEqual(self.h.find_min(), min(model))
+        self.assertTrue(is_pairing_heap(self.h))
+        self.assertEqual([self.h.remove_min() for _ in model], sorted(model))
+
+    def test_decrease_key_when_invalid_arguments(self):
+        handle = self.h.add(5)
+        self.assertRaises(ValueError, self.h.decrease_key, handle, 6)
+        self.assertRaises(ValueError, self.h.decrease_key, handle, None)
+        self.assertRaises(TypeError, self.h.decrease_key, 5, 4)
+        other = self.h.add(7)
+        self.h.delete(7)
+        self.assertRaises(LookupError, self.h.decrease_key, other, 1)
+        self.h.decrease_key(handle, 5)
+        self.assertEqual(self.h.remove_min(), 5)
+
+    def test_decrease_key_when_handle_is_of_another_heap(self):
+        a = PairingHeap([1, 2, 3])
+        b = PairingHeap()
+        handle = b.add(10)
+        b.add(20)
+        self.assertRaises(ValueError, a.decrease_key, handle, 0)
+        self.assertEqual(a.size, 3)
+        self.assertEqual(b.size, 2)
+        self.assertTrue(is_pairing_heap(a) and is_pairing_heap(b))
+        # After merging, the handle refers to the heap it was merged into.
+        c = PairingHeap([5])
+        c.merge(b)
+        self.assertRaises(ValueError, b.decrease_key, handle, 0)
+        a.merge(c)
+        self.assertRaises(ValueError, c.decrease_key, handle, 0)
+        a.decrease_key(handle, 0)
+        self.assertEqual(a.remove_min(), 0)
+        # Handles added to b after the merge refer to b.
+        other = b.add(30)
+        self.assertRaises(ValueError, a.decrease_key, other, 0)
+        b.decrease_key(other, 4)
+        self.assertEqual(b.find_min(), 4)
+
+    def test_decrease_key_after_clear(self):
+        handle = self.h.add(5)
+        self.h.clear()
+        self.assertRaises(LookupError, self.h.decrease_key, handle, 1)
+        o = PairingHeap()
+        merged = o.add(7)
+        self.h.merge(o)
+        self.h.clear()
+        self.assertRaises(LookupError, self.h.decrease_key, merged, 1)
+
+    def test_random_operations(self):
+        model = []
+        for _ in range(3000):
+            r = randint(0, 9)
+            if r < 5:
+                x = randint(0, 1000)
+                self.h.add(x)
+                model.append(x)
+            elif r < 8:
+                self.assertEqual(self.h.remove_min(),
+                                 min(model) if model else None)
+                if model:
+                    model.remove(min(model))
+            elif model:
+                x = choice(model)
+                model.remove(x)
+                self.h.delete(x)
+        self.assertEqual(self.h.size, len(model))
+        self.assertTrue(is_pairing_heap(self.h))
+
+    def test_is_pairing_heap(self):
+        self.assertFalse(is_pairing_heap([]))
+        h = PairingHeap([1, 2, 3])
+        h._root.child.key = 0
+        self.assertFalse(is_pairing_heap(h))
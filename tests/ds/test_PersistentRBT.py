@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.PersistentRBT module.
+"""
+
+import math
+import unittest
+from random import randint, sample, shuffle
+
+from ands.ds.PersistentRBT import PersistentRBT, is_persistent_rbt
+from ands.validation import OFF, get_validation_level, set_validation_level
+
+
+def _nodes(t: PersistentRBT) -> set:
+    """Returns the set of the ids of all nodes of t."""
+    return {id(u) for u in t._iter_nodes(None, None)}
+
+
+class TestPersistentRBT(unittest.TestCase):
+    def setUp(self):
+        self.t = PersistentRBT()
+
+    def test_empty(self):
+        self.assertTrue(self.t.is_empty())
+        self.assertEqual(self.t.size, 0)
+        self.assertEqual(self.t.height(), 0)
+        self.assertIsNone(self.t.minimum())
+        self.assertIsNone(self.t.maximum())
+        self.assertEqual(list(self.t), [])
+        self.assertTrue(is_persistent_rbt(self.t))
+
+    def test_insert_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.insert, None)
+
+    def test_insert_returns_new_version(self):
+        u = self.t.insert(3, "three")
+        self.assertTrue(self.t.is_empty())
+        self.assertEqual(u.size, 1)
+        self.assertEqual(u[3], "three")
+
+    def test_insert_existing_key_replaces_value(self):
+        u = self.t.insert(3, "three")
+        v = u.insert(3, "THREE")
+        self.assertEqual(v.size, 1)
+        self.assertEqual(u[3], "three")
+        self.assertEqual(v[3], "THREE")
+
+    def test_insert_many(self):
+        ls = sample(range(10000), 2000)
+        for e in ls:
+            self.t = self.t.insert(e, -e)
+        self.assertTrue(is_persistent_rbt(self.t))
+        self.assertEqual(list(self.t), sorted(ls))
+        self.assertLessEqual(self.t.height(),
+                             2 * math.log2(self.t.size + 1))
+
+    def test_delete_when_key_is_None(self):
+        self.assertRaises(ValueError, self.t.delete, None)
+
+    def test_delete_when_key_not_present(self):
+        self.assertRaises(LookupError, self.t.delete, 3)
+        self.assertRaises(LookupError, self.t.insert(2).delete, 3)
+
+    def test_delete_all_in_random_order(self):
+        ls = sample(range(10000), 1000)
+        for e in ls:
+            self.t = self.t.insert(e)
+        shuffle(ls)
+        for i, e in enumerate(ls):
+            self.t = self.t.delete(e)
+            self.assertFalse(self.t.contains(e))
+            self.assertEqual(self.t.size, len(ls) - i - 1)
+        self.assertTrue(self.t.is_empty())
+
+    def test_old_versions_are_not_modified(self):
+        versions = [self.t]
+        model = [{}]
+        for _ in range(500):
+            e = randint(0, 100)
+            d = dict(model[-1])
+            if e in d and randint(0, 1):
+                versions.append(versions[-1].delete(e))
+                del d[e]
+            else:
+                versions.append(versions[-1].insert(e, len(versions)))
+                d[e] = len(versions) - 1
+            model.append(d)
+        for t, d in zip(versions, model):
+            self.assertTrue(is_persistent_rbt(t))
+            self.assertEqual(list(t.items()), sorted(d.items()))
+
+    def test_iteration_over_snapshot_while_inserting(self):
+        for e in range(0, 200, 2):
+            self.t = self.t.insert(e)
+        snapshot = self.t
+        seen = []
+        for e in snapshot:
+            seen.append(e)
+            self.t = self.t.insert(e + 1)
+        self.assertEqual(seen, list(range(0, 200, 2)))
+        self.assertEqual(self.t.size, 200)
+
+    def test_insert_and_delete_share_untouched_nodes(self):
+        # New versions inherit the validation level of the old ones.
+        set_validation_level(OFF, self.t)
+        for e in range(4096):
+            self.t = self.t.insert(e)
+        old = _nodes(self.t)
+        bound = 4 * self.t.height()
+        u = self.t.insert(1000.5)
+        self.assertLessEqual(len(_nodes(u) - old), bound)
+        v = self.t.delete(2000)
+        self.assertLessEqual(len(_nodes(v) - old), bound)
+        self.assertEqual(get_validation_level(v), OFF)
+
+    def test_contains_and_get(self):
+        for e in [5, 2, 10]:
+            self.t = self.t.insert(e, str(e))
+        self.assertIn(5, self.t)
+        self.assertNotIn(3, self.t)
+        self.assertEqual(self.t.get(2), "2")
+        self.assertEqual(self.t.get(3, "x"), "x")
+        self.assertRaises(KeyError, self.t.__getitem__, 3)
+        self.assertRaises(ValueError, self.t.contains, None)
+
+    def test_minimum_and_maximum(self):
+        for e in [5, 2, 10, 8, 1]:
+            self.t = self.t.insert(e)
+        self.assertEqual(self.t.minimum(), 1)
+        self.assertEqual(self.t.maximum(), 10)
+
+    def test_floor_and_ceiling(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t = self.t.insert(e)
+        self.assertEqual(self.t.floor(42), 10)
+        self.assertEqual(self.t.floor(43), 43)
+        self.assertIsNone(self.t.floor(0))
+        self.assertEqual(self.t.ceiling(44), 69)
+        self.assertEqual(self.t.ceiling(1), 1)
+        self.assertIsNone(self.t.ceiling(86))
+
+    def test_rank_and_select(self):
+        ls = sample(range(1000), 300)
+        for e in ls:
+            self.t = self.t.insert(e)
+        ls.sort()
+        for i, e in enumerate(ls):
+            self.assertEqual(self.t.rank(e), i)
+            self.assertEqual(self.t.select(i), e)
+        self.assertRaises(LookupError, self.t.rank, 1000)
+        self.assertRaises(ValueError, self.t.select, 300)
+        self.assertRaises(TypeError, self.t.select, 1.0)
+
+    def test_items(self):
+        for e in [10, 4, 85, 43, 6, 1, 69]:
+            self.t = self.t.insert(e, str(e))
+        self.assertEqual(list(self.t.items(5, 43)),
+                         [(6, "6"), (10, "10"), (43, "43")])
+        self.assertEqual(list(self.t.items(lo=50)), [(69, "69"), (85, "85")])
+
+    def test_is_persistent_rbt(self):
+        self.assertFalse(is_persistent_rbt([]))
+        for e in range(10):
+            self.t = self.t.insert(e)
+        self.t._root.red = True
+        self.assertFalse(is_persistent_rbt(self.t))
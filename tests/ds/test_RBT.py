@@ -8,15 +8,22 @@ Author: Nelson Brochado
 
 Created: 15/02/2016
 
-Updated: 14/03/2017
+Updated: 16/10/2026
 
 # Description
 
 Unit tests for the classes and functions in the ands.ds.RBT module.
 """
 
-from ands.ds.RBT import RED, BLACK, RBT, _RBTNode
+import io
+import unittest
+from random import randint, sample, shuffle
+
+from ands.ds.BST import BST
+from ands.ds.RBT import RED, BLACK, RBT, _RBTNode, is_rbt
+from ands.validation import OFF, set_validation_level
 from tests.ds.test_BST import TestBST, TestBSTNode
+from tests.ds.util import allocated_bytes
 
 
 # Only testing new functionality with respect to _BSTNode
@@ -35,3 +42,179 @@ class TestRBTNode(TestBSTNode):
 class TestRBT(TestBST):
     def setUp(self):
         self.t = RBT()
+
+    def test_map_operations_keep_rbt_property(self):
+        for e in range(200):
+            self.t[e] = str(e)
+        for e in range(0, 200, 3):
+            del self.t[e]
+        self.assertTrue(is_rbt(self.t))
+        while not self.t.is_empty():
+            self.t.pop_min()
+            self.t.pop_max()
+            self.assertTrue(is_rbt(self.t))
+
+    def test_load_keeps_colors(self):
+        for e in sample(range(1000), 500):
+            self.t.insert(e)
+        t = RBT.load(io.BytesIO(self.dump(self.t)))
+        self.assertTrue(is_rbt(t))
+        self.assertEqual(
+            [u.color for u in t._iter_nodes(None, None, False)],
+            [u.color for u in self.t._iter_nodes(None, None, False)])
+
+    def test_load_when_dump_is_of_a_bst(self):
+        t = BST()
+        t.insert(3)
+        self.assertRaises(ValueError, RBT.load, io.BytesIO(self.dump(t)))
+
+
+class TestRBTBulkLoading(unittest.TestCase):
+    def test_from_sorted_when_empty(self):
+        t = RBT.from_sorted([])
+        self.assertTrue(t.is_empty())
+        self.assertTrue(is_rbt(t))
+
+    def test_from_sorted_when_key_is_None(self):
+        self.assertRaises(ValueError, RBT.from_sorted, [1, None, 3])
+
+    def test_from_sorted_all_sizes(self):
+        for n in range(70):
+            t = RBT.from_sorted(range(n))
+            self.assertTrue(is_rbt(t))
+            self.assertEqual(t.size, n)
+            self.assertEqual([t.select(k) for k in range(n)], list(range(n)))
+
+    def test_from_sorted_with_duplicates(self):
+        ls = sorted(randint(-10, 10) for _ in range(100))
+        t = RBT.from_sorted(ls)
+        self.assertTrue(is_rbt(t))
+        self.assertEqual([t.select(k) for k in range(len(ls))], ls)
+
+    def test_from_sorted_then_insert_and_delete(self):
+        t = RBT.from_sorted(range(0, 200, 2))
+        for e in range(1, 200, 2):
+            t.insert(e)
+        for e in range(0, 200, 3):
+            t.delete(e)
+        self.assertTrue(is_rbt(t))
+        self.assertEqual(t.size, 200 - len(range(0, 200, 3)))
+
+    def test_from_iterable(self):
+        ls = list(range(500))
+        shuffle(ls)
+        t = RBT.from_iterable(ls)
+        self.assertTrue(is_rbt(t))
+        self.assertEqual(t.size, 500)
+        self.assertEqual(t.minimum(), 0)
+        self.assertEqual(t.maximum(), 499)
+
+    def test_from_iterable_when_key_is_None(self):
+        self.assertRaises(ValueError, RBT.from_iterable, [3, None, 1])
+
+
+class TestRBTMemoryFootprint(unittest.TestCase):
+    def test_bytes_per_node(self):
+        n = 2000
+        keys = [randint(10 ** 6, 10 ** 9) for _ in range(n)]
+
+        def build():
+            t = RBT()
+            set_validation_level(OFF, t)
+            for key in keys:
+                t.insert(key)
+            return t
+
+        t, size = allocated_bytes(build)
+        self.assertEqual(t.size, n)
+        self.assertLessEqual(size / n, 96)
+
+
+class TestRBTSetOperations(unittest.TestCase):
+    @staticmethod
+    def tree(keys, value=None):
+        # The trees are only validated after they have been built.
+        t = RBT()
+        set_validation_level(OFF, t)
+        for key in keys:
+            t[key] = key if value is None else value
+        set_validation_level(None, t)
+        return t
+
+    def test_split_when_key_is_None(self):
+        self.assertRaises(ValueError, RBT().split, None)
+
+    def test_split_when_empty(self):
+        left, item, right = RBT().split(3)
+        self.assertTrue(left.is_empty() and right.is_empty())
+        self.assertIsNone(item)
+
+    def test_split(self):
+        ls = sample(range(1000), 300)
+        for key in [-1, 0, 500, 999, 1000] + ls[:20]:
+            t = self.tree(ls)
+            left, item, right = t.split(key)
+            self.assertTrue(t.is_empty())
+            self.assertTrue(is_rbt(left) and is_rbt(right))
+            self.assertEqual(list(left), sorted(e for e in ls if e < key))
+            self.assertEqual(list(right), sorted(e for e in ls if e > key))
+            self.assertEqual(item, (key, key) if key in ls else None)
+
+    def test_join_when_invalid_arguments(self):
+        self.assertRaises(TypeError, RBT.join, [], 3, RBT())
+        self.assertRaises(ValueError, RBT.join, RBT(), None, RBT())
+        self.assertRaises(ValueError, RBT.join, self.tree([1, 5]), 3,
+                          self.tree([7]))
+        self.assertRaises(ValueError, RBT.join, self.tree([1]), 3,
+                          self.tree([2, 7]))
+        t = self.tree([1])
+        self.assertRaises(ValueError, RBT.join, t, 1, t)
+
+    def test_join_trees_of_different_heights(self):
+        for m in [0, 1, 2, 10, 100, 1000]:
+            left = self.tree(range(m))
+            right = self.tree(range(m + 1, m + 1 + 1000 // (m + 1)))
+            n = left.size + right.size + 1
+            t = RBT.join(left, m, right, "middle")
+            self.assertTrue(is_rbt(t))
+            self.assertEqual(list(t), list(range(n)))
+            self.assertEqual(t[m], "middle")
+            self.assertTrue(left.is_empty() and right.is_empty())
+
+    def test_split_then_join(self):
+        ls = sample(range(1000), 500)
+        t = self.tree(ls)
+        left, item, right = t.split(ls[0])
+        t = RBT.join(left, item[0], right, item[1])
+        self.assertTrue(is_rbt(t))
+        self.assertEqual(list(t.items()), sorted((e, e) for e in ls))
+
+    def test_set_operations_when_other_is_not_rbt(self):
+        for op in (RBT.union, RBT.intersection, RBT.difference):
+            self.assertRaises(TypeError, op, RBT(), [1, 2])
+
+    def test_set_operations_with_itself(self):
+        t = self.tree(range(10))
+        t.union(t)
+        t.intersection(t)
+        self.assertEqual(list(t), list(range(10)))
+        t.difference(t)
+        self.assertTrue(t.is_empty())
+
+    def test_set_operations(self):
+        for _ in range(50):
+            a = sample(range(500), randint(0, 200))
+            b = sample(range(500), randint(0, 50))
+            expected = {"union": set(a) | set(b),
+                        "intersection": set(a) & set(b),
+                        "difference": set(a) - set(b)}
+            for op, keys in expected.items():
+                t, other = self.tree(a, "a"), self.tree(b, "b")
+                getattr(t, op)(other)
+                self.assertTrue(is_rbt(t))
+                self.assertTrue(other.is_empty())
+                self.assertEqual(t.size, len(keys))
+                # Values of the first tree take precedence.
+                self.assertEqual(list(t.items()),
+                                 [(k, "a" if k in a else "b")
+                                  for k in sorted(keys)])
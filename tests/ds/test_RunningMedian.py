@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.RunningMedian module.
+"""
+
+import statistics
+import unittest
+from random import randint
+
+from ands.ds.MinHeap import MinHeap
+from ands.ds.RunningMedian import (RunningMedian, SlidingWindowMedian,
+                                   is_running_median)
+
+
+class TestRunningMedian(unittest.TestCase):
+    def test_creation(self):
+        m = RunningMedian()
+        self.assertTrue(m.is_empty())
+        self.assertEqual(m.size, 0)
+        self.assertIsNone(m.median())
+        self.assertIsNone(m.median_low())
+        self.assertIsNone(m.median_high())
+
+    def test_add_when_none(self):
+        self.assertRaises(ValueError, RunningMedian().add, None)
+
+    def test_add(self):
+        m = RunningMedian()
+        ls = []
+        for _ in range(300):
+            x = randint(-20, 20)
+            m.add(x)
+            ls.append(x)
+            self.assertTrue(is_running_median(m))
+            self.assertEqual(m.size, len(ls))
+            self.assertEqual(m.median(), statistics.median(ls))
+            self.assertEqual(m.median_low(), statistics.median_low(ls))
+            self.assertEqual(m.median_high(), statistics.median_high(ls))
+
+    def test_strings(self):
+        m = RunningMedian()
+        for s in ["d", "a", "c", "b"]:
+            m.add(s)
+        self.assertEqual(m.median_low(), "b")
+        self.assertEqual(m.median_high(), "c")
+
+    def test_is_running_median(self):
+        self.assertFalse(is_running_median(MinHeap()))
+        m = RunningMedian()
+        m.add(1)
+        m.add(2)
+        self.assertTrue(is_running_median(m))
+        m._hi.add(0)
+        self.assertFalse(is_running_median(m))
+        m._hi.remove_min()
+        m._lo_size = 0
+        self.assertFalse(is_running_median(m))
+
+
+class TestSlidingWindowMedian(unittest.TestCase):
+    def test_creation_when_window_size_is_not_valid(self):
+        self.assertRaises(TypeError, SlidingWindowMedian, 2.0)
+        self.assertRaises(ValueError, SlidingWindowMedian, 0)
+
+    def test_add_expires_oldest(self):
+        m = SlidingWindowMedian(3)
+        self.assertIsNone(m.add(5))
+        self.assertIsNone(m.add(1))
+        self.assertIsNone(m.add(3))
+        self.assertEqual(m.median(), 3)
+        self.assertEqual(m.add(10), 5)
+        self.assertEqual(m.size, 3)
+        self.assertEqual(m.median(), 3)
+
+    def test_window_of_size_one(self):
+        m = SlidingWindowMedian(1)
+        for x in [randint(-5, 5) for _ in range(50)]:
+            m.add(x)
+            self.assertEqual(m.median(), x)
+
+    def test_random_streams(self):
+        for w in (1, 2, 3, 10, 51):
+            m = SlidingWindowMedian(w)
+            ls = []
+            for _ in range(400):
+                x = randint(-10, 10)
+                expired = m.add(x)
+                ls.append(x)
+                if len(ls) > w:
+                    self.assertEqual(expired, ls.pop(0))
+                self.assertTrue(is_running_median(m))
+                self.assertEqual(m.size, len(ls))
+                self.assertEqual(m.median(), statistics.median(ls))
+                self.assertEqual(m.median_low(), statistics.median_low(ls))
+                self.assertEqual(m.median_high(), statistics.median_high(ls))
+                self.assertLessEqual(m._lo.size + m._hi.size, 2 * w + 1)
+
+    def test_remove_oldest(self):
+        m = SlidingWindowMedian(100)
+        ls = [randint(-10, 10) for _ in range(60)]
+        for x in ls:
+            m.add(x)
+        while ls:
+            self.assertEqual(m.remove_oldest(), ls.pop(0))
+            self.assertTrue(is_running_median(m))
+            self.assertEqual(m.size, len(ls))
+            if ls:
+                self.assertEqual(m.median(), statistics.median(ls))
+        self.assertTrue(m.is_empty())
+        self.assertIsNone(m.remove_oldest())
+        m.add(4)
+        self.assertEqual(m.median(), 4)
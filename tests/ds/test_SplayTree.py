@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.SplayTree module.
+"""
+
+from random import sample, shuffle
+
+from ands.ds.BST import BST
+from ands.ds.SplayTree import SplayTree, is_splay_tree
+from ands.validation import FULL, OFF, set_validation_level
+from tests.ds.test_BST import TestBST
+
+
+def max_depth(t: SplayTree) -> int:
+    """Returns the maximum depth of a node of t, computed iteratively."""
+    d = -1
+    stack = [(t._root, 0)] if t._root is not None else []
+    while stack:
+        u, du = stack.pop()
+        d = max(d, du)
+        stack.extend((c, du + 1) for c in (u.left, u.right) if c is not None)
+    return d
+
+
+class TestSplayTree(TestBST):
+    def setUp(self):
+        self.t = SplayTree()
+
+    def test_insert_splays_new_node(self):
+        for e in sample(range(1000), 200):
+            self.t.insert(e)
+            self.assertEqual(self.t._root.key, e)
+        self.assertTrue(is_splay_tree(self.t))
+
+    def test_access_splays_node(self):
+        ls = sample(range(1000), 200)
+        for e in ls:
+            self.t[e] = -e
+        for e in sample(ls, 100):
+            self.assertTrue(self.t.contains(e))
+            self.assertEqual(self.t._root.key, e)
+            self.assertEqual(self.t.get(e), -e)
+            self.assertEqual(self.t[e], -e)
+            self.t[e] = e
+            self.assertEqual(self.t._root.key, e)
+            self.assertEqual(self.t._root.value, e)
+
+    def test_unsuccessful_search_splays_last_node(self):
+        for e in [10, 20, 30, 40]:
+            self.t.insert(e)
+        self.assertFalse(self.t.contains(25))
+        self.assertIn(self.t._root.key, (20, 30))
+        self.assertTrue(is_splay_tree(self.t))
+
+    def test_delete_keeps_order_and_sizes(self):
+        ls = sample(range(1000), 300)
+        for e in ls:
+            self.t.insert(e)
+        shuffle(ls)
+        for i, e in enumerate(ls):
+            self.t.delete(e)
+            self.assertEqual(self.t.size, len(ls) - i - 1)
+            self.assertTrue(is_splay_tree(self.t))
+        self.assertTrue(self.t.is_empty())
+
+    def test_access_to_deepest_node_halves_path(self):
+        t = SplayTree()
+        set_validation_level(OFF, t)
+        for e in range(5000):
+            t.insert(e)
+        # Inserting keys in increasing order produces a path.
+        self.assertEqual(max_depth(t), 4999)
+        t.contains(0)
+        self.assertEqual(t._root.key, 0)
+        self.assertLessEqual(max_depth(t), 2501)
+        self.assertEqual(list(t), list(range(5000)))
+
+    def test_sequential_access_when_fully_validated(self):
+        # Sequential accesses turn the tree into a path, deeper than the
+        # recursion limit, which the validators must handle.
+        t = SplayTree()
+        set_validation_level(FULL, t)
+        n = 2500
+        for e in range(n):
+            t.insert(e)
+        self.assertEqual(max_depth(t), n - 1)
+        for e in range(n):
+            self.assertTrue(t.contains(e))
+        t.insert(n)
+        self.assertTrue(is_splay_tree(t))
+        self.assertEqual(list(t), list(range(n + 1)))
+
+    def test_minimum_maximum_and_height_of_deep_tree(self):
+        t = SplayTree()
+        set_validation_level(OFF, t)
+        n = 3000
+        for e in range(n):
+            t.insert(e)
+        self.assertEqual(t.height(), n)
+        self.assertEqual(t.minimum(), 0)
+        self.assertEqual(t.maximum(), n - 1)
+        set_validation_level(FULL, t)
+        self.assertEqual(t.height(), n)
+        self.assertEqual(t.minimum(), 0)
+        self.assertEqual(t.maximum(), n - 1)
+
+    def test_is_splay_tree(self):
+        self.assertFalse(is_splay_tree(BST()))
+        self.assertTrue(is_splay_tree(self.t))
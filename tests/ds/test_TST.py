@@ -9,7 +9,7 @@ Author: Nelson Brochado
 
 Created: 29/01/2017
 
-Updated: 12/03/2017
+Updated: 16/10/2026
 
 # Description
 
@@ -21,6 +21,8 @@ import string
 import unittest
 
 from ands.ds.TST import TST, _TSTNode
+from ands.validation import OFF, set_validation_level
+from tests.ds.util import allocated_bytes
 
 
 class TestTST(unittest.TestCase):
@@ -405,6 +407,27 @@ class TestTST(unittest.TestCase):
         self.assertEqual(sorted(t.keys_that_match(".....")), ["three"])
 
 
+class TestTSTMemoryFootprint(unittest.TestCase):
+    def test_bytes_per_node(self):
+        keys = [str(random.randint(10 ** 6, 10 ** 9)) for _ in range(1000)]
+
+        def build():
+            t = TST()
+            set_validation_level(OFF, t)
+            for key in keys:
+                t.insert(key, 1)
+            return t
+
+        def count_nodes(u):
+            if u is None:
+                return 0
+            return (1 + count_nodes(u.left) + count_nodes(u.mid) +
+                    count_nodes(u.right))
+
+        t, size = allocated_bytes(build)
+        self.assertLessEqual(size / count_nodes(t._root), 96)
+
+
 class TestTSTNode(unittest.TestCase):
     def test_create_key_not_string(self):
         self.assertRaises(TypeError, _TSTNode, 13)
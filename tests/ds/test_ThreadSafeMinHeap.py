@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the ands.ds.ThreadSafeMinHeap
+module.
+"""
+
+import queue
+import threading
+import unittest
+from random import randint
+
+from ands.ds.ThreadSafeMinHeap import ThreadSafeMinHeap
+
+
+class TestThreadSafeMinHeap(unittest.TestCase):
+    def test_creation_default(self):
+        h = ThreadSafeMinHeap()
+        self.assertTrue(h.empty())
+        self.assertEqual(h.qsize(), 0)
+        self.assertEqual(h.maxsize, 0)
+
+    def test_get_returns_smallest(self):
+        ls = [randint(-100, 100) for _ in range(100)]
+        h = ThreadSafeMinHeap()
+        for x in ls:
+            h.put(x)
+        self.assertEqual(h.qsize(), 100)
+        self.assertEqual([h.get() for _ in range(100)], sorted(ls))
+        self.assertTrue(h.empty())
+
+    def test_put_when_none(self):
+        h = ThreadSafeMinHeap()
+        self.assertRaises(ValueError, h.put, None)
+        self.assertTrue(h.empty())
+
+    def test_key_ties_are_returned_in_insertion_order(self):
+        h = ThreadSafeMinHeap(key=lambda t: t[0])
+        for i in range(50):
+            h.put_nowait((i % 3, i))
+        expected = sorted(((i % 3, i) for i in range(50)), key=lambda t: t[0])
+        self.assertEqual([h.get_nowait() for _ in range(50)], expected)
+
+    def test_get_when_empty(self):
+        h = ThreadSafeMinHeap()
+        self.assertRaises(queue.Empty, h.get_nowait)
+        self.assertRaises(queue.Empty, h.get, True, 0.01)
+
+    def test_put_when_full(self):
+        h = ThreadSafeMinHeap(maxsize=2)
+        h.put(2)
+        h.put(1)
+        self.assertTrue(h.full())
+        self.assertRaises(queue.Full, h.put_nowait, 0)
+        self.assertRaises(queue.Full, h.put, 0, True, 0.01)
+        self.assertEqual(h.get(), 1)
+        h.put(0)
+        self.assertEqual(h.get(), 0)
+
+    def test_blocking_get_is_woken_up_by_put(self):
+        h = ThreadSafeMinHeap()
+        got = []
+        consumer = threading.Thread(target=lambda: got.append(h.get(True, 5)))
+        consumer.start()
+        h.put(3)
+        consumer.join()
+        self.assertEqual(got, [3])
+
+    def test_producers_and_consumers(self):
+        h = ThreadSafeMinHeap(maxsize=10)
+        producers = 4
+        per_producer = 500
+        got = []
+        lock = threading.Lock()
+
+        def produce(p):
+            for i in range(per_producer):
+                h.put(p * per_producer + i)
+
+        def consume():
+            while True:
+                x = h.get()
+                if x == -1:
+                    h.task_done()
+                    return
+                with lock:
+                    got.append(x)
+                h.task_done()
+
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        threads = [threading.Thread(target=produce, args=(p,))
+                   for p in range(producers)]
+        for t in consumers + threads:
+            t.start()
+        for t in threads:
+            t.join()
+        h.join()
+        for _ in consumers:
+            h.put(-1)
+        for t in consumers:
+            t.join()
+
+        self.assertEqual(sorted(got), list(range(producers * per_producer)))
+        self.assertTrue(h.empty())
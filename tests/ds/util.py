@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import tracemalloc
+
+
+def allocated_bytes(build):
+    """Calls build and returns a tuple whose first item is the object returned
+    by build and the second is the number of bytes allocated by build and still
+    in use after it returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
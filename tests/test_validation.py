@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 16/10/2026
+
+Updated: 16/10/2026
+
+# Description
+
+Unit tests for the functions in the ands.validation module.
+"""
+
+import unittest
+
+from ands.ds.BST import BST
+from ands.validation import OFF, SAMPLED, FULL, get_validation_level, \
+    set_validation_level, get_sample_rate, set_sample_rate, validate
+
+
+class _Counter:
+    """Predicate which counts how many times it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, ds):
+        self.calls += 1
+        return False
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.level = get_validation_level()
+        self.rate = get_sample_rate()
+
+    def tearDown(self):
+        set_validation_level(self.level)
+        set_sample_rate(self.rate)
+
+    def test_set_validation_level_when_invalid_level(self):
+        self.assertRaises(ValueError, set_validation_level, "sometimes")
+        self.assertRaises(ValueError, set_validation_level, None)
+        self.assertRaises(ValueError, set_validation_level, "always", BST())
+
+    def test_set_sample_rate_when_invalid_rate(self):
+        self.assertRaises(TypeError, set_sample_rate, 2.5)
+        self.assertRaises(ValueError, set_sample_rate, 0)
+
+    def test_validate_when_full(self):
+        set_validation_level(FULL)
+        p = _Counter()
+        for _ in range(10):
+            self.assertFalse(validate(p, []))
+        self.assertEqual(p.calls, 10)
+
+    def test_validate_when_off(self):
+        set_validation_level(OFF)
+        p = _Counter()
+        for _ in range(10):
+            self.assertTrue(validate(p, []))
+        self.assertEqual(p.calls, 0)
+
+    def test_validate_when_sampled(self):
+        set_validation_level(SAMPLED)
+        set_sample_rate(5)
+        p = _Counter()
+        for _ in range(50):
+            validate(p, [])
+        self.assertEqual(p.calls, 10)
+
+    def test_per_structure_level_overrides_package_level(self):
+        set_validation_level(FULL)
+        t = BST()
+        set_validation_level(OFF, t)
+        self.assertEqual(get_validation_level(t), OFF)
+        self.assertEqual(get_validation_level(BST()), FULL)
+
+        p = _Counter()
+        self.assertTrue(validate(p, t))
+        self.assertEqual(p.calls, 0)
+
+        set_validation_level(None, t)
+        self.assertEqual(get_validation_level(t), FULL)
+        self.assertFalse(validate(p, t))
+        self.assertEqual(p.calls, 1)
+
+    @unittest.skipIf(not __debug__, "assertions are disabled")
+    def test_corrupted_structure_detected_only_when_validated(self):
+        t = BST()
+        for e in [5, 2, 10]:
+            t.insert(e)
+        # Break the binary-search tree property.
+        t._root.left.key = 20
+
+        set_validation_level(OFF, t)
+        self.assertTrue(t.contains(10))
+
+        set_validation_level(FULL, t)
+        self.assertRaises(AssertionError, t.contains, 10)